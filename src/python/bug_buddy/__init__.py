@@ -1,13 +1,53 @@
-from bug_buddy.bb import bug_buddy
-from bug_buddy.integration import (
-    GithubIntegration,
-    GitlabIntegration,
-    LinearIntegration,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# public names are resolved on first access, so `import bug_buddy` stays cheap
+_EXPORTS = {
+    "bug_buddy": "bug_buddy.bb",
+    "install": "bug_buddy.hooks",
+    "uninstall": "bug_buddy.hooks",
+    "ReportingThreadPoolExecutor": "bug_buddy.hooks",
+    "ReportingProcessPoolExecutor": "bug_buddy.hooks",
+    "GitlabIntegration": "bug_buddy.integration",
+    "GithubIntegration": "bug_buddy.integration",
+    "LinearIntegration": "bug_buddy.integration",
+}
+
+if TYPE_CHECKING:
+    from bug_buddy.bb import bug_buddy
+    from bug_buddy.hooks import (
+        ReportingProcessPoolExecutor,
+        ReportingThreadPoolExecutor,
+        install,
+        uninstall,
+    )
+    from bug_buddy.integration import (
+        GithubIntegration,
+        GitlabIntegration,
+        LinearIntegration,
+    )
 
 __all__ = [
     "bug_buddy",
+    "install",
+    "uninstall",
+    "ReportingThreadPoolExecutor",
+    "ReportingProcessPoolExecutor",
     "GitlabIntegration",
     "GithubIntegration",
     "LinearIntegration",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,28 @@
 """Bug Buddy Config"""
 
 
-from pydantic.dataclasses import dataclass as pydantic_dataclass
+import os
 
+from attrs import define, field
 
-@pydantic_dataclass
+
+@define
 class BugBuddyConfig:
     """Bug Buddy Config"""
 
     log_level: str = "INFO"
+    cache_backend: str = field(
+        factory=lambda: os.environ.get("BUG_BUDDY_CACHE_BACKEND", "") or "jsonl"
+    )
+    """Local cache backend name, see `bug_buddy.cache.BACKENDS` ($BUG_BUDDY_CACHE_BACKEND)."""
+    cache_fsync: str = "never"
+    """fsync policy for file backed caches: never, interval, or always."""
+    cache_shard: bool = field(
+        factory=lambda: os.environ.get("BUG_BUDDY_CACHE_SHARD", "") not in ("", "0")
+    )
+    """Write the cache to per-process shards merged at exit ($BUG_BUDDY_CACHE_SHARD)."""
+    offline: bool = field(factory=lambda: os.environ.get("BUG_BUDDY_OFFLINE", "") not in ("", "0"))
+    """Spool reports to the outbox without contacting the tracker ($BUG_BUDDY_OFFLINE)."""
+    collector: str = field(factory=lambda: os.environ.get("BUG_BUDDY_COLLECTOR", ""))
+    """Collector socket, empty for `$HOME/.bug_buddy.collector.sock`, 0 to never use a collector
+    ($BUG_BUDDY_COLLECTOR)."""
@@ -1,15 +1,47 @@
 """Dependency injection container for BugBuddy."""
 
+import atexit
 import sys
-from importlib.metadata import version
+import threading
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
 from logging import Formatter, Logger, StreamHandler, getLogger
-from typing import Optional
+from typing import Optional, Union
 
 from attrs import define
 
 from bug_buddy._config import BugBuddyConfig
+from bug_buddy.cache import CacheBackend, JsonlCacheBackend, get_backend
+from bug_buddy.collector import CollectorClient
+from bug_buddy.fingerprint import FingerprintIndex
 from bug_buddy.integration import Integration
 from bug_buddy.listener import Listener
+from bug_buddy.outbox import Outbox
+from bug_buddy.policy import ReportPolicy
+from bug_buddy.reporter import BackgroundReporter
+
+# handler installed on the process-wide bug-buddy logger, so it is only ever added once
+_HANDLER: Optional[StreamHandler] = None
+_HANDLER_LOCK = threading.Lock()
+
+# outbox shared by every default listener, so one replay runs at a time per process
+_OUTBOX: Optional[Outbox] = None
+
+# policy shared by every default listener, so its global limit holds across decorations
+_POLICY: Optional[ReportPolicy] = None
+
+# collector connection shared by every default listener, so a process opens at most one
+_COLLECTOR: Optional[CollectorClient] = None
+
+
+@lru_cache(maxsize=None)
+def _version() -> str:
+    """Installed Bug Buddy version, looked up once."""
+
+    try:
+        return version("bug-buddy")
+    except PackageNotFoundError:
+        return "unknown"
 
 
 @define
@@ -26,23 +58,30 @@ class BugBuddyInjector:
             Logger instance.
         """
 
-        logger = getLogger("bug-buddy")
-        logger.propagate = False  # don't propagate to root logger
-        logger.addHandler(StreamHandler(sys.stdout))
+        global _HANDLER
 
-        # init format
-        lformat = Formatter(
-            fmt="\033[96mbug-buddy\033[0m %(message)s\n",
-            datefmt="%d-%b-%y %H:%M:%S",
-        )
-        # set the format for the logger
-        logger.handlers[0].setFormatter(lformat)
+        logger = getLogger("bug-buddy")
         logger.setLevel(log_level.upper())
-
-        logger.debug(
-            "\033[93m%s\033[0m logger initialized at level %s."
-            % (version("bug-buddy"), log_level.upper())
-        )
+        if _HANDLER is not None:
+            return logger
+
+        with _HANDLER_LOCK:
+            if _HANDLER is None:
+                logger.propagate = False  # don't propagate to root logger
+                _HANDLER = StreamHandler(sys.stdout)
+                # init format
+                _HANDLER.setFormatter(
+                    Formatter(
+                        fmt="\033[96mbug-buddy\033[0m %(message)s\n",
+                        datefmt="%d-%b-%y %H:%M:%S",
+                    )
+                )
+                logger.addHandler(_HANDLER)
+
+                logger.debug(
+                    "\033[93m%s\033[0m logger initialized at level %s."
+                    % (_version(), log_level.upper())
+                )
 
         return logger
 
@@ -55,26 +94,133 @@ class BugBuddyInjector:
 
         return BugBuddyConfig()
 
+    def cache(self, config: BugBuddyConfig) -> CacheBackend:
+        """Cache backend injection.
+
+        Args:
+            config: config instance.
+
+        Returns:
+            Cache backend instance.
+        """
+
+        if config.cache_backend == "jsonl":
+            return JsonlCacheBackend(fsync=config.cache_fsync, shard=config.cache_shard)
+        return get_backend(config.cache_backend)
+
+    def outbox(self, logger: Logger) -> Outbox:
+        """Default outbox injection, one per process.
+
+        Args:
+            logger: logger instance.
+
+        Returns:
+            Outbox instance.
+        """
+
+        global _OUTBOX
+
+        if _OUTBOX is None:
+            _OUTBOX = Outbox(logger=logger)
+        return _OUTBOX
+
+    def policy(self, logger: Logger) -> ReportPolicy:
+        """Default report policy injection, one per process.
+
+        Args:
+            logger: logger instance.
+
+        Returns:
+            ReportPolicy instance.
+        """
+
+        global _POLICY
+
+        if _POLICY is None:
+            _POLICY = ReportPolicy(logger=logger)
+            # summarize what was suppressed since the last periodic summary
+            atexit.register(_POLICY.flush)
+        return _POLICY
+
+    def collector(self, config: BugBuddyConfig, logger: Logger) -> Optional[CollectorClient]:
+        """Default collector connection injection, one per process.
+
+        Args:
+            config: config instance.
+            logger: logger instance.
+
+        Returns:
+            CollectorClient instance, None if collectors are disabled.
+        """
+
+        global _COLLECTOR
+
+        if config.collector == "0":
+            return None
+        if _COLLECTOR is None:
+            if config.collector:
+                _COLLECTOR = CollectorClient(path=config.collector, logger=logger)
+            else:
+                _COLLECTOR = CollectorClient(logger=logger)
+        return _COLLECTOR
+
     def listener(
         self,
         integration: Optional[Integration] = None,
         logger: Optional[Logger] = None,
+        cache: Optional[CacheBackend] = None,
+        dedup: bool = True,
+        update_interval: Optional[float] = None,
+        reporter: Optional[BackgroundReporter] = None,
+        outbox: Union[bool, Outbox] = True,
+        policy: Union[bool, ReportPolicy] = True,
+        collector: Union[bool, CollectorClient] = True,
     ) -> Listener:
         """Listener injection.
 
         Args:
             integration: Issue tracker integration configuration.
             logger: logger instance.
+            cache: local cache backend.
+            dedup: whether to deduplicate repeat failures by fingerprint.
+            update_interval: minimum seconds between comments on a repeat failure's issue.
+            reporter: background queue to create remote issues from.
+            outbox: spool for undeliverable reports, True for the default one.
+            policy: rate limits and sampling, True for the default one, False for none.
+            collector: connection to the host's collector, True for the default one, False to
+                always record in-process.
 
         Returns:
             Listener instance.
         """
 
+        config = self.config()
         if not logger:
-            config = self.config()
             logger = self.logger(config.log_level)
+        if not cache:
+            cache = self.cache(config)
+        if outbox is True:
+            outbox = self.outbox(logger)
+        elif outbox is False:
+            outbox = None
+        if policy is True:
+            policy = self.policy(logger)
+        elif policy is False:
+            policy = None
+        if collector is True:
+            collector = self.collector(config, logger)
+        elif collector is False:
+            collector = None
 
         return Listener(
             integration=integration,
             logger=logger,
+            cache=cache,
+            index=FingerprintIndex() if dedup else None,
+            update_interval=update_interval,
+            reporter=reporter,
+            outbox=outbox,
+            offline=config.offline,
+            policy=policy,
+            collector=collector,
         )
@@ -0,0 +1,45 @@
+"""Compact traceback frames for Bug Buddy."""
+
+import linecache
+import traceback
+from types import TracebackType
+from typing import Any, NamedTuple, Optional
+
+
+class Frame(NamedTuple):
+    """One frame of a traceback, read like a `traceback.FrameSummary`.
+
+    Unlike `traceback.extract_tb`, nothing is read from disk when frames are captured: the
+    source line is looked up in linecache, without statting the file again, only when a frame
+    is fingerprinted or rendered.
+    """
+
+    filename: str
+    """File the frame's code was loaded from."""
+    lineno: Optional[int]
+    """Line being executed."""
+    name: str
+    """Function name."""
+    module_globals: Optional[dict[str, Any]] = None
+    """Globals of the frame's module, for sources served by an import loader (e.g. zipimport)."""
+
+    @property
+    def line(self) -> str:
+        """Stripped source line, empty if it isn't available."""
+        return linecache.getline(self.filename, self.lineno or 0, self.module_globals).strip()
+
+
+def walk(tb: Optional[TracebackType]) -> list[Frame]:
+    """Capture a traceback in a single walk, outermost frame first.
+
+    Args:
+        tb: traceback, e.g. `exc.__traceback__`.
+
+    Returns:
+        Frames, with source lines left for later.
+    """
+
+    return [
+        Frame(f.f_code.co_filename, lineno, f.f_code.co_name, f.f_globals)
+        for f, lineno in traceback.walk_tb(tb)
+    ]
@@ -0,0 +1,227 @@
+"""Pooled HTTP sessions with timeouts and retries for Bug Buddy's issue clients."""
+
+import dataclasses
+import time
+from typing import TYPE_CHECKING, Any, Optional
+
+# requests, httpx and the parsing helpers are imported on first use, so integrations can be
+# configured at import time without loading any HTTP machinery
+if TYPE_CHECKING:
+    from logging import Logger
+
+    import httpx
+    import requests
+
+DEFAULT_TIMEOUT = (3.05, 10.0)
+"""Default (connect, read) timeouts in seconds."""
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header.
+
+    Args:
+        value: header value, delay seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait, or None if absent or unparsable.
+    """
+
+    from datetime import datetime, timezone
+    from email.utils import parsedate_to_datetime
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter for rate limited and failing requests."""
+
+    max_retries: int = 3
+    """Retries after the first attempt."""
+    backoff_factor: float = 0.5
+    """Base delay in seconds, doubled on every retry."""
+    max_backoff: float = 30.0
+    """Longest delay between attempts, including one asked for by Retry-After."""
+    statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    """Response statuses that are retried."""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "statuses", frozenset(self.statuses))
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next attempt.
+
+        Args:
+            attempt: zero-based number of the attempt that just failed.
+            retry_after: Retry-After header of the failed response.
+
+        Returns:
+            Delay in seconds. Retry-After, when given, is a lower bound.
+        """
+
+        import random
+
+        backoff = random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**attempt))
+        asked = _retry_after(retry_after)
+        if asked is not None:
+            backoff = max(backoff, min(asked, self.max_backoff))
+        return backoff
+
+
+def build_session(pool_maxsize: int = 10) -> "requests.Session":
+    """Build a keep-alive session.
+
+    Args:
+        pool_maxsize: connections kept alive per host.
+
+    Returns:
+        Session with pooled adapters for http and https.
+    """
+
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def request(
+    session: "requests.Session",
+    method: str,
+    url: str,
+    timeout: tuple[float, float],
+    retry: RetryPolicy,
+    logger: "Logger",
+    **kwargs: Any,
+) -> "requests.Response":
+    """Send a request, retrying connection errors and retryable statuses.
+
+    Read timeouts are not retried: the tracker may already have created the issue.
+
+    Args:
+        session: pooled session.
+        method: HTTP method.
+        url: request URL.
+        timeout: (connect, read) timeouts in seconds.
+        retry: retry policy.
+        logger: Logger instance.
+        **kwargs: passed to `requests.Session.request`.
+
+    Returns:
+        The last response.
+    """
+
+    import requests
+
+    for attempt in range(retry.max_retries + 1):
+        last = attempt == retry.max_retries
+        try:
+            resp = session.request(method, url, timeout=timeout, **kwargs)
+        except requests.ConnectionError:
+            if last:
+                raise
+            wait = retry.delay(attempt)
+            logger.debug("Connection to %s failed, retrying in %.2fs", url, wait)
+        else:
+            if resp.status_code not in retry.statuses or last:
+                return resp
+            wait = retry.delay(attempt, resp.headers.get("Retry-After"))
+            logger.debug("%s from %s, retrying in %.2fs", resp.status_code, url, wait)
+            resp.close()
+        time.sleep(wait)
+
+
+def httpx_module():
+    """Import httpx, which the async clients need.
+
+    Returns:
+        The httpx module.
+    """
+
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "Async issue clients require httpx, install with `pip install bug-buddy[async]`."
+        ) from e
+
+    return httpx
+
+
+def build_async_client(
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT, pool_maxsize: int = 10
+) -> "httpx.AsyncClient":
+    """Build a pooled async client.
+
+    Args:
+        timeout: (connect, read) timeouts in seconds.
+        pool_maxsize: connections kept alive.
+
+    Returns:
+        httpx async client.
+    """
+
+    httpx = httpx_module()
+    connect, read = timeout
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(read, connect=connect),
+        limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+    )
+
+
+async def arequest(
+    client: "httpx.AsyncClient",
+    method: str,
+    url: str,
+    retry: RetryPolicy,
+    logger: "Logger",
+    **kwargs: Any,
+) -> "httpx.Response":
+    """Send a request without blocking the event loop, with the same retries as `request`.
+
+    Args:
+        client: pooled async client.
+        method: HTTP method.
+        url: request URL.
+        retry: retry policy.
+        logger: Logger instance.
+        **kwargs: passed to `httpx.AsyncClient.request`.
+
+    Returns:
+        The last response.
+    """
+
+    import asyncio
+
+    httpx = httpx_module()
+    for attempt in range(retry.max_retries + 1):
+        last = attempt == retry.max_retries
+        try:
+            resp = await client.request(method, url, **kwargs)
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            if last:
+                raise
+            wait = retry.delay(attempt)
+            logger.debug("Connection to %s failed, retrying in %.2fs", url, wait)
+        else:
+            if resp.status_code not in retry.statuses or last:
+                return resp
+            wait = retry.delay(attempt, resp.headers.get("Retry-After"))
+            logger.debug("%s from %s, retrying in %.2fs", resp.status_code, url, wait)
+            await resp.aclose()
+        await asyncio.sleep(wait)
@@ -0,0 +1,136 @@
+"""TTL-bounded cache of Linear label IDs."""
+
+import json
+import os
+import threading
+import time
+from typing import Mapping, Optional
+
+from attrs import define, field
+
+
+@define
+class LabelCache:
+    """Label IDs keyed by (team_id, label_name), held in memory and optionally on disk.
+
+    A team's full label listing is cached at once, so a label missing from a fresh listing is
+    known not to exist without asking Linear again.
+    """
+
+    ttl: float = 3600.0
+    """Seconds a cached label listing stays valid."""
+    path: Optional[str] = None
+    """JSON file persisting the cache between runs, None to keep it in memory only."""
+
+    _labels: dict[tuple[str, str], tuple[str, float]] = field(factory=dict, init=False)
+    _teams: dict[str, float] = field(factory=dict, init=False)
+    _loaded: bool = field(default=False, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def _load(self) -> None:
+        """Read the persisted cache once."""
+
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path:
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        for team_id, name, label_id, expires in data.get("labels", []):
+            self._labels[(team_id, name)] = (label_id, expires)
+        self._teams.update(data.get("teams", {}))
+
+    def _save(self) -> None:
+        """Atomically persist the cache."""
+
+        if not self.path:
+            return
+
+        data = {
+            "labels": [[t, n, i, e] for (t, n), (i, e) in self._labels.items()],
+            "teams": self._teams,
+        }
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            # e.g. a full disk: the cache stays in memory, without leaving a partial file
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def lookup(self, team_id: str, name: str) -> tuple[bool, Optional[str]]:
+        """Look up a label ID.
+
+        Args:
+            team_id: Linear team ID.
+            name: label name.
+
+        Returns:
+            Whether the cache could answer, and the label ID (None if known not to exist).
+        """
+
+        now = time.time()
+        with self._lock:
+            self._load()
+            label_id, expires = self._labels.get((team_id, name), (None, 0.0))
+            if expires > now:
+                return True, label_id
+            if self._teams.get(team_id, 0.0) > now:
+                return True, None
+        return False, None
+
+    def put_team(self, team_id: str, labels: Mapping[str, str]) -> None:
+        """Cache a team's full label listing.
+
+        Args:
+            team_id: Linear team ID.
+            labels: label name to ID.
+        """
+
+        expires = time.time() + self.ttl
+        with self._lock:
+            self._load()
+            for key in [k for k in self._labels if k[0] == team_id]:
+                del self._labels[key]
+            for name, label_id in labels.items():
+                self._labels[(team_id, name)] = (label_id, expires)
+            self._teams[team_id] = expires
+            self._save()
+
+    def put(self, team_id: str, name: str, label_id: str) -> None:
+        """Cache a single label, e.g. one just created.
+
+        Args:
+            team_id: Linear team ID.
+            name: label name.
+            label_id: label ID.
+        """
+
+        with self._lock:
+            self._load()
+            self._labels[(team_id, name)] = (label_id, time.time() + self.ttl)
+            self._save()
+
+    def invalidate(self, team_id: str) -> None:
+        """Forget a team's labels, e.g. after Linear rejected a cached ID.
+
+        Args:
+            team_id: Linear team ID.
+        """
+
+        with self._lock:
+            self._load()
+            for key in [k for k in self._labels if k[0] == team_id]:
+                del self._labels[key]
+            self._teams.pop(team_id, None)
+            self._save()
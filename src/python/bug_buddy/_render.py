@@ -0,0 +1,233 @@
+"""Bounded issue description rendering for Bug Buddy."""
+
+import io
+import traceback
+from typing import Iterator, Optional, Sequence
+
+from attrs import define, field
+
+from bug_buddy._frames import Frame, walk
+
+# identical consecutive frames shown before collapsing, as in CPython's traceback module
+_REPEAT_THRESHOLD = 3
+
+_CAUSE = "The above exception was the direct cause of the following exception:"
+_CONTEXT = "During handling of the above exception, another exception occurred:"
+
+
+def _collapse(frames: Sequence[Frame]) -> list[tuple[Frame, int]]:
+    """Group runs of identical consecutive frames, e.g. from unbounded recursion.
+
+    Args:
+        frames: frames, outermost first.
+
+    Returns:
+        (frame, number of consecutive occurrences) pairs.
+    """
+
+    groups, last = [], None
+    for frame in frames:
+        position = (frame.filename, frame.lineno, frame.name)
+        if groups and position == last:
+            groups[-1][1] += 1
+        else:
+            groups.append([frame, 1])
+            last = position
+    return [(frame, count) for frame, count in groups]
+
+
+class _Exhausted(Exception):
+    """The byte budget is spent."""
+
+
+@define
+class _Buffer:
+    """Single output buffer that stops accepting text once the byte budget is spent."""
+
+    budget: int
+    """Bytes left."""
+    out: io.StringIO = field(factory=io.StringIO)
+    """Rendered text."""
+    fenced: bool = False
+    """Whether a code block is open, so truncation can close it."""
+
+    def write(self, text: str) -> None:
+        """Append text, raising `_Exhausted` once it doesn't fit."""
+
+        size = len(text.encode("utf-8", "replace"))
+        if size > self.budget:
+            self.out.write(
+                text.encode("utf-8", "replace")[: self.budget].decode("utf-8", "ignore")
+            )
+            self.budget = 0
+            raise _Exhausted
+        self.budget -= size
+        self.out.write(text)
+
+    def fence(self, lang: str = "") -> None:
+        """Open or close a code block."""
+
+        self.write(f"```{lang}\n" if not self.fenced else "```\n")
+        self.fenced = not self.fenced
+
+
+def _chain(exc: Optional[BaseException]) -> list[tuple[BaseException, Optional[str]]]:
+    """Exceptions chained to `exc`, oldest first, with the message linking each to the next."""
+
+    chain, seen = [], {id(exc)}
+    while exc is not None:
+        if exc.__cause__ is not None:
+            exc, message = exc.__cause__, _CAUSE
+        elif exc.__context__ is not None and not exc.__suppress_context__:
+            exc, message = exc.__context__, _CONTEXT
+        else:
+            break
+        if id(exc) in seen:
+            break
+        seen.add(id(exc))
+        chain.append((exc, message))
+    return chain[::-1]
+
+
+@define
+class DescriptionRenderer:
+    """Renders issue descriptions within a byte budget, whatever the size of the traceback.
+
+    Runs of identical frames are collapsed the way CPython does, only the outermost
+    `head_frames` and innermost `tail_frames` frames are rendered, and long function sources
+    are cut, so rendering cost is bounded by the budget rather than the depth of the stack.
+    """
+
+    max_bytes: int = 65536
+    """Maximum size of a description in bytes (UTF-8)."""
+    head_frames: int = 10
+    """Outermost frames kept when a traceback is elided."""
+    tail_frames: int = 25
+    """Innermost frames kept when a traceback is elided."""
+    max_source_lines: int = 80
+    """Lines of the decorated function's source kept."""
+
+    def _select(self, frames: Sequence[Frame]) -> Iterator[tuple[Optional[Frame], int]]:
+        """Collapsed frames to render, with (None, n) marking n elided frames."""
+
+        groups = _collapse(frames)
+        if len(groups) <= self.head_frames + self.tail_frames:
+            yield from groups
+            return
+
+        tail = len(groups) - self.tail_frames
+        yield from groups[: self.head_frames]
+        yield None, sum(count for _, count in groups[self.head_frames : tail])
+        yield from groups[tail:]
+
+    def _source(self, buf: _Buffer, func_name: str, func_source: Optional[str]) -> None:
+        """Write the decorated function's source, cut to `max_source_lines`."""
+
+        buf.fence("python")
+        if func_source:
+            lines = func_source.rstrip().splitlines()
+            for line in lines[: self.max_source_lines]:
+                buf.write(line + "\n")
+            if len(lines) > self.max_source_lines:
+                buf.write(f"# ... {len(lines) - self.max_source_lines} more lines\n")
+        else:
+            buf.write(func_name + "\n")
+        buf.fence()
+
+    def _table(self, buf: _Buffer, frames: Sequence[Frame]) -> None:
+        """Write the traceback table."""
+
+        buf.write("| File | Callable | Line | Code |\n")
+        buf.write("| --- | --- | --- | --- |\n")
+        for frame, count in self._select(frames):
+            if frame is None:
+                buf.write(f"| ... | | | _{count} frames omitted_ |\n")
+                continue
+            esc_callable = frame.name.replace("_", r"\_")
+            code = (frame.line or "").replace("|", r"\|")
+            buf.write(f"| {frame.filename} | {esc_callable} | {frame.lineno} | {code} |\n")
+            if count > 1:
+                buf.write(f"| | | | _[Previous line repeated {count - 1} more times]_ |\n")
+
+    def _raw(self, buf: _Buffer, frames: Sequence[Frame], exc_lines: Sequence[str]) -> None:
+        """Write one traceback in CPython's format."""
+
+        if frames:
+            buf.write("Traceback (most recent call last):\n")
+        for frame, count in self._select(frames):
+            if frame is None:
+                buf.write(f"  [... {count} frames omitted ...]\n")
+                continue
+            line = frame.line
+            for _ in range(min(count, _REPEAT_THRESHOLD)):
+                buf.write(f'  File "{frame.filename}", line {frame.lineno}, in {frame.name}\n')
+                if line:
+                    buf.write(f"    {line}\n")
+            if count > _REPEAT_THRESHOLD:
+                repeats = count - _REPEAT_THRESHOLD
+                buf.write(
+                    f"  [Previous line repeated {repeats} more time{'s' if repeats > 1 else ''}]\n"
+                )
+        for line in exc_lines:
+            buf.write(line)
+
+    def render(
+        self,
+        tb: Sequence[Frame],
+        func_name: str,
+        func_source: Optional[str] = None,
+        context: Sequence[tuple[str, str]] = (),
+        exc: Optional[BaseException] = None,
+    ) -> str:
+        """Render the description of an issue.
+
+        Args:
+            tb: filtered traceback, `Frame`s or `traceback.FrameSummary`s. Source lines are
+                only looked up for the frames rendered.
+            func_name: name of the decorated function.
+            func_source: source code of the decorated function.
+            context: execution context.
+            exc: the exception, for its message and chained exceptions.
+
+        Returns:
+            Markdown description of at most `max_bytes` bytes.
+        """
+
+        notice = f"\n_Description truncated to {self.max_bytes} bytes._\n"
+        buf = _Buffer(budget=max(0, self.max_bytes - len(notice) - len("```\n")))
+        try:
+            # Function source code
+            buf.write("### Origin\n")
+            self._source(buf, func_name, func_source)
+            buf.write("\n")
+
+            # Source/execution context
+            buf.write("### Platform\n")
+            buf.write("| Property | Value |\n")
+            buf.write("| --- | --- |\n")
+            for label, value in context:
+                buf.write(f"| {label} | `{value}` |\n")
+            buf.write("\n")
+
+            # Traceback table
+            buf.write("### Traceback\n")
+            self._table(buf, tb)
+
+            # Raw traceback
+            buf.write("\n")
+            buf.write("### Raw traceback\n")
+            buf.fence()
+            for chained, message in _chain(exc):
+                self._raw(
+                    buf, walk(chained.__traceback__), traceback.format_exception_only(chained)
+                )
+                buf.write(f"\n{message}\n\n")
+            exc_lines = traceback.format_exception_only(exc) if exc is not None else []
+            self._raw(buf, tb, exc_lines)
+            buf.fence()
+        except _Exhausted:
+            if buf.fenced:
+                buf.out.write("\n```\n")
+            buf.out.write(notice)
+
+        return buf.out.getvalue().rstrip("\n")
@@ -1,70 +1,199 @@
 import inspect
-import traceback
-from functools import wraps
-from typing import Any, Optional
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Union
 
-from bug_buddy._di_container import BugBuddyInjector
-from bug_buddy.integration import Integration
+# everything needed to report a failure is imported on the first failure
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from bug_buddy.cache import CacheBackend
+    from bug_buddy.integration import Integration
+    from bug_buddy.listener import Listener
+    from bug_buddy.outbox import Outbox
+    from bug_buddy.policy import ReportPolicy
+    from bug_buddy.reporter import BackgroundReporter
 
 
 def bug_buddy(
     runner: Optional[callable] = None,
-    integration: Optional[Integration] = None,
+    integration: Optional["Integration"] = None,
+    cache: Optional["CacheBackend"] = None,
+    dedup: bool = True,
+    update_interval: Optional[float] = None,
+    reporter: Optional["BackgroundReporter"] = None,
+    outbox: Union[bool, "Outbox"] = True,
+    policy: Union[bool, "ReportPolicy"] = True,
 ) -> Any:
     """Decorator for bug_buddy.
 
-    Tag a main/runner function with this decorator to enable bug_buddy.
+    Tag a main/runner function with this decorator to enable bug_buddy. Coroutine functions and
+    async generators are awaited, and their failures are reported through the integration's
+    async client without blocking the event loop.
 
     Args:
         runner: main/runner function.
         integration: Issue tracker integration configuration (GitlabIntegration,
             GithubIntegration, or LinearIntegration).
+        cache: Local cache backend, defaults to an append-only JSON Lines file at
+            `$HOME/.bug_buddy.cache`.
+        dedup: Create one issue per unique failure fingerprint. Repeat failures only bump a
+            local occurrence counter.
+        update_interval: When deduplicating, comment on the existing remote issue at most once
+            per this many seconds. None never comments.
+        reporter: Background queue to create remote issues from, so the exception is re-raised
+            without waiting on the tracker.
+        outbox: Spool reports the tracker can't take to `$HOME/.bug_buddy.outbox` (or the
+            given Outbox) and replay them after the next successful report or on
+            `bug-buddy flush`. False logs tracker errors instead. Either way the original
+            exception is re-raised.
+        policy: Rate limits and sampling applied before a failure is recorded, so failure storms
+            cost a bounded amount of CPU, I/O and tracker calls. True uses a process wide
+            `ReportPolicy`, False records every failure.
 
     Returns:
         Decorated function's return value.
     """
 
+    @lru_cache(maxsize=None)
+    def _listen() -> tuple["Logger", "Listener"]:
+        """Inject the logger and listener, once per decoration and only once something fails."""
+
+        from bug_buddy._di_container import BugBuddyInjector
+
+        # init dependency injection container
+        di = BugBuddyInjector()
+        # inject dependencies
+        config = di.config()
+        logger = di.logger(config.log_level)
+        listener = di.listener(
+            integration=integration,
+            logger=logger,
+            cache=cache,
+            dedup=dedup,
+            update_interval=update_interval,
+            reporter=reporter,
+            outbox=outbox,
+            policy=policy,
+        )
+
+        logger.debug("listening for " + listener.mascot)
+
+        return logger, listener
+
+    def _capture(
+        listener: "Listener", runner: callable, source: callable, e: Exception
+    ) -> Optional[dict[str, Any]]:
+        """Capture the traceback and source of a failed call, None if the policy drops it."""
+
+        from bug_buddy._frames import walk
+
+        # one walk of the stack, source lines are only read for the frames that need them
+        trace = walk(e.__traceback__)
+        if not listener.admit(trace, type(e), runner.__name__):
+            return None
+
+        return dict(
+            tb=trace,
+            exception=type(e),
+            func_name=runner.__name__,
+            func_source=source(),
+            exc=e,
+        )
+
+    def _report(runner: callable, source: callable, e: Exception) -> None:
+        """Record a failure, never letting a reporting error replace the user's exception."""
+
+        logger, listener = _listen()
+        try:
+            captured = _capture(listener, runner, source, e)
+            if captured is None:
+                return
+            issue = listener.record(**captured)
+        except Exception:
+            logger.warning("Could not report " + listener.mascot, exc_info=True)
+        else:
+            listener.detected(issue)
+
+    async def _areport(runner: callable, source: callable, e: Exception) -> None:
+        """Record a failure from a coroutine, see `_report`."""
+
+        logger, listener = _listen()
+        try:
+            captured = _capture(listener, runner, source, e)
+            if captured is None:
+                return
+            issue = await listener.arecord(**captured)
+        except Exception:
+            logger.warning("Could not report " + listener.mascot, exc_info=True)
+        else:
+            listener.detected(issue)
+
     def _bug_buddy(runner: callable) -> callable:
+        @lru_cache(maxsize=None)
+        def source() -> Optional[str]:
+            """Source of the decorated function, read once, on its first recorded failure."""
+
+            try:
+                return inspect.getsource(runner)
+            except (OSError, TypeError):
+                return None
+
+        if inspect.isasyncgenfunction(runner):
+
+            @wraps(runner)
+            async def agen_wrapper(*args, **kwargs) -> AsyncIterator[Any]:
+                """Async generator main/runner executed here."""
+
+                # driven by hand so sent values, thrown exceptions and aclose reach the runner
+                agen = runner(*args, **kwargs)
+                try:
+                    item = await agen.asend(None)
+                    while True:
+                        try:
+                            sent = yield item
+                        except GeneratorExit:
+                            await agen.aclose()
+                            raise
+                        except BaseException as thrown:
+                            item = await agen.athrow(thrown)
+                        else:
+                            item = await agen.asend(sent)
+
+                except StopAsyncIteration:
+                    return
+
+                except Exception as e:
+                    await _areport(runner, source, e)
+
+                    raise e
+
+            return agen_wrapper
+
+        if inspect.iscoroutinefunction(runner):
+
+            @wraps(runner)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                """Coroutine main/runner executed here."""
+
+                try:
+                    return await runner(*args, **kwargs)
+
+                except Exception as e:
+                    await _areport(runner, source, e)
+
+                    raise e
+
+            return async_wrapper
+
         @wraps(runner)
         def wrapper(*args, **kwargs) -> any:
             """Main/runner executed here."""
 
-            # init dependency injection container
-            di = BugBuddyInjector()
-            # inject dependencies
-            config = di.config()
-            logger = di.logger(config.log_level)
-            listener = di.listener(integration=integration, logger=logger)
-
-            logger.info("listening for " + listener.mascot)
-
             try:
-                actual = runner(*args, **kwargs)
-                logger.debug("completed without " + listener.mascot)
-                return actual
+                return runner(*args, **kwargs)
 
             except Exception as e:
-                # filter traceback for all components
-                trace: list[traceback.FrameSummary] = traceback.extract_tb(e.__traceback__)
-
-                # get source code of decorated function
-                try:
-                    func_source = inspect.getsource(runner)
-                except (OSError, TypeError):
-                    func_source = None
-
-                issue = listener.record(
-                    trace,
-                    exception=type(e),
-                    func_name=runner.__name__,
-                    func_source=func_source,
-                )
-
-                detection = listener.mascot + " cached."
-                if integration:
-                    detection += f" Tracking at {integration.name} issue {issue.id}."
-
-                logger.info(detection)
+                _report(runner, source, e)
 
                 raise e
 
@@ -0,0 +1,896 @@
+"""Local cache backends for Bug Buddy."""
+
+import atexit
+import glob
+import gzip
+import importlib
+import importlib.util
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import partial
+from logging import getLogger
+from typing import IO, Any, Callable, ClassVar, Iterable, Iterator, Mapping, Optional, Sequence
+
+from attrs import define, field
+from attrs.validators import in_
+
+CACHE_FILE = ".bug_buddy.cache"
+"""Default cache file name, relative to $HOME."""
+
+FSYNC_POLICIES = ("never", "interval", "always")
+"""Supported fsync policies for file backed caches."""
+
+COMPRESSIONS = ("gzip", "zstd", "none")
+"""Codecs rotated cache segments can be compressed with."""
+
+try:
+    import fcntl
+except ImportError:  # Windows, where writes fall back to O_APPEND alone
+    fcntl = None
+
+REMOTE_KEY = ("project_id", "remote_id")
+"""Record fields identifying a remote issue across trackers and projects."""
+
+_SHARD = ".shard"
+_SEGMENT = re.compile(r"\.(\d+)\.(\d+)\.seg")
+_SEGMENTS_LOCK = ".segments.lock"
+_SUFFIXES = {"gzip": ".gz", "zstd": ".zst", "none": ""}
+
+_logger = getLogger(__name__)
+
+
+def cache_path(cache: str = CACHE_FILE) -> str:
+    """Resolve a cache file name against $HOME.
+
+    Args:
+        cache: cache file name or absolute path.
+
+    Returns:
+        Absolute cache path.
+    """
+
+    return os.path.join(os.environ["HOME"], cache)
+
+
+def _fast_encoder() -> Optional[Callable[[Mapping[str, Any]], bytes]]:
+    """Line encoder of orjson or msgspec, whichever is installed first."""
+
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return partial(orjson.dumps, default=str, option=orjson.OPT_APPEND_NEWLINE)
+
+    try:
+        import msgspec
+    except ImportError:
+        return None
+
+    encode = msgspec.json.Encoder(enc_hook=str).encode
+    return lambda record: encode(record) + b"\n"
+
+
+# built once, json.dumps builds a new encoder on every call given any options
+_FAST_ENCODE = _fast_encoder()
+_JSON_ENCODE = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+
+def _encode(record: Mapping[str, Any]) -> bytes:
+    """Encode a record as a single compact JSON line.
+
+    Args:
+        record: record to encode.
+
+    Returns:
+        UTF-8 encoded JSON line, newline terminated.
+    """
+
+    if _FAST_ENCODE is not None:
+        try:
+            return _FAST_ENCODE(record)
+        except Exception:
+            # e.g. integers wider than 64 bits, which only the json module takes
+            pass
+    return (_JSON_ENCODE(record) + "\n").encode("utf-8")
+
+
+def record_key(record: Mapping[str, Any], by: Sequence[str] = REMOTE_KEY) -> Optional[tuple]:
+    """Key matching a record to other versions of the same issue.
+
+    Args:
+        record: issue record.
+        by: record fields making up the key.
+
+    Returns:
+        The fields as strings, None if any is missing (e.g. a local issue has no remote ID).
+    """
+
+    values = tuple(record.get(name) for name in by)
+    if any(value is None or value == "" for value in values):
+        return None
+    return tuple(str(value) for value in values)
+
+
+@contextmanager
+def locked(path: str, flags: int = os.O_RDWR | os.O_APPEND | os.O_CREAT) -> Iterator[int]:
+    """Open a file under an exclusive advisory lock shared by every process on the host.
+
+    The lock is taken on the open file, so a file swapped in by `os.replace` (e.g. by a
+    migration) or removed (e.g. a merged shard) while waiting is reopened and locked again.
+
+    Args:
+        path: file path.
+        flags: `os.open` flags.
+
+    Yields:
+        Locked file descriptor.
+    """
+
+    while True:
+        fd = os.open(path, flags, 0o644)
+        if fcntl is None:
+            break
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_ino == os.stat(path).st_ino:
+                break
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+
+    try:
+        yield fd
+    finally:
+        # closing the descriptor releases the lock
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of `data`, starting on a new line if the file ends in a torn record."""
+
+    size = os.fstat(fd).st_size
+    if size and os.pread(fd, 1, size - 1) != b"\n":
+        data = b"\n" + data
+
+    written = os.write(fd, data)
+    while written < len(data):
+        written += os.write(fd, data[written:])
+
+
+def _codec_installed(instance: Any, attribute: Any, compression: str) -> None:
+    """Validate that the package of a compression codec is installed."""
+
+    if compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+        raise ValueError("zstd compression needs the zstandard package: pip install zstandard")
+
+
+def _open_text(path: str) -> IO[str]:
+    """Open a cache file or segment for reading, decompressing by file suffix."""
+
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    if path.endswith(".zst"):
+        import zstandard
+
+        return zstandard.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+def _open_write(path: str, compression: str) -> IO[bytes]:
+    """Open a segment for writing with a codec of `COMPRESSIONS`."""
+
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.open(path, "wb")
+    return open(path, "wb")
+
+
+def _compression(path: str) -> str:
+    """Codec of a cache file or segment, by file suffix."""
+
+    for compression, suffix in _SUFFIXES.items():
+        if suffix and path.endswith(suffix):
+            return compression
+    return "none"
+
+
+def _read(f: IO[str], path: str) -> Iterator[dict[str, Any]]:
+    """Stream the records of an open JSON Lines file, skipping corrupt lines."""
+
+    number = 0
+    try:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                _logger.warning("Skipping corrupt record at %s:%s", path, number)
+    except (EOFError, OSError, gzip.zlib.error):
+        # a compressed segment cut short, e.g. by a full disk
+        _logger.warning("Skipping the rest of corrupt segment %s after line %s", path, number)
+
+
+def _records(path: str) -> Iterator[dict[str, Any]]:
+    """Stream the records of a JSON Lines file, compressed or not, skipping corrupt lines.
+
+    Yields:
+        Records.
+    """
+
+    try:
+        f = _open_text(path)
+    except FileNotFoundError:
+        return
+
+    with f:
+        yield from _read(f, path)
+
+
+def _holds(path: str, updates: Mapping[tuple, Any], by: Sequence[str]) -> bool:
+    """Whether a JSON Lines file holds a record with any of the keys of `updates`."""
+
+    return any(record_key(record, by) in updates for record in _records(path))
+
+
+def segment_path(path: str, number: int, part: int = 0) -> str:
+    """Path of an uncompressed segment of a cache, before any compression suffix.
+
+    Args:
+        path: cache file path.
+        number: rotation number, increasing with every rotation.
+        part: part of a compacted rotation.
+
+    Returns:
+        Segment path.
+    """
+
+    return f"{path}.{number:06d}.{part:03d}.seg"
+
+
+def _segment_ids(path: str) -> list[tuple[tuple[int, int], str]]:
+    """(number, part) and path of each segment of a cache, oldest first."""
+
+    found = {}
+    for name in glob.glob(glob.escape(path) + ".*.seg*"):
+        match = _SEGMENT.fullmatch(name[len(path) :].removesuffix(".gz").removesuffix(".zst"))
+        if match:
+            number, part = int(match.group(1)), int(match.group(2))
+            found[number, part] = segment_path(path, number, part)
+    return sorted(found.items())
+
+
+def segments(path: str) -> list[str]:
+    """Rotated segments of a cache, oldest first.
+
+    Args:
+        path: cache file path.
+
+    Returns:
+        Segment paths, without their compression suffix.
+    """
+
+    return [segment for _, segment in _segment_ids(path)]
+
+
+def _segment_files(segment: str) -> list[str]:
+    """Files holding a segment: compressed, or not yet."""
+
+    return [segment + suffix for suffix in (".gz", ".zst", "") if os.path.exists(segment + suffix)]
+
+
+def _segment_records(segment: str) -> Iterator[dict[str, Any]]:
+    """Stream the records of a segment, whether or not it was compressed meanwhile."""
+
+    # a compressed segment is complete before the uncompressed one is removed, so one of them
+    # opens on the second try at the latest
+    for _ in range(2):
+        for name in _segment_files(segment):
+            try:
+                f = _open_text(name)
+            except FileNotFoundError:
+                continue
+            with f:
+                yield from _read(f, name)
+            return
+
+
+def _fsync_path(path: str) -> None:
+    """fsync a file written through a stream that doesn't expose its descriptor."""
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def compress_segment(segment: str, compression: str) -> bool:
+    """Compress an uncompressed segment, keeping its modification time for retention.
+
+    The compressed segment is written aside and swapped in before the uncompressed one is
+    removed, so readers always find one of them whole.
+
+    Args:
+        segment: segment path, see `segments`.
+        compression: codec, one of `COMPRESSIONS`.
+
+    Returns:
+        Whether the segment was compressed.
+    """
+
+    if compression == "none":
+        return False
+
+    try:
+        stat = os.stat(segment)
+        tmp = f"{segment}.{os.getpid()}.compress"
+        with open(segment, "rb") as src, _open_write(tmp, compression) as out:
+            shutil.copyfileobj(src, out, 1 << 20)
+    except FileNotFoundError:
+        return False
+
+    _fsync_path(tmp)
+    os.utime(tmp, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(tmp, segment + _SUFFIXES[compression])
+    os.remove(segment)
+
+    return True
+
+
+def shard_path(path: str, pid: Optional[int] = None) -> str:
+    """Path of a process's shard of a cache.
+
+    Args:
+        path: cache file path.
+        pid: process ID, defaults to the current process.
+
+    Returns:
+        Shard file path.
+    """
+
+    return f"{path}.{pid or os.getpid()}{_SHARD}"
+
+
+def merge_shards(path: str) -> int:
+    """Append every shard of a cache to the cache and remove them.
+
+    Corrupt lines in a shard are dropped. Safe to run while other processes write to the
+    cache or their shards.
+
+    Args:
+        path: cache file path.
+
+    Returns:
+        Number of records merged.
+    """
+
+    merged = 0
+    for shard in sorted(glob.glob(glob.escape(path) + ".*" + _SHARD)):
+        try:
+            with locked(shard, os.O_RDONLY):
+                records = list(_records(shard))
+                if records:
+                    with locked(path) as fd:
+                        _write_all(fd, b"".join(_encode(record) for record in records))
+                        os.fsync(fd)
+                # removed while locked, so the shard's writer starts a new one
+                os.remove(shard)
+        except FileNotFoundError:
+            continue
+        merged += len(records)
+
+    return merged
+
+
+def migrate_json_array(path: str) -> int:
+    """Migrate a legacy JSON array cache to JSON Lines in place.
+
+    Caches written by Bug Buddy <= 1.1 hold a single indented JSON array. The array is
+    rewritten as one record per line and atomically swapped in. Files that are already
+    JSON Lines are left untouched.
+
+    Args:
+        path: cache file path.
+
+    Returns:
+        Number of records migrated.
+    """
+
+    try:
+        with locked(path, os.O_RDONLY) as fd, open(fd, "rb", closefd=False) as f:
+            head = f.read(64).lstrip()
+            if not head.startswith(b"["):
+                return 0
+            f.seek(0)
+            existing = json.load(f)
+
+            tmp = f"{path}.{os.getpid()}.migrate"
+            with open(tmp, "wb") as out:
+                for record in existing:
+                    out.write(_encode(record))
+                out.flush()
+                os.fsync(out.fileno())
+            # swapped in while locked, so writers waiting on the old file reopen the new one
+            os.replace(tmp, path)
+    except FileNotFoundError:
+        return 0
+
+    return len(existing)
+
+
+class CacheBackend(ABC):
+    """Base class for local issue caches.
+
+    Backends that can rewrite cached records set `supports_update` and implement
+    `update(records, by=REMOTE_KEY) -> int`, which merges newer issue records into the cached
+    records with the same `record_key` and returns how many were updated. Without it, newer
+    versions of an issue are appended instead.
+    """
+
+    supports_update: ClassVar[bool] = False
+    """Whether the backend updates cached records in place with `update`."""
+
+    @abstractmethod
+    def append(self, record: Mapping[str, Any]) -> None:
+        """Persist a single issue record.
+
+        Args:
+            record: cleaned issue record.
+        """
+        ...
+
+    @abstractmethod
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Stream cached issue records, oldest first.
+
+        Yields:
+            Issue records.
+        """
+        ...
+
+
+@define
+class CompactResult:
+    """Outcome of a cache compaction."""
+
+    records: int = 0
+    """Records kept in the compacted segments."""
+    merged: int = 0
+    """Duplicate records merged into a later version of the same issue."""
+    segments: int = 0
+    """Compacted segments written."""
+    dropped: int = 0
+    """Segments dropped by the retention limits."""
+
+
+@define
+class JsonlCacheBackend(CacheBackend):
+    """Append-only JSON Lines cache, safe to share between processes.
+
+    Each record is written with a single `write` on an `O_APPEND` descriptor under an
+    exclusive `fcntl` lock, so the cost of caching an issue does not depend on the size of the
+    cache and concurrent processes never interleave or lose records. A record torn by a crash
+    is skipped when reading. With `shard=True` each process appends to its own shard instead,
+    merged into the cache at exit or by `merge_shards`.
+
+    Once the cache reaches `max_bytes` it is rotated to a numbered segment, compressed off the
+    failing path, and readers iterate the segments, oldest first, before the cache. Segments
+    past `max_age` or over the `max_total_bytes` disk cap are dropped, oldest first, and
+    `compact` merges the records of the same issue.
+    """
+
+    supports_update: ClassVar[bool] = True
+
+    path: str = field(factory=cache_path)
+    """Cache file path."""
+    fsync: str = field(default="never", validator=in_(FSYNC_POLICIES))
+    """When to fsync after an append: never, at most every `fsync_interval` seconds, or always."""
+    fsync_interval: float = 1.0
+    """Minimum seconds between fsyncs under the `interval` policy."""
+    shard: bool = False
+    """Append to a per-process shard, for many processes failing at once (e.g. pytest-xdist)."""
+    max_bytes: Optional[int] = 64 << 20
+    """Rotate the cache to a segment once it reaches this many bytes, None never rotates."""
+    compression: str = field(default="gzip", validator=[in_(COMPRESSIONS), _codec_installed])
+    """Codec rotated segments are compressed with: gzip, zstd (needs zstandard) or none."""
+    max_total_bytes: Optional[int] = None
+    """Disk the cache and its segments may use before the oldest segments are dropped, None
+    keeps every segment."""
+    max_age: Optional[float] = None
+    """Seconds after its last write a segment is dropped, None keeps segments forever."""
+
+    _migrated: bool = field(default=False, init=False)
+    _last_fsync: float = field(default=0.0, init=False)
+    _merge_at_exit: bool = field(default=False, init=False)
+    _maintaining: threading.Lock = field(factory=threading.Lock, init=False)
+    _maintainer: Optional[threading.Thread] = field(default=None, init=False)
+    _rotated: bool = field(default=False, init=False)
+
+    def _ensure_migrated(self) -> None:
+        """Migrate a legacy JSON array cache once per backend."""
+
+        if not self._migrated:
+            migrate_json_array(self.path)
+            self._migrated = True
+
+    def _should_fsync(self) -> bool:
+        """Whether the fsync policy calls for a sync now."""
+
+        if self.fsync == "always":
+            return True
+        if self.fsync == "interval":
+            now = time.monotonic()
+            if now - self._last_fsync >= self.fsync_interval:
+                self._last_fsync = now
+                return True
+        return False
+
+    def _target(self) -> str:
+        """File the next record goes to."""
+
+        if not self.shard:
+            return self.path
+
+        if not self._merge_at_exit:
+            atexit.register(merge_shards, self.path)
+            self._merge_at_exit = True
+        return shard_path(self.path)
+
+    def _segments_lock(self) -> Any:
+        """Lock held while segments are compressed, updated, compacted or dropped."""
+
+        return locked(self.path + _SEGMENTS_LOCK, os.O_RDWR | os.O_CREAT)
+
+    def _rotate(self) -> str:
+        """Rename the cache to the next segment. Called with the cache locked."""
+
+        ids = _segment_ids(self.path)
+        segment = segment_path(self.path, ids[-1][0][0] + 1 if ids else 1)
+        # writers waiting on the lock find the cache gone and create a new one
+        os.rename(self.path, segment)
+        return segment
+
+    def rotate(self) -> Optional[str]:
+        """Rotate the cache to a new segment now, e.g. before compacting.
+
+        Returns:
+            The new segment, None if the cache is empty.
+        """
+
+        try:
+            with locked(self.path, os.O_RDONLY) as fd:
+                if not os.fstat(fd).st_size:
+                    return None
+                return self._rotate()
+        except FileNotFoundError:
+            return None
+
+    def _retain(self) -> int:
+        """Drop expired segments, then the oldest ones over the disk cap. Called locked."""
+
+        if self.max_age is None and self.max_total_bytes is None:
+            return 0
+
+        files = []
+        for segment in segments(self.path):
+            for name in _segment_files(segment):
+                try:
+                    files.append((name, os.stat(name)))
+                except FileNotFoundError:
+                    continue
+        try:
+            total = os.stat(self.path).st_size
+        except FileNotFoundError:
+            total = 0
+        total += sum(stat.st_size for _, stat in files)
+
+        dropped = 0
+        expired_before = time.time() - self.max_age if self.max_age is not None else None
+        for name, stat in files:
+            expired = expired_before is not None and stat.st_mtime < expired_before
+            over = self.max_total_bytes is not None and total > self.max_total_bytes
+            if expired or over:
+                os.remove(name)
+                total -= stat.st_size
+                dropped += 1
+
+        return dropped
+
+    def maintain(self) -> int:
+        """Compress uncompressed segments and apply the retention limits.
+
+        Returns:
+            Number of segments dropped.
+        """
+
+        with self._segments_lock():
+            # only ever written under this lock, so any left over belongs to a dead process
+            prefix = glob.escape(self.path)
+            for stale in glob.glob(prefix + ".*.compress") + glob.glob(prefix + ".*.compact"):
+                os.remove(stale)
+            for segment in segments(self.path):
+                compress_segment(segment, self.compression)
+            return self._retain()
+
+    def _maintain_in_background(self) -> None:
+        """Maintain segments on a daemon thread, again for any rotation made meanwhile."""
+
+        with self._maintaining:
+            self._rotated = True
+            if self._maintainer is not None:
+                return
+
+            def maintain() -> None:
+                while True:
+                    with self._maintaining:
+                        if not self._rotated:
+                            self._maintainer = None
+                            return
+                        self._rotated = False
+                    try:
+                        self.maintain()
+                    except Exception:
+                        _logger.warning(
+                            "Could not maintain cache segments of %s", self.path, exc_info=True
+                        )
+
+            self._maintainer = threading.Thread(
+                target=maintain, name="bug-buddy-cache", daemon=True
+            )
+            self._maintainer.start()
+
+    def append(self, record: Mapping[str, Any]) -> None:
+        """Append a record as one JSON line, rotating the cache once it reaches `max_bytes`.
+
+        Args:
+            record: cleaned issue record.
+        """
+
+        self._ensure_migrated()
+
+        target = self._target()
+        rotated = False
+        with locked(target) as fd:
+            _write_all(fd, _encode(record))
+            if self._should_fsync():
+                os.fsync(fd)
+            if target == self.path and self.max_bytes and os.fstat(fd).st_size >= self.max_bytes:
+                self._rotate()
+                rotated = True
+
+        if rotated:
+            self._maintain_in_background()
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Stream records line by line without loading the whole cache: segments, oldest first,
+        then the cache, then unmerged shards.
+
+        Yields:
+            Issue records.
+        """
+
+        self._ensure_migrated()
+
+        for segment in segments(self.path):
+            yield from _segment_records(segment)
+        yield from _records(self.path)
+        for shard in sorted(glob.glob(glob.escape(self.path) + ".*" + _SHARD)):
+            yield from _records(shard)
+
+    def update(self, records: Iterable[Mapping[str, Any]], by: Sequence[str] = REMOTE_KEY) -> int:
+        """Update cached records in place with newer versions of the same issues.
+
+        Shards are merged first, then the cache is rewritten in one pass against an index of
+        the newer records by key and atomically swapped in, under the lock appends take, so no
+        record written meanwhile is lost. Segments holding any of the issues are rewritten the
+        same way, and files holding none of them are left alone. Corrupt lines are dropped
+        from the files rewritten.
+
+        Args:
+            records: newer issue records, merged into the cached records with the same key.
+            by: record fields matching a newer record to the cached ones, see `record_key`.
+
+        Returns:
+            Number of cached records updated.
+        """
+
+        updates = {}
+        for record in records:
+            key = record_key(record, by)
+            if key is not None:
+                updates[key] = record
+        if not updates:
+            return 0
+
+        self._ensure_migrated()
+        merge_shards(self.path)
+
+        updated = 0
+        with self._segments_lock():
+            for segment in segments(self.path):
+                updated += self._update_segment(segment, updates, by)
+
+        tmp = f"{self.path}.{os.getpid()}.update"
+        try:
+            with locked(self.path, os.O_RDONLY):
+                if not _holds(self.path, updates, by):
+                    return updated
+                with open(tmp, "wb") as out:
+                    for record in _records(self.path):
+                        update = updates.get(record_key(record, by))
+                        if update is not None:
+                            record = {**record, **update}
+                            updated += 1
+                        out.write(_encode(record))
+                    out.flush()
+                    os.fsync(out.fileno())
+                # swapped in while locked, so writers waiting on the old file reopen the new one
+                os.replace(tmp, self.path)
+        except FileNotFoundError:
+            pass
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+        return updated
+
+    def _update_segment(
+        self, segment: str, updates: Mapping[tuple, Mapping[str, Any]], by: Sequence[str]
+    ) -> int:
+        """Rewrite a segment holding any of the updated issues. Called with segments locked."""
+
+        files = _segment_files(segment)
+        if not files or not _holds(files[0], updates, by):
+            return 0
+
+        name = files[0]
+        stat = os.stat(name)
+        updated = 0
+        tmp = f"{name}.{os.getpid()}.update"
+        try:
+            with _open_write(tmp, _compression(name)) as out:
+                for record in _records(name):
+                    update = updates.get(record_key(record, by))
+                    if update is not None:
+                        record = {**record, **update}
+                        updated += 1
+                    out.write(_encode(record))
+            _fsync_path(tmp)
+            os.utime(tmp, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(tmp, name)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+        return updated
+
+    def compact(self, by: Sequence[str] = ("title",)) -> CompactResult:
+        """Merge the records of the same issue across the cache and its segments.
+
+        The cache is rotated first, so appends carry on while the segments are compacted: a
+        first pass counts the records of each issue, a second streams them into new segments
+        of up to `max_bytes`, writing each issue once, merged, where its latest record was.
+        The new segments are swapped in ahead of any rotated meanwhile, then the retention
+        limits are applied.
+
+        Args:
+            by: record fields identifying an issue, see `record_key`. Titles carry a UUID.
+
+        Returns:
+            Counts of what was compacted.
+        """
+
+        self._ensure_migrated()
+        merge_shards(self.path)
+        self.rotate()
+
+        result = CompactResult()
+        with self._segments_lock():
+            ids = _segment_ids(self.path)
+            if not ids:
+                result.dropped = self._retain()
+                return result
+
+            remaining: dict[tuple, int] = {}
+            for _, segment in ids:
+                for record in _segment_records(segment):
+                    key = record_key(record, by)
+                    if key is not None:
+                        remaining[key] = remaining.get(key, 0) + 1
+
+            compression = self.compression
+            # [temporary file, latest modification time of the segments it holds records of]
+            parts: list[list] = []
+            pending: dict[tuple, dict[str, Any]] = {}
+            out, size = None, 0
+            try:
+                for _, segment in ids:
+                    files = _segment_files(segment)
+                    segment_mtime = os.stat(files[0]).st_mtime_ns if files else 0
+                    for record in _segment_records(segment):
+                        key = record_key(record, by)
+                        if key is not None and remaining[key] > 1:
+                            remaining[key] -= 1
+                            pending[key] = {**pending.get(key, {}), **record}
+                            result.merged += 1
+                            continue
+                        if key in pending:
+                            record = {**pending.pop(key), **record}
+
+                        if out is None or (self.max_bytes and size >= self.max_bytes):
+                            if out is not None:
+                                out.close()
+                            tmp = f"{self.path}.{os.getpid()}.{len(parts)}.compact"
+                            out, size = _open_write(tmp, compression), 0
+                            parts.append([tmp, 0])
+                        data = _encode(record)
+                        out.write(data)
+                        size += len(data)
+                        parts[-1][1] = max(parts[-1][1], segment_mtime)
+                        result.records += 1
+                if out is not None:
+                    out.close()
+
+                # named after the newest segment compacted, so they sort before later rotations
+                number = ids[-1][0][0]
+                part = max(p for (n, p), _ in ids if n == number) + 1
+                for i, (tmp, mtime) in enumerate(parts):
+                    _fsync_path(tmp)
+                    os.utime(tmp, ns=(mtime, mtime))
+                    suffix = _SUFFIXES[compression]
+                    os.replace(tmp, segment_path(self.path, number, part + i) + suffix)
+            finally:
+                if out is not None:
+                    out.close()
+                for tmp, _ in parts:
+                    if os.path.exists(tmp):
+                        os.remove(tmp)
+
+            # the compacted segments are in place before the old ones go, so rotations keep
+            # numbering after them
+            for _, segment in ids:
+                for name in _segment_files(segment):
+                    os.remove(name)
+
+            result.segments = len(parts)
+            result.dropped = self._retain()
+
+        return result
+
+
+BACKENDS: dict[str, str] = {
+    "jsonl": "bug_buddy.cache:JsonlCacheBackend",
+    "sqlite": "bug_buddy.store:SqliteIssueStore",
+}
+"""Cache backends selectable by name, as `module:Class` paths imported on first use."""
+
+
+def get_backend(name: str = "jsonl", **kwargs: Any) -> CacheBackend:
+    """Build a cache backend by name.
+
+    Args:
+        name: backend name, one of `BACKENDS`.
+        **kwargs: backend options.
+
+    Returns:
+        Cache backend instance.
+    """
+
+    try:
+        module, _, attr = BACKENDS[name].partition(":")
+    except KeyError:
+        raise ValueError(f"Unknown cache backend {name!r}, expected one of {sorted(BACKENDS)}.")
+
+    backend = getattr(importlib.import_module(module), attr)
+    return backend(**kwargs)
@@ -0,0 +1,294 @@
+"""Command line interface for Bug Buddy."""
+
+import argparse
+import json
+import re
+import sys
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+_DURATION = re.compile(r"^(\d+(?:\.\d+)?)([smhdw])$")
+_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def _parse_since(value: str) -> datetime | timedelta:
+    """Parse a relative duration (`30m`, `24h`, `7d`) or an ISO timestamp.
+
+    Args:
+        value: command line value.
+
+    Returns:
+        timedelta back from now, or an absolute datetime.
+    """
+
+    match = _DURATION.match(value)
+    if match:
+        return timedelta(**{_UNITS[match.group(2)]: float(match.group(1))})
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid duration or timestamp: {value!r}")
+
+
+def _parse_seconds(value: str) -> float:
+    """Parse a duration (`30m`, `24h`, `7d`) to seconds.
+
+    Args:
+        value: command line value.
+
+    Returns:
+        Seconds.
+    """
+
+    match = _DURATION.match(value)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid duration: {value!r}")
+    return timedelta(**{_UNITS[match.group(2)]: float(match.group(1))}).total_seconds()
+
+
+def _write(obj: object) -> None:
+    """Write one JSON document per line to stdout."""
+
+    sys.stdout.write(json.dumps(obj, default=str) + "\n")
+
+
+def _cmd_query(args: argparse.Namespace) -> int:
+    """Run `bug-buddy query`."""
+
+    from bug_buddy.store import SqliteIssueStore
+
+    store = SqliteIssueStore(path=args.db) if args.db else SqliteIssueStore()
+
+    if args.count_by_label:
+        _write(store.count_by_label(since=args.since))
+        return 0
+
+    for record in store.query(
+        func_name=args.func_name,
+        label=args.label,
+        commit_sha=args.commit_sha,
+        since=args.since,
+        limit=args.limit,
+    ):
+        if not args.full:
+            record.pop("description", None)
+        _write(record)
+
+    return 0
+
+
+def _cmd_flush(args: argparse.Namespace) -> int:
+    """Run `bug-buddy flush`."""
+
+    from bug_buddy._di_container import BugBuddyInjector
+    from bug_buddy.outbox import Outbox
+
+    di = BugBuddyInjector()
+    logger = di.logger(di.config().log_level)
+    outbox = Outbox(concurrency=args.concurrency, batch_size=args.batch_size, logger=logger)
+    if args.outbox:
+        outbox.path = args.outbox
+    listener = di.listener(logger=logger, outbox=outbox)
+
+    delivered, failed = outbox.replay(listener.deliver_batch)
+    _write({"delivered": delivered, "failed": failed, "pending": len(outbox.pending())})
+
+    return 1 if failed else 0
+
+
+def _cmd_merge(args: argparse.Namespace) -> int:
+    """Run `bug-buddy merge`."""
+
+    from bug_buddy.cache import cache_path, merge_shards
+
+    _write({"merged": merge_shards(args.cache or cache_path())})
+
+    return 0
+
+
+def _cmd_sync(args: argparse.Namespace) -> int:
+    """Run `bug-buddy sync`."""
+
+    import attrs
+
+    from bug_buddy._di_container import BugBuddyInjector
+    from bug_buddy.integration import from_spec
+    from bug_buddy.sync import IssueSync
+
+    di = BugBuddyInjector()
+    logger = di.logger(di.config().log_level)
+    listener = di.listener(integration=from_spec(json.loads(args.integration)), logger=logger)
+    sync = IssueSync(listener, path=args.cursor) if args.cursor else IssueSync(listener)
+
+    result = sync.sync(push=not args.no_push)
+    _write(attrs.asdict(result))
+
+    return 1 if result.failed else 0
+
+
+def _cmd_compact(args: argparse.Namespace) -> int:
+    """Run `bug-buddy compact`, once or every `--every` seconds."""
+
+    import time
+
+    import attrs
+
+    from bug_buddy.cache import JsonlCacheBackend
+
+    kwargs = dict(
+        compression=args.compression,
+        max_bytes=args.max_bytes,
+        max_total_bytes=args.max_total_bytes,
+        max_age=args.max_age,
+    )
+    backend = (
+        JsonlCacheBackend(path=args.cache, **kwargs) if args.cache else JsonlCacheBackend(**kwargs)
+    )
+
+    while True:
+        _write(attrs.asdict(backend.compact()))
+        if args.every is None:
+            return 0
+        sys.stdout.flush()
+        time.sleep(args.every)
+
+
+def _cmd_collector(args: argparse.Namespace) -> int:
+    """Run `bug-buddy collector` until interrupted or terminated."""
+
+    import signal
+    import threading
+
+    from bug_buddy._di_container import BugBuddyInjector
+    from bug_buddy.collector import Collector
+
+    di = BugBuddyInjector()
+    kwargs = dict(
+        update_interval=args.update_interval,
+        batch_size=args.batch_size,
+        logger=di.logger(di.config().log_level),
+    )
+    collector = Collector(path=args.socket, **kwargs) if args.socket else Collector(**kwargs)
+
+    # shutdown waits on the serving loop, so it can't run on the signal handler's thread
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=collector.shutdown).start())
+    try:
+        collector.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    _write(collector.metrics())
+
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+
+    parser = argparse.ArgumentParser(prog="bug-buddy", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    query = commands.add_parser("query", help="query the local SQLite issue store")
+    query.add_argument("--db", help="store path (default: $HOME/.bug_buddy.db)")
+    query.add_argument("--func", dest="func_name", help="decorated function name")
+    query.add_argument("--label", help="issue label, e.g. an exception class name")
+    query.add_argument("--sha", dest="commit_sha", help="CI commit SHA")
+    query.add_argument(
+        "--since", type=_parse_since, help="duration back from now (24h, 7d) or ISO timestamp"
+    )
+    query.add_argument("--limit", type=int, help="maximum number of issues")
+    query.add_argument(
+        "--count-by-label", action="store_true", help="print issue counts per label instead"
+    )
+    query.add_argument("--full", action="store_true", help="include issue descriptions")
+    query.set_defaults(func=_cmd_query)
+
+    flush = commands.add_parser("flush", help="replay reports spooled while offline")
+    flush.add_argument("--outbox", help="outbox directory (default: $HOME/.bug_buddy.outbox)")
+    flush.add_argument(
+        "--concurrency", type=int, default=4, help="batches delivered in parallel (default: 4)"
+    )
+    flush.add_argument(
+        "--batch-size", type=int, default=20, help="reports delivered per batch (default: 20)"
+    )
+    flush.set_defaults(func=_cmd_flush)
+
+    merge = commands.add_parser("merge", help="merge per-process cache shards into the cache")
+    merge.add_argument("--cache", help="cache path (default: $HOME/.bug_buddy.cache)")
+    merge.set_defaults(func=_cmd_merge)
+
+    sync = commands.add_parser("sync", help="sync the local cache with the issue tracker")
+    sync.add_argument(
+        "--integration",
+        metavar="SPEC",
+        required=True,
+        help='integration as JSON, e.g. \'{"type": "GitlabIntegration", "config": '
+        '{"project_id": 1}}\'',
+    )
+    sync.add_argument("--cursor", help="sync cursor file (default: $HOME/.bug_buddy.sync.json)")
+    sync.add_argument(
+        "--no-push", action="store_true", help="only pull, leave spooled and local issues"
+    )
+    sync.set_defaults(func=_cmd_sync)
+
+    compact = commands.add_parser(
+        "compact", help="merge duplicate cache records and apply retention limits"
+    )
+    compact.add_argument("--cache", help="cache path (default: $HOME/.bug_buddy.cache)")
+    compact.add_argument(
+        "--compression",
+        choices=["gzip", "zstd", "none"],
+        default="gzip",
+        help="codec of the compacted segments (default: gzip)",
+    )
+    compact.add_argument(
+        "--max-bytes",
+        type=int,
+        default=64 << 20,
+        help="uncompressed bytes per segment (default: 64 MiB)",
+    )
+    compact.add_argument(
+        "--max-total-bytes", type=int, help="disk cap, oldest segments are dropped past it"
+    )
+    compact.add_argument(
+        "--max-age", type=_parse_seconds, help="drop segments last written longer ago (30d)"
+    )
+    compact.add_argument(
+        "--every", type=_parse_seconds, help="keep compacting at this interval (1h)"
+    )
+    compact.set_defaults(func=_cmd_compact)
+
+    collector = commands.add_parser(
+        "collector", help="record the reports of every process on this host"
+    )
+    collector.add_argument(
+        "--socket", help="socket to listen on (default: $HOME/.bug_buddy.collector.sock)"
+    )
+    collector.add_argument(
+        "--update-interval",
+        type=float,
+        help="seconds between comments on a repeat failure's issue (default: never)",
+    )
+    collector.add_argument(
+        "--batch-size", type=int, default=50, help="reports recorded per batch (default: 50)"
+    )
+    collector.set_defaults(func=_cmd_collector)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point for the `bug-buddy` command.
+
+    Args:
+        argv: command line arguments, defaults to sys.argv.
+
+    Returns:
+        Process exit code.
+    """
+
+    args = _parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,427 @@
+"""Per-host report collector for Bug Buddy."""
+
+import atexit
+import json
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections import deque
+from logging import Logger, getLogger
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+from attrs import define, field
+
+from bug_buddy.cache import _encode, cache_path
+
+if TYPE_CHECKING:
+    from bug_buddy.listener import Listener
+
+COLLECTOR_SOCKET = ".bug_buddy.collector.sock"
+"""Default collector socket name, relative to $HOME."""
+
+MAX_FRAME = 16 << 20
+"""Largest report the collector accepts, in bytes."""
+
+_HEADER = struct.Struct(">I")
+
+
+def frame(report: Mapping[str, Any]) -> bytes:
+    """Frame a report: its compact JSON encoding, prefixed with its length.
+
+    Args:
+        report: `Listener.record_rendered` arguments, or `Listener.record_repeat` ones with
+            `repeat` set, plus the integration spec.
+
+    Returns:
+        Framed report.
+    """
+
+    payload = _encode(report)
+    return _HEADER.pack(len(payload)) + payload
+
+
+@define
+class CollectorClient:
+    """Fire-and-forget connection of one process to the host's collector.
+
+    Sends never block: what the socket can't take right away waits in a bounded buffer, sent
+    ahead of the next report and flushed at interpreter exit. Without a collector listening,
+    or with the buffer full, a send is refused and the report is recorded in-process instead.
+    """
+
+    path: str = field(factory=lambda: cache_path(COLLECTOR_SOCKET))
+    """Collector socket."""
+    max_buffer: int = 1 << 20
+    """Bytes of reports held back while the collector catches up."""
+    retry_interval: float = 5.0
+    """Seconds to wait before trying to connect again after the collector couldn't be reached."""
+    flush_timeout: float = 1.0
+    """Seconds to spend sending held back reports at interpreter exit."""
+    logger: Logger = field()
+    """Logger instance."""
+
+    @logger.default
+    def _logger_default(self) -> Logger:
+        return getLogger(__name__)
+
+    _sock: Optional[socket.socket] = field(default=None, init=False)
+    _pid: Optional[int] = field(default=None, init=False)
+    _buffer: deque = field(factory=deque, init=False)
+    _buffered: int = field(default=0, init=False)
+    _retry_at: float = field(default=0.0, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _atexit: bool = field(default=False, init=False)
+
+    def _close(self) -> None:
+        """Drop the connection and whatever it still had to send."""
+
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        if self._buffer:
+            self.logger.debug("Lost %s reports held for the collector.", len(self._buffer))
+        self._buffer.clear()
+        self._buffered = 0
+
+    def _connect(self) -> bool:
+        """Connect on first use, and again in a forked child. Called with the lock held."""
+
+        if self._pid != os.getpid():
+            # the parent's connection and buffer stay the parent's
+            self._sock = self._pid = None
+            self._buffer.clear()
+            self._buffered = 0
+        if self._sock is not None:
+            return True
+        if time.monotonic() < self._retry_at or not os.path.exists(self.path):
+            return False
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.flush_timeout)
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            self._retry_at = time.monotonic() + self.retry_interval
+            return False
+
+        sock.setblocking(False)
+        self._sock, self._pid = sock, os.getpid()
+        if not self._atexit:
+            atexit.register(self.flush)
+            self._atexit = True
+
+        return True
+
+    def _send_buffered(self) -> None:
+        """Send held back reports until the socket would block. Called with the lock held."""
+
+        while self._buffer:
+            data = self._buffer[0]
+            try:
+                sent = self._sock.send(data)
+            except BlockingIOError:
+                return
+            except OSError:
+                self._close()
+                self._retry_at = time.monotonic() + self.retry_interval
+                return
+            self._buffered -= sent
+            if sent == len(data):
+                self._buffer.popleft()
+            else:
+                self._buffer[0] = data[sent:]
+
+    def available(self) -> bool:
+        """Whether a collector is listening, connecting to it if need be.
+
+        Returns:
+            Whether reports can be sent.
+        """
+
+        with self._lock:
+            return self._connect()
+
+    def send(self, report: Mapping[str, Any]) -> bool:
+        """Send a report without blocking.
+
+        Args:
+            report: `Listener.record_rendered` arguments, or `Listener.record_repeat` ones with
+                `repeat` set, plus the integration spec.
+
+        Returns:
+            Whether the collector will get the report, False to record it in-process.
+        """
+
+        data = memoryview(frame(report))
+        with self._lock:
+            if not self._connect():
+                return False
+            if self._buffer:
+                self._send_buffered()
+            if self._sock is None or self._buffered + len(data) > self.max_buffer:
+                return False
+
+            self._buffer.append(data)
+            self._buffered += len(data)
+            self._send_buffered()
+
+            # a connection lost before the report went out, whole or in part, doesn't count
+            return self._sock is not None
+
+    def flush(self) -> None:
+        """Send held back reports, blocking for up to `flush_timeout` seconds."""
+
+        with self._lock:
+            if self._sock is None or self._pid != os.getpid() or not self._buffer:
+                return
+            try:
+                self._sock.settimeout(self.flush_timeout)
+                while self._buffer:
+                    self._sock.sendall(self._buffer.popleft())
+            except OSError:
+                pass
+            self._close()
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """Reads the framed reports of one client connection onto the collector's queue."""
+
+    def _read(self, size: int) -> Optional[bytes]:
+        chunks = []
+        while size:
+            chunk = self.request.recv(min(size, 1 << 16))
+            if not chunk:
+                return None
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def handle(self) -> None:
+        collector = self.server.collector
+        while True:
+            header = self._read(_HEADER.size)
+            if header is None:
+                return
+            (size,) = _HEADER.unpack(header)
+            if size > MAX_FRAME:
+                collector.logger.warning("Dropped a client sending a %s bytes report.", size)
+                return
+            payload = self._read(size)
+            if payload is None:
+                return
+            try:
+                collector.put(json.loads(payload))
+            except ValueError:
+                collector.logger.warning("Dropped a client sending malformed reports.")
+                return
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    # every process on the host may connect at once, e.g. when a pre-forking server starts
+    request_queue_size = socket.SOMAXCONN
+    collector: "Collector"
+
+
+@define
+class Collector:
+    """Daemon recording the reports of every Bug Buddy process on the host.
+
+    Processes send rendered reports over a Unix socket instead of reporting them themselves.
+    A single worker deduplicates them, writes them to the cache and creates the remote issues
+    of new failures in batches, through one listener, and so one pooled client, per
+    integration. Tracker credentials are read from the collector's environment.
+    """
+
+    path: str = field(factory=lambda: cache_path(COLLECTOR_SOCKET))
+    """Socket to listen on."""
+    update_interval: Optional[float] = None
+    """Minimum seconds between comments on the remote issue of a repeat failure, None to never
+    comment."""
+    batch_size: int = 50
+    """Reports recorded per batch."""
+    maxsize: int = 10000
+    """Reports waiting to be recorded before new ones are dropped."""
+    logger: Logger = field()
+    """Logger instance."""
+
+    @logger.default
+    def _logger_default(self) -> Logger:
+        return getLogger(__name__)
+
+    received: int = field(default=0, init=False)
+    """Reports received."""
+    recorded: int = field(default=0, init=False)
+    """Reports recorded."""
+    failed: int = field(default=0, init=False)
+    """Reports whose recording raised."""
+    dropped: int = field(default=0, init=False)
+    """Reports dropped with the queue full."""
+
+    _queue: queue.Queue = field(init=False)
+    _listeners: dict[str, "Listener"] = field(factory=dict, init=False)
+    _server: Optional[_Server] = field(default=None, init=False)
+    # guards the counters, updated by the connection threads and the worker
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @_queue.default
+    def _queue_default(self) -> queue.Queue:
+        return queue.Queue(maxsize=self.maxsize)
+
+    def metrics(self) -> dict[str, int]:
+        """Snapshot of the collector metrics.
+
+        Returns:
+            Queue depth and report counters.
+        """
+
+        with self._lock:
+            return {
+                "depth": self._queue.qsize(),
+                "received": self.received,
+                "recorded": self.recorded,
+                "failed": self.failed,
+                "dropped": self.dropped,
+            }
+
+    def put(self, report: dict[str, Any]) -> None:
+        """Queue a received report.
+
+        Args:
+            report: `Listener.record_rendered` arguments, or `Listener.record_repeat` ones with
+                `repeat` set, plus the integration spec.
+        """
+
+        try:
+            self._queue.put_nowait(report)
+        except queue.Full:
+            dropped = 1
+        else:
+            dropped = 0
+        with self._lock:
+            self.received += 1
+            self.dropped += dropped
+
+    def listener(self, spec: Optional[dict[str, Any]]) -> "Listener":
+        """Listener of an integration, built on its first report.
+
+        Args:
+            spec: integration spec, None for reports without an integration.
+
+        Returns:
+            Listener instance.
+        """
+
+        key = json.dumps(spec, sort_keys=True)
+        listener = self._listeners.get(key)
+        if listener is None:
+            from bug_buddy._di_container import BugBuddyInjector
+            from bug_buddy.integration import from_spec
+
+            listener = BugBuddyInjector().listener(
+                integration=from_spec(spec) if spec else None,
+                logger=self.logger,
+                update_interval=self.update_interval,
+                # clients applied their policy, and the collector can't report to itself
+                policy=False,
+                collector=False,
+            )
+            self._listeners[key] = listener
+
+        return listener
+
+    def _record(self, reports: list[dict[str, Any]]) -> None:
+        """Record a batch of reports, grouped by integration."""
+
+        groups: dict[str, list[dict[str, Any]]] = {}
+        for report in reports:
+            groups.setdefault(json.dumps(report.get("integration"), sort_keys=True), []).append(
+                report
+            )
+
+        for group in groups.values():
+            try:
+                listener = self.listener(group[0].get("integration"))
+                failures = [
+                    {k: v for k, v in report.items() if k != "integration"} for report in group
+                ]
+                results = listener.record_rendered_batch(failures)
+            except Exception:
+                with self._lock:
+                    self.failed += len(group)
+                self.logger.warning("Could not record %s reports.", len(group), exc_info=True)
+                continue
+            failed = 0
+            for result in results:
+                if isinstance(result, Exception):
+                    failed += 1
+                    self.logger.warning("Could not record a report.", exc_info=result)
+            with self._lock:
+                self.failed += failed
+                self.recorded += len(results) - failed
+
+    def _drain(self) -> None:
+        """Worker loop: record whatever was received, one batch at a time."""
+
+        q = self._queue
+        while True:
+            reports = [q.get()]
+            while len(reports) < self.batch_size:
+                try:
+                    reports.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._record(reports)
+            finally:
+                for _ in reports:
+                    q.task_done()
+
+    def _bind(self) -> _Server:
+        """Listen on the socket, taking it over from a collector that is gone."""
+
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                os.unlink(self.path)
+            else:
+                raise RuntimeError(f"A collector is already listening on {self.path}")
+            finally:
+                probe.close()
+
+        # only this user's processes can report
+        umask = os.umask(0o177)
+        try:
+            server = _Server(self.path, _Handler)
+        finally:
+            os.umask(umask)
+        server.collector = self
+
+        return server
+
+    def serve_forever(self) -> None:
+        """Collect reports until `shutdown` is called, then record those already received."""
+
+        self._server = self._bind()
+        threading.Thread(target=self._drain, name="bug-buddy-collector", daemon=True).start()
+        self.logger.info("Collecting reports on %s", self.path)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self._queue.join()
+
+    def shutdown(self) -> None:
+        """Stop accepting reports, from another thread."""
+
+        if self._server is not None:
+            self._server.shutdown()
@@ -0,0 +1,226 @@
+"""Execution context attached to Bug Buddy reports.
+
+Reports get a cheap snapshot of the process by default. `git_sha`, `container_id` and
+`kubernetes_pod` fork a process or read files, and only run once registered, e.g.
+`register_provider("git", git_sha)`.
+"""
+
+import os
+import platform
+import re
+import socket
+import subprocess
+import threading
+from datetime import datetime, timezone
+from logging import getLogger
+from typing import Callable, Iterable, Optional
+
+from attrs import define, field
+
+# Environment variables to check for CI/execution context
+_CI_ENV_VARS = [
+    # GitHub Actions
+    ("GITHUB_ACTIONS", "GitHub Actions"),
+    ("GITHUB_RUN_ID", "Run ID"),
+    ("GITHUB_RUN_URL", "Run URL"),
+    ("GITHUB_REPOSITORY", "Repository"),
+    ("GITHUB_REF_NAME", "Branch/Tag"),
+    ("GITHUB_SHA", "Commit SHA"),
+    ("GITHUB_ACTOR", "Triggered by"),
+    # GitLab CI
+    ("GITLAB_CI", "GitLab CI"),
+    ("CI_JOB_ID", "Job ID"),
+    ("CI_JOB_URL", "Job URL"),
+    ("CI_PROJECT_PATH", "Project"),
+    ("CI_COMMIT_REF_NAME", "Branch/Tag"),
+    ("CI_COMMIT_SHA", "Commit SHA"),
+]
+
+# the snapshot is rebuilt when any of these, or the working directory, change
+_WATCHED_ENV_VARS = tuple(env_var for env_var, _ in _CI_ENV_VARS) + ("USER", "USERNAME")
+
+_CONTAINER_ID = re.compile(r"\b([0-9a-f]{64})\b")
+_K8S_NAMESPACE_FILE = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
+
+Provider = Callable[[], Optional[Iterable[tuple[str, str]]]]
+"""Callable returning (label, value) rows to add to the report's context."""
+
+_logger = getLogger(__name__)
+
+
+@define
+class _Registered:
+    """A registered context provider."""
+
+    provider: Provider
+    """Provider callable."""
+    once: bool
+    """Whether the provider's rows are computed once per process."""
+    rows: Optional[list[tuple[str, str]]] = field(default=None, init=False)
+    """Rows of a run-once provider, once computed."""
+    pid: Optional[int] = field(default=None, init=False)
+    """Process the rows were computed in."""
+
+
+_PROVIDERS: dict[str, _Registered] = {}
+_LOCK = threading.Lock()
+_SNAPSHOT: Optional[tuple[tuple, list[tuple[str, str]]]] = None
+
+
+def register_provider(name: str, provider: Provider, once: bool = True) -> None:
+    """Register a context provider, replacing any provider of the same name.
+
+    Args:
+        name: provider name.
+        provider: callable returning (label, value) rows, or None to add nothing.
+        once: run the provider once per process and reuse its rows, for values that can't
+            change (and may be expensive to compute). False runs it for every report.
+    """
+
+    with _LOCK:
+        _PROVIDERS[name] = _Registered(provider=provider, once=once)
+
+
+def unregister_provider(name: str) -> None:
+    """Remove a context provider.
+
+    Args:
+        name: provider name.
+    """
+
+    with _LOCK:
+        _PROVIDERS.pop(name, None)
+
+
+def _rows(name: str, registered: _Registered) -> list[tuple[str, str]]:
+    """Rows of a provider, computed at most once per process for run-once providers."""
+
+    if registered.once and registered.pid == os.getpid():
+        return registered.rows
+
+    try:
+        rows = [(str(label), str(value)) for label, value in registered.provider() or ()]
+    except Exception:
+        _logger.debug("Context provider %s failed.", name, exc_info=True)
+        rows = []
+
+    if registered.once:
+        registered.rows, registered.pid = rows, os.getpid()
+    return rows
+
+
+def _environment() -> list[tuple[str, str]]:
+    """Platform, working directory, user and CI context."""
+
+    context = []
+
+    # Machine info
+    # not platform.platform(), which forks `uname -p` for the processor
+    uname = platform.uname()
+    context.append(("Platform", f"{uname.system}-{uname.release}-{uname.machine}"))
+    context.append(("Python", platform.python_version()))
+
+    # Working directory
+    context.append(("Working Directory", os.getcwd()))
+
+    # User (if available)
+    user = os.environ.get("USER") or os.environ.get("USERNAME")
+    if user:
+        context.append(("User", user))
+
+    # CI/environment context
+    for env_var, label in _CI_ENV_VARS:
+        value = os.environ.get(env_var)
+        if value:
+            context.append((label, value))
+
+    return context
+
+
+def snapshot() -> list[tuple[str, str]]:
+    """Context of this process, computed once and refreshed only when the environment changes.
+
+    Returns:
+        List of (label, value) tuples. Provider rows whose label is already present are
+        dropped, so e.g. a CI commit SHA wins over the one read from git.
+    """
+
+    global _SNAPSHOT
+
+    key = (os.getcwd(), tuple(os.environ.get(env_var) for env_var in _WATCHED_ENV_VARS))
+    cached = _SNAPSHOT
+    if cached is None or cached[0] != key:
+        cached = _SNAPSHOT = (key, _environment())
+
+    context = list(cached[1])
+    labels = {label for label, _ in context}
+    with _LOCK:
+        providers = list(_PROVIDERS.items())
+    for name, registered in providers:
+        for label, value in _rows(name, registered):
+            if label not in labels:
+                context.append((label, value))
+                labels.add(label)
+
+    return context
+
+
+def execution_context() -> list[tuple[str, str]]:
+    """Gather execution context information.
+
+    Returns:
+        List of (label, value) tuples for context info, starting with the current time.
+    """
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    return [("Timestamp", timestamp)] + snapshot()
+
+
+def git_sha() -> Optional[list[tuple[str, str]]]:
+    """Commit checked out in the working directory, if it is a git repository."""
+
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=2,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    return [("Commit SHA", result.stdout.strip())]
+
+
+def container_id() -> Optional[list[tuple[str, str]]]:
+    """ID of the container this process runs in, read from its cgroups or mounts."""
+
+    for path in ("/proc/self/cgroup", "/proc/self/mountinfo"):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                match = _CONTAINER_ID.search(f.read())
+        except OSError:
+            continue
+        if match:
+            return [("Container", match.group(1)[:12])]
+
+    return None
+
+
+def kubernetes_pod() -> Optional[list[tuple[str, str]]]:
+    """Namespace and name of the Kubernetes pod this process runs in."""
+
+    if "KUBERNETES_SERVICE_HOST" not in os.environ:
+        return None
+
+    pod = os.environ.get("POD_NAME") or socket.gethostname()
+    namespace = os.environ.get("POD_NAMESPACE")
+    if not namespace:
+        try:
+            with open(_K8S_NAMESPACE_FILE, "r", encoding="utf-8") as f:
+                namespace = f.read().strip()
+        except OSError:
+            pass
+
+    return [("Kubernetes Pod", f"{namespace}/{pod}" if namespace else pod)]
@@ -0,0 +1,303 @@
+"""Failure fingerprints and the local fingerprint index for Bug Buddy."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from typing import Any, Mapping, Optional, Sequence
+
+from attrs import define, field
+
+from bug_buddy.cache import cache_path
+from bug_buddy.store import connect, transaction
+
+INDEX_FILE = ".bug_buddy.index.db"
+"""Default fingerprint index file name, relative to $HOME."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    fingerprint TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    issue TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 1,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    last_reported REAL NOT NULL,
+    PRIMARY KEY (fingerprint, scope)
+);
+"""
+
+
+_MEMO_SIZE = 4096
+"""Fingerprints remembered per process, by exception type and frame positions."""
+
+_MEMO: "OrderedDict[tuple, str]" = OrderedDict()
+_MEMO_LOCK = threading.Lock()
+
+
+def _normalize_filename(filename: str) -> str:
+    """Strip machine specific prefixes so fingerprints match across checkouts and venvs."""
+
+    marker = "site-packages" + os.sep
+    if marker in filename:
+        return filename.rsplit(marker, 1)[1]
+
+    cwd = os.getcwd()
+    if filename.startswith(cwd + os.sep):
+        return os.path.relpath(filename, cwd)
+
+    return filename
+
+
+def fingerprint(exception: type, tb: Sequence[traceback.FrameSummary]) -> str:
+    """Compute a stable fingerprint for a failure.
+
+    The fingerprint covers the exception type and, for each frame of the filtered traceback, the
+    normalized file name, the function name and the whitespace-normalized source line. Line
+    numbers are left out so unrelated edits above a frame don't split a bug in two.
+
+    Within a process the source line at a position doesn't change, so fingerprints are
+    remembered by exception type and the (file, line number, function) of each frame, and a
+    repeat failure is fingerprinted without looking up a single source line.
+
+    Args:
+        exception: exception type.
+        tb: filtered traceback.
+
+    Returns:
+        Hex digest identifying the failure.
+    """
+
+    key = (exception, os.getcwd(), tuple((t.filename, t.lineno, t.name) for t in tb))
+    with _MEMO_LOCK:
+        fp = _MEMO.get(key)
+        if fp is not None:
+            _MEMO.move_to_end(key)
+            return fp
+
+    digest = hashlib.sha1(f"{exception.__module__}.{exception.__qualname__}".encode())
+    for t in tb:
+        line = " ".join((t.line or "").split()) or str(t.lineno)
+        digest.update(f"\0{_normalize_filename(t.filename)}\0{t.name}\0{line}".encode())
+    fp = digest.hexdigest()
+
+    with _MEMO_LOCK:
+        _MEMO[key] = fp
+        if len(_MEMO) > _MEMO_SIZE:
+            _MEMO.popitem(last=False)
+
+    return fp
+
+
+@define
+class Occurrence:
+    """A fingerprint already seen in a scope."""
+
+    fingerprint: str
+    """Failure fingerprint."""
+    scope: str
+    """Integration scope the issue was created in."""
+    issue: dict[str, Any]
+    """Fields of the issue created for the first occurrence."""
+    count: int
+    """Number of occurrences, including this one."""
+    first_seen: float
+    """Epoch seconds of the first occurrence."""
+    last_seen: float
+    """Epoch seconds of the latest occurrence."""
+    last_reported: float
+    """Epoch seconds the remote issue was last created or updated."""
+
+
+@define
+class FingerprintIndex:
+    """Local fingerprint to issue index, shared by every process on the host."""
+
+    path: str = field(factory=lambda: cache_path(INDEX_FILE))
+    """Database path."""
+    pending_ttl: float = 600.0
+    """Seconds after which a fingerprint still waiting for its remote issue is re-claimed by its
+    next occurrence, e.g. when the process creating the issue was killed."""
+
+    def _count(self, conn: Any, fingerprint: str, scope: str, now: float) -> Optional[tuple]:
+        """Count an occurrence of an indexed fingerprint, within a transaction."""
+
+        cur = conn.execute(
+            "UPDATE fingerprints SET count = count + 1, last_seen = ? "
+            "WHERE fingerprint = ? AND scope = ?",
+            (now, fingerprint, scope),
+        )
+        if not cur.rowcount:
+            return None
+        return conn.execute(
+            "SELECT issue, count, first_seen, last_seen, last_reported FROM fingerprints "
+            "WHERE fingerprint = ? AND scope = ?",
+            (fingerprint, scope),
+        ).fetchone()
+
+    def seen(self, fingerprint: str, scope: str) -> Optional[Occurrence]:
+        """Count a repeat occurrence of a fingerprint.
+
+        Args:
+            fingerprint: failure fingerprint.
+            scope: integration scope.
+
+        Returns:
+            The updated occurrence, or None if the fingerprint is new in this scope.
+        """
+
+        with transaction(connect(self.path, _SCHEMA)) as conn:
+            row = self._count(conn, fingerprint, scope, time.time())
+
+        return None if row is None else self._occurrence(fingerprint, scope, row)
+
+    def claim(
+        self, fingerprint: str, scope: str, issue: Mapping[str, Any]
+    ) -> Optional[Occurrence]:
+        """Count a repeat occurrence of a fingerprint, or claim a new one for the issue to create.
+
+        Both happen in one transaction, so of concurrent first occurrences, in any process,
+        exactly one claims the fingerprint. A fingerprint whose remote issue is still pending
+        after `pending_ttl` seconds is claimed again, e.g. when the process creating the issue
+        was killed.
+
+        Args:
+            fingerprint: failure fingerprint.
+            scope: integration scope.
+            issue: fields of the issue the caller is about to create.
+
+        Returns:
+            The updated occurrence of a repeat, None if the caller claimed the fingerprint.
+        """
+
+        now = time.time()
+        encoded = json.dumps(issue, default=str)
+        with transaction(connect(self.path, _SCHEMA)) as conn:
+            # pending rows are written when a new failure is claimed, and never reported on
+            # until their issue is created, so `last_reported` is when they were claimed
+            cur = conn.execute(
+                "UPDATE fingerprints SET issue = ?, count = count + 1, last_seen = ?, "
+                "last_reported = ? WHERE fingerprint = ? AND scope = ? "
+                "AND last_reported <= ? AND json_extract(issue, '$.state') = 'pending'",
+                (encoded, now, now, fingerprint, scope, now - self.pending_ttl),
+            )
+            if cur.rowcount:
+                return None
+            row = self._count(conn, fingerprint, scope, now)
+            if row is None:
+                conn.execute(
+                    "INSERT INTO fingerprints (fingerprint, scope, issue, first_seen, "
+                    "last_seen, last_reported) VALUES (?, ?, ?, ?, ?, ?)",
+                    (fingerprint, scope, encoded, now, now, now),
+                )
+                return None
+
+        return self._occurrence(fingerprint, scope, row)
+
+    def get(self, fingerprint: str, scope: str) -> Optional[Occurrence]:
+        """Look up a fingerprint without counting an occurrence.
+
+        Args:
+            fingerprint: failure fingerprint.
+            scope: integration scope.
+
+        Returns:
+            The latest occurrence, or None if the fingerprint is new in this scope, or would be
+            claimed again by `claim`.
+        """
+
+        conn = connect(self.path, _SCHEMA)
+        row = conn.execute(
+            "SELECT issue, count, first_seen, last_seen, last_reported FROM fingerprints "
+            "WHERE fingerprint = ? AND scope = ?",
+            (fingerprint, scope),
+        ).fetchone()
+        if row is None:
+            return None
+        occurrence = self._occurrence(fingerprint, scope, row)
+        if (
+            occurrence.issue.get("state") == "pending"
+            and occurrence.last_reported <= time.time() - self.pending_ttl
+        ):
+            return None
+
+        return occurrence
+
+    @staticmethod
+    def _occurrence(fingerprint: str, scope: str, row: tuple) -> Occurrence:
+        """Occurrence of a fingerprint from its index row."""
+
+        issue, count, first_seen, last_seen, last_reported = row
+        return Occurrence(
+            fingerprint=fingerprint,
+            scope=scope,
+            issue=json.loads(issue),
+            count=count,
+            first_seen=first_seen,
+            last_seen=last_seen,
+            last_reported=last_reported,
+        )
+
+    def add(
+        self, fingerprint: str, scope: str, issue: Mapping[str, Any], replace: bool = False
+    ) -> None:
+        """Index the issue created for the first occurrence of a fingerprint.
+
+        Args:
+            fingerprint: failure fingerprint.
+            scope: integration scope.
+            issue: issue fields.
+            replace: point an indexed fingerprint at this issue instead, e.g. once a queued
+                report is delivered.
+        """
+
+        now = time.time()
+        on_conflict = "DO UPDATE SET issue = excluded.issue" if replace else "DO NOTHING"
+        with transaction(connect(self.path, _SCHEMA)) as conn:
+            conn.execute(
+                "INSERT INTO fingerprints (fingerprint, scope, issue, first_seen, last_seen, "
+                "last_reported) VALUES (?, ?, ?, ?, ?, ?) "
+                f"ON CONFLICT (fingerprint, scope) {on_conflict}",
+                (fingerprint, scope, json.dumps(issue, default=str), now, now, now),
+            )
+
+    def forget(self, fingerprint: str, scope: str) -> None:
+        """Drop a fingerprint so its next occurrence creates an issue again.
+
+        Args:
+            fingerprint: failure fingerprint.
+            scope: integration scope.
+        """
+
+        with transaction(connect(self.path, _SCHEMA)) as conn:
+            conn.execute(
+                "DELETE FROM fingerprints WHERE fingerprint = ? AND scope = ?",
+                (fingerprint, scope),
+            )
+
+    def claim_update(self, fingerprint: str, scope: str, interval: float) -> bool:
+        """Claim the right to update the remote issue, at most once per interval.
+
+        The claim is a single conditional update, so concurrent processes never both win.
+
+        Args:
+            fingerprint: failure fingerprint.
+            scope: integration scope.
+            interval: minimum seconds between remote updates.
+
+        Returns:
+            Whether the caller should update the remote issue now.
+        """
+
+        now = time.time()
+        with transaction(connect(self.path, _SCHEMA)) as conn:
+            cur = conn.execute(
+                "UPDATE fingerprints SET last_reported = ? "
+                "WHERE fingerprint = ? AND scope = ? AND last_reported <= ?",
+                (now, fingerprint, scope, now - interval),
+            )
+
+        return bool(cur.rowcount)
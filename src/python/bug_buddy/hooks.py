@@ -0,0 +1,419 @@
+"""Process wide exception capture for Bug Buddy."""
+
+import inspect
+import sys
+import threading
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Sequence, Union
+
+# like the decorator, everything needed to report a failure is imported on the first failure
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+    from logging import Logger
+
+    from bug_buddy._frames import Frame
+    from bug_buddy.cache import CacheBackend
+    from bug_buddy.integration import Integration
+    from bug_buddy.listener import Listener
+    from bug_buddy.outbox import Outbox
+    from bug_buddy.policy import ReportPolicy
+    from bug_buddy.reporter import BackgroundReporter
+
+
+class _Installed(NamedTuple):
+    """Listener configuration and the hooks installed over."""
+
+    config: dict[str, Any]
+    """Listener arguments, injected on the first failure."""
+    excepthook: Callable[..., Any]
+    """Previous `sys.excepthook`."""
+    threading_excepthook: Callable[..., Any]
+    """Previous `threading.excepthook`."""
+
+
+_INSTALLED: Optional[_Installed] = None
+_LISTENER: Optional[tuple["Logger", "Listener"]] = None
+_LOCK = threading.Lock()
+# exception handler each hooked loop had before, restored by `uninstall`
+_LOOPS: "weakref.WeakKeyDictionary[AbstractEventLoop, Optional[Callable]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _listen() -> Optional[tuple["Logger", "Listener"]]:
+    """Inject the shared logger and listener, once and only once something fails."""
+
+    global _LISTENER
+
+    installed = _INSTALLED
+    if installed is None:
+        return None
+    if _LISTENER is not None:
+        return _LISTENER
+
+    with _LOCK:
+        if _LISTENER is None:
+            from bug_buddy._di_container import BugBuddyInjector
+
+            di = BugBuddyInjector()
+            config = di.config()
+            logger = di.logger(config.log_level)
+            listener = di.listener(logger=logger, **installed.config)
+            logger.debug("listening for " + listener.mascot)
+            _LISTENER = logger, listener
+
+    return _LISTENER
+
+
+@lru_cache(maxsize=256)
+def _cached_source(fn: Callable) -> Optional[str]:
+    try:
+        return inspect.getsource(fn)
+    except (OSError, TypeError):
+        return None
+
+
+def _source(fn: Callable) -> Optional[str]:
+    """Source of a failed callable, read once per callable."""
+
+    try:
+        return _cached_source(fn)
+    except TypeError:
+        # unhashable callable
+        return None
+
+
+def report(
+    e: BaseException,
+    func_name: Optional[str] = None,
+    frames: Optional[Sequence["Frame"]] = None,
+    fn: Optional[Callable] = None,
+) -> None:
+    """Record a failure with the installed listener, never raising.
+
+    Does nothing unless `install` was called. Exceptions that aren't `Exception`s, e.g.
+    KeyboardInterrupt or SystemExit, are not failures and aren't recorded.
+
+    Args:
+        e: the exception.
+        func_name: name of the failed function, defaults to the innermost frame's.
+        frames: captured frames, defaults to a walk of the exception's traceback.
+        fn: failed callable, whose source is added to the report.
+    """
+
+    if not isinstance(e, Exception):
+        return
+    listened = _listen()
+    if listened is None:
+        return
+
+    logger, listener = listened
+    try:
+        from bug_buddy._frames import walk
+
+        trace = walk(e.__traceback__) if frames is None else frames
+        if func_name is None:
+            func_name = trace[-1].name if trace else type(e).__name__
+        if not listener.admit(trace, type(e), func_name):
+            return
+        issue = listener.record(
+            tb=trace,
+            exception=type(e),
+            func_name=func_name,
+            func_source=_source(fn) if fn is not None else None,
+            exc=e,
+        )
+    except Exception:
+        logger.warning("Could not report " + listener.mascot, exc_info=True)
+    else:
+        listener.detected(issue)
+
+
+def _excepthook(exc_type: type, exc: BaseException, tb: Any) -> None:
+    """`sys.excepthook` reporting uncaught exceptions, then chaining to the previous hook."""
+
+    report(exc)
+    installed = _INSTALLED
+    (installed.excepthook if installed else sys.__excepthook__)(exc_type, exc, tb)
+
+
+def _threading_excepthook(args: Any) -> None:
+    """`threading.excepthook` reporting uncaught exceptions, then chaining to the previous hook."""
+
+    if args.exc_value is not None:
+        report(args.exc_value)
+    installed = _INSTALLED
+    (installed.threading_excepthook if installed else threading.__excepthook__)(args)
+
+
+def _loop_exception_handler(loop: "AbstractEventLoop", context: dict[str, Any]) -> None:
+    """Asyncio exception handler reporting unretrieved task and callback exceptions."""
+
+    e = context.get("exception")
+    if e is not None:
+        func_name = None
+        task = context.get("task") or context.get("future")
+        coro = getattr(task, "get_coro", lambda: None)()
+        if coro is not None:
+            func_name = getattr(coro, "__name__", None)
+        report(e, func_name=func_name)
+
+    previous = _LOOPS.get(loop)
+    if previous is not None:
+        previous(loop, context)
+    else:
+        loop.default_exception_handler(context)
+
+
+def _hook_loop(loop: "AbstractEventLoop") -> None:
+    """Chain the loop's exception handler into the shared listener."""
+
+    if loop in _LOOPS:
+        return
+    _LOOPS[loop] = loop.get_exception_handler()
+    loop.set_exception_handler(_loop_exception_handler)
+
+
+@lru_cache(maxsize=None)
+def _policy_type() -> type:
+    """Event loop policy hooking the loops of the policy it wraps, defined once asyncio is used."""
+
+    import asyncio
+
+    class _HookingPolicy(asyncio.AbstractEventLoopPolicy):
+        def __init__(self, policy: asyncio.AbstractEventLoopPolicy) -> None:
+            self.policy = policy
+
+        def _hooked(self, loop: "AbstractEventLoop") -> "AbstractEventLoop":
+            if _INSTALLED is not None:
+                _hook_loop(loop)
+            return loop
+
+        def get_event_loop(self) -> "AbstractEventLoop":
+            return self._hooked(self.policy.get_event_loop())
+
+        def set_event_loop(self, loop: Optional["AbstractEventLoop"]) -> None:
+            self.policy.set_event_loop(loop)
+
+        def new_event_loop(self) -> "AbstractEventLoop":
+            return self._hooked(self.policy.new_event_loop())
+
+        # child watchers are deprecated, and gone in Python 3.14
+        if hasattr(asyncio.AbstractEventLoopPolicy, "get_child_watcher"):
+
+            def get_child_watcher(self) -> Any:
+                return self.policy.get_child_watcher()
+
+            def set_child_watcher(self, watcher: Any) -> None:
+                self.policy.set_child_watcher(watcher)
+
+    return _HookingPolicy
+
+
+def _hook_new_loops() -> None:
+    """Hook every loop created from now on, e.g. by `asyncio.run`, through the loop policy."""
+
+    import asyncio
+
+    # not under _LOCK: asyncio may be first imported while a listener is injected
+    policy = asyncio.get_event_loop_policy()
+    if _INSTALLED is not None and not isinstance(policy, _policy_type()):
+        asyncio.set_event_loop_policy(_policy_type()(policy))
+
+
+class _AsyncioFinder:
+    """Meta path finder hooking new loops as soon as asyncio is imported, without importing it.
+
+    Removes itself on the first import of asyncio, which is then loaded by the path finder and
+    hooked right after it has run.
+    """
+
+    def find_spec(self, name: str, path: Any = None, target: Any = None) -> Any:
+        if name != "asyncio":
+            return None
+        _unwatch_asyncio()
+
+        from importlib.machinery import PathFinder
+
+        spec = PathFinder.find_spec(name, path)
+        if spec is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def exec_and_hook(module: Any) -> None:
+            exec_module(module)
+            _hook_new_loops()
+
+        # each find creates its own loader, this one only loads asyncio
+        spec.loader.exec_module = exec_and_hook
+        return spec
+
+
+_ASYNCIO_FINDER = _AsyncioFinder()
+
+
+def _unwatch_asyncio() -> None:
+    """Stop waiting for asyncio to be imported."""
+
+    try:
+        sys.meta_path.remove(_ASYNCIO_FINDER)
+    except ValueError:
+        pass
+
+
+def install(
+    integration: Optional["Integration"] = None,
+    cache: Optional["CacheBackend"] = None,
+    dedup: bool = True,
+    update_interval: Optional[float] = None,
+    reporter: Optional["BackgroundReporter"] = None,
+    outbox: Union[bool, "Outbox"] = True,
+    policy: Union[bool, "ReportPolicy"] = True,
+    loop: Optional["AbstractEventLoop"] = None,
+) -> None:
+    """Report every uncaught exception of the process, without decorating anything.
+
+    Chains into `sys.excepthook`, `threading.excepthook` and the exception handler of asyncio
+    loops: the given one, the running loop when called from a coroutine, and every loop created
+    afterwards, e.g. by `asyncio.run`, through a wrapper around the event loop policy. Install
+    after setting another policy, e.g. uvloop's, so its loops are hooked too. Also enables
+    `ReportingThreadPoolExecutor` and `ReportingProcessPoolExecutor`. They all report through
+    one listener, injected on the first failure, so nothing runs until something fails.
+    Installing again replaces the listener configuration.
+
+    Args:
+        integration: Issue tracker integration configuration, see `bug_buddy`.
+        cache: Local cache backend, see `bug_buddy`.
+        dedup: Create one issue per unique failure fingerprint, see `bug_buddy`.
+        update_interval: Seconds between comments on a repeat failure's issue, see `bug_buddy`.
+        reporter: Background queue to create remote issues from, see `bug_buddy`.
+        outbox: Spool reports the tracker can't take, see `bug_buddy`.
+        policy: Rate limits and sampling applied before a failure is recorded, see `bug_buddy`.
+        loop: Asyncio loop to hook now, defaults to the running loop, if any.
+    """
+
+    global _INSTALLED, _LISTENER
+
+    config = dict(
+        integration=integration,
+        cache=cache,
+        dedup=dedup,
+        update_interval=update_interval,
+        reporter=reporter,
+        outbox=outbox,
+        policy=policy,
+    )
+    with _LOCK:
+        if _INSTALLED is None:
+            _INSTALLED = _Installed(config, sys.excepthook, threading.excepthook)
+            sys.excepthook = _excepthook
+            threading.excepthook = _threading_excepthook
+        else:
+            _INSTALLED = _INSTALLED._replace(config=config)
+        _LISTENER = None
+
+    # asyncio is only imported by programs using it
+    if "asyncio" in sys.modules:
+        _hook_new_loops()
+        if loop is None:
+            try:
+                loop = sys.modules["asyncio"].get_running_loop()
+            except RuntimeError:
+                loop = None
+    elif _ASYNCIO_FINDER not in sys.meta_path:
+        sys.meta_path.insert(0, _ASYNCIO_FINDER)
+    if loop is not None:
+        _hook_loop(loop)
+
+
+def uninstall() -> None:
+    """Restore the hooks `install` chained into and stop reporting."""
+
+    global _INSTALLED, _LISTENER
+
+    with _LOCK:
+        installed = _INSTALLED
+        if installed is None:
+            return
+        # left alone if something was installed over ours since
+        if sys.excepthook is _excepthook:
+            sys.excepthook = installed.excepthook
+        if threading.excepthook is _threading_excepthook:
+            threading.excepthook = installed.threading_excepthook
+        for loop, previous in list(_LOOPS.items()):
+            if loop.get_exception_handler() is _loop_exception_handler:
+                loop.set_exception_handler(previous)
+        _LOOPS.clear()
+        _unwatch_asyncio()
+        if "asyncio" in sys.modules:
+            asyncio = sys.modules["asyncio"]
+            policy = asyncio.get_event_loop_policy()
+            if isinstance(policy, _policy_type()):
+                asyncio.set_event_loop_policy(policy.policy)
+        _INSTALLED = _LISTENER = None
+
+
+def _name(fn: Callable) -> str:
+    return getattr(fn, "__name__", None) or type(fn).__name__
+
+
+def _run(fn: Callable, args: tuple, kwargs: dict[str, Any]) -> Any:
+    """Run a task in a worker thread, reporting its failure from there."""
+
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        report(e, func_name=_name(fn), fn=fn)
+        raise
+
+
+def _run_remote(fn: Callable, args: tuple, kwargs: dict[str, Any]) -> Any:
+    """Run a task in a worker process, sending its frames back with the exception."""
+
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        from bug_buddy._frames import Frame, walk
+
+        # the traceback doesn't survive pickling, the frames do, without their globals
+        e._bug_buddy_frames = [Frame(f.filename, f.lineno, f.name) for f in walk(e.__traceback__)]
+        raise
+
+
+def _settled(fn: Callable, future: Future) -> None:
+    """Report the failure of a worker process' task in the parent."""
+
+    if future.cancelled():
+        return
+    e = future.exception()
+    if e is not None:
+        report(e, func_name=_name(fn), frames=getattr(e, "_bug_buddy_frames", None), fn=fn)
+
+
+class ReportingThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor reporting the failed tasks of its futures to the installed listener.
+
+    Failures are reported from the worker thread before the future fails, with the task's full
+    traceback. Successful tasks only pay for a try block. Nothing is reported unless `install`
+    was called.
+    """
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        return super().submit(_run, fn, args, kwargs)
+
+
+class ReportingProcessPoolExecutor(ProcessPoolExecutor):
+    """ProcessPoolExecutor reporting the failed tasks of its futures to the installed listener.
+
+    Worker processes send the failed task's frames back with the exception, and the failure
+    is reported in this process, by the executor's management thread, so workers need no
+    listener of their own. Use a `reporter` to keep tracker calls off that thread. Nothing is
+    reported unless `install` was called.
+    """
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        future = super().submit(_run_remote, fn, args, kwargs)
+        future.add_done_callback(partial(_settled, fn))
+        return future
@@ -1,15 +1,89 @@
 """Integration configurations for Bug Buddy."""
 
+import dataclasses
+import os
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from logging import Logger
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Sequence, Union
+
+from bug_buddy._http import DEFAULT_TIMEOUT, RetryPolicy
+
+# the API clients, and the HTTP and validation libraries behind them, are imported when the
+# first client is built, so configuring an integration stays cheap at import time
+if TYPE_CHECKING:
+    import asyncio
+    from logging import Logger
+
+    from bug_buddy._labels import LabelCache
+    from bug_buddy.issue import (
+        AsyncGithubIssuesClient,
+        AsyncGitlabIssuesClient,
+        AsyncLinearIssuesClient,
+        GithubIssuesClient,
+        GitlabIssuesClient,
+        Issue,
+        LinearIssuesClient,
+    )
+
+# one client per integration configuration for the life of the process, dropped in forked
+# children so they don't share pooled sockets with the parent
+_CLIENTS: dict[str, Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+os.register_at_fork(after_in_child=_CLIENTS.clear)
+
+# async clients are bound to the loop they were created on: one per (loop, integration)
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+BATCH_CONCURRENCY = 4
+"""Issues created in parallel by `create_issues` on trackers without a batch API."""
+
+
+def _timeout(value: Any) -> tuple[float, float]:
+    """Coerce a (connect, read) pair, e.g. one read back from JSON, to a tuple of floats."""
+
+    connect, read = value
+    return float(connect), float(read)
+
+
+@dataclasses.dataclass
+class IssueDraft:
+    """An issue to create, as one item of a `create_issues` batch."""
+
+    description: str
+    """Issue description."""
+    labels: list[str]
+    """Issue labels."""
+    func_name: str
+    """Name of the decorated function."""
+    title: Optional[str] = None
+    """Issue title, generated from func_name when not given."""
+    idempotency_key: Optional[str] = None
+    """UUID identifying the report, see `Integration.create_issue`."""
+
+
+@dataclasses.dataclass
+class BatchResult:
+    """Outcome of one item of a `create_issues` batch."""
+
+    draft: IssueDraft
+    """Issue that was to be created."""
+    issue: Optional["Issue"] = None
+    """Created issue, None if it could not be created."""
+    error: Optional[Exception] = None
+    """Why the issue could not be created."""
 
-from pydantic.dataclasses import dataclass as pydantic_dataclass
-
-from bug_buddy.issue import GitlabIssuesClient, Issue, LinearIssuesClient
+    @property
+    def ok(self) -> bool:
+        """Whether the issue was created."""
+        return self.error is None
 
 
-@pydantic_dataclass
+@dataclasses.dataclass
 class Integration(ABC):
     """Base class for issue tracker integrations."""
 
@@ -19,10 +93,47 @@ class Integration(ABC):
         """Name of the integration."""
         ...
 
+    @property
     @abstractmethod
-    def get_client(self, logger: Logger) -> Union[GitlabIssuesClient, LinearIssuesClient]:
+    def scope(self) -> str:
+        """Key identifying where issues are created, used to scope deduplication."""
+        ...
+
+    def get_client(
+        self, logger: "Logger"
+    ) -> "Union[GithubIssuesClient, GitlabIssuesClient, LinearIssuesClient]":
         """Get the API client for this integration.
 
+        Clients are built once per integration configuration and reused for the life of the
+        process, so every report shares one keep-alive connection pool.
+
+        Args:
+            logger: Logger instance.
+
+        Returns:
+            API client instance.
+        """
+
+        key = repr(self)
+        client = _CLIENTS.get(key)
+        if client is None:
+            with _CLIENTS_LOCK:
+                client = _CLIENTS.get(key)
+                if client is None:
+                    client = _CLIENTS[key] = self._client(logger)
+        return client
+
+    def _url(self) -> dict[str, str]:
+        """Client `url` argument, when the integration overrides the tracker's API URL."""
+        url = getattr(self, "url", None)
+        return {"url": url} if url else {}
+
+    @abstractmethod
+    def _client(
+        self, logger: "Logger"
+    ) -> "Union[GithubIssuesClient, GitlabIssuesClient, LinearIssuesClient]":
+        """Build the API client for this integration.
+
         Args:
             logger: Logger instance.
 
@@ -34,11 +145,13 @@ class Integration(ABC):
     @abstractmethod
     def create_issue(
         self,
-        client: Union[GitlabIssuesClient, LinearIssuesClient],
+        client: "Union[GithubIssuesClient, GitlabIssuesClient, LinearIssuesClient]",
         description: str,
         labels: list[str],
         func_name: str,
-    ) -> Issue:
+        title: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> "Issue":
         """Create an issue using the integration's client.
 
         Args:
@@ -46,27 +159,224 @@ class Integration(ABC):
             description: Issue description.
             labels: Issue labels.
             func_name: Name of the decorated function.
+            title: Issue title, generated from func_name when not given.
+            idempotency_key: UUID identifying the report, so a retried or replayed create
+                doesn't duplicate the issue where the tracker supports it.
+
+        Returns:
+            Created issue.
+        """
+        ...
+
+    def _create(self, client: Any, draft: IssueDraft) -> BatchResult:
+        """Create one issue of a batch, capturing its error."""
+
+        try:
+            issue = self.create_issue(client=client, **dataclasses.asdict(draft))
+        except Exception as e:
+            return BatchResult(draft=draft, error=e)
+        return BatchResult(draft=draft, issue=issue)
+
+    def create_issues(
+        self,
+        client: "Union[GithubIssuesClient, GitlabIssuesClient, LinearIssuesClient]",
+        batch: Sequence[IssueDraft],
+        max_workers: Optional[int] = None,
+    ) -> list[BatchResult]:
+        """Create a batch of issues.
+
+        One failed item never fails the batch. Trackers without a batch API create the issues
+        on a bounded thread pool over the client's shared connection pool.
+
+        Args:
+            client: API client instance.
+            batch: issues to create.
+            max_workers: issues created in parallel, defaults to `BATCH_CONCURRENCY`.
+
+        Returns:
+            One result per issue, in the order of the batch.
+        """
+
+        if len(batch) <= 1:
+            return [self._create(client, draft) for draft in batch]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(batch), max_workers or BATCH_CONCURRENCY),
+            thread_name_prefix="bug-buddy-batch",
+        ) as pool:
+            return list(pool.map(lambda draft: self._create(client, draft), batch))
+
+    @abstractmethod
+    def comment_issue(
+        self,
+        client: "Union[GithubIssuesClient, GitlabIssuesClient, LinearIssuesClient]",
+        issue: "Issue",
+        body: str,
+    ) -> None:
+        """Comment on an issue previously created by this integration.
+
+        Args:
+            client: API client instance.
+            issue: Issue to comment on.
+            body: Comment body.
+        """
+        ...
+
+    def find_issue(
+        self,
+        client: "Union[GithubIssuesClient, GitlabIssuesClient, LinearIssuesClient]",
+        title: str,
+    ) -> Optional["Issue"]:
+        """Find an issue created by an earlier attempt at a report, for trackers without
+        idempotency keys.
+
+        Args:
+            client: API client instance.
+            title: Issue title.
+
+        Returns:
+            The issue, or None if there is none (or the tracker honours idempotency keys).
+        """
+        return None
+
+    @abstractmethod
+    def updated_issues(
+        self,
+        client: "Union[GithubIssuesClient, GitlabIssuesClient, LinearIssuesClient]",
+        since: Optional[str] = None,
+    ) -> Iterator["Issue"]:
+        """Stream the Bug Buddy issues updated on the tracker since a time, for `sync`.
+
+        Args:
+            client: API client instance.
+            since: ISO timestamp of the last update already seen, None for every issue.
+
+        Yields:
+            Updated issues.
+        """
+        ...
+
+    def spec(self) -> dict[str, Any]:
+        """Serialize the configuration, so a spooled report can be replayed elsewhere.
+
+        Returns:
+            JSON serializable integration spec, see `from_spec`.
+        """
+        return {"type": type(self).__name__, "config": dataclasses.asdict(self)}
+
+    def get_async_client(
+        self, logger: "Logger"
+    ) -> "Union[AsyncGitlabIssuesClient, AsyncGithubIssuesClient, AsyncLinearIssuesClient]":
+        """Get the non-blocking API client for this integration on the running event loop.
+
+        One client, and so one connection pool, is shared by every task on a loop.
+
+        Args:
+            logger: Logger instance.
+
+        Returns:
+            Async API client instance.
+        """
+
+        import asyncio
+
+        clients = _ASYNC_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(repr(self))
+        if client is None:
+            client = clients[repr(self)] = self._async_client(logger)
+        return client
+
+    @abstractmethod
+    def _async_client(
+        self, logger: "Logger"
+    ) -> "Union[AsyncGitlabIssuesClient, AsyncGithubIssuesClient, AsyncLinearIssuesClient]":
+        """Build a non-blocking API client.
+
+        Args:
+            logger: Logger instance.
+
+        Returns:
+            Async API client instance.
+        """
+        ...
+
+    @abstractmethod
+    async def acreate_issue(
+        self,
+        client: "Union[AsyncGitlabIssuesClient, AsyncGithubIssuesClient, AsyncLinearIssuesClient]",
+        description: str,
+        labels: list[str],
+        func_name: str,
+        title: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> "Issue":
+        """Create an issue using the integration's async client.
+
+        Args:
+            client: Async API client instance.
+            description: Issue description.
+            labels: Issue labels.
+            func_name: Name of the decorated function.
+            title: Issue title, generated from func_name when not given.
+            idempotency_key: UUID identifying the report, so a retried or replayed create
+                doesn't duplicate the issue where the tracker supports it.
 
         Returns:
             Created issue.
         """
         ...
 
+    @abstractmethod
+    async def acomment_issue(
+        self,
+        client: "Union[AsyncGitlabIssuesClient, AsyncGithubIssuesClient, AsyncLinearIssuesClient]",
+        issue: "Issue",
+        body: str,
+    ) -> None:
+        """Comment on an issue using the integration's async client.
+
+        Args:
+            client: Async API client instance.
+            issue: Issue to comment on.
+            body: Comment body.
+        """
+        ...
+
 
-@pydantic_dataclass
+@dataclasses.dataclass
 class GitlabIntegration(Integration):
     """GitLab integration configuration."""
 
     project_id: int
     """GitLab project ID."""
 
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    """(connect, read) timeouts in seconds for GitLab API requests."""
+
+    max_retries: int = 3
+    """Retries for connection errors, 429 and 5xx responses, with exponential backoff."""
+
+    url: Optional[str] = None
+    """GitLab API URL, e.g. "https://gitlab.example.com/api/v4" for a self-managed instance.
+    None for gitlab.com."""
+
+    def __post_init__(self) -> None:
+        self.project_id = int(self.project_id)
+        self.timeout = _timeout(self.timeout)
+        self.max_retries = int(self.max_retries)
+
     @property
     def name(self) -> str:
         """Name of the integration."""
         return "GitLab"
 
-    def get_client(self, logger: Logger) -> GitlabIssuesClient:
-        """Get the GitLab API client.
+    @property
+    def scope(self) -> str:
+        """Key identifying where issues are created."""
+        return f"gitlab:{self.project_id}"
+
+    def _client(self, logger: "Logger") -> "GitlabIssuesClient":
+        """Build the GitLab API client.
 
         Args:
             logger: Logger instance.
@@ -74,15 +384,24 @@ class GitlabIntegration(Integration):
         Returns:
             GitLab API client instance.
         """
-        return GitlabIssuesClient(logger=logger)
+        from bug_buddy.issue import GitlabIssuesClient
+
+        return GitlabIssuesClient(
+            logger=logger,
+            timeout=self.timeout,
+            retry=RetryPolicy(max_retries=self.max_retries),
+            **self._url(),
+        )
 
     def create_issue(
         self,
-        client: GitlabIssuesClient,
+        client: "GitlabIssuesClient",
         description: str,
         labels: list[str],
         func_name: str,
-    ) -> Issue:
+        title: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> "Issue":
         """Create a GitLab issue.
 
         Args:
@@ -90,6 +409,9 @@ class GitlabIntegration(Integration):
             description: Issue description.
             labels: Issue labels.
             func_name: Name of the decorated function.
+            title: Issue title, generated from func_name when not given.
+            idempotency_key: UUID identifying the report, so a retried or replayed create
+                doesn't duplicate the issue where the tracker supports it.
 
         Returns:
             Created issue.
@@ -99,23 +421,142 @@ class GitlabIntegration(Integration):
             description=description,
             labels=labels,
             func_name=func_name,
+            title=title,
+        )
+
+    def find_issue(self, client: "GitlabIssuesClient", title: str) -> Optional["Issue"]:
+        """Find a GitLab issue by its exact title.
+
+        Args:
+            client: GitLab API client instance.
+            title: Issue title.
+
+        Returns:
+            The issue, or None if there is none.
+        """
+        return client.find_issue(project_id=self.project_id, title=title)
+
+    def comment_issue(self, client: "GitlabIssuesClient", issue: "Issue", body: str) -> None:
+        """Comment on a GitLab issue.
+
+        Args:
+            client: GitLab API client instance.
+            issue: Issue to comment on.
+            body: Comment body.
+        """
+        client.comment_issue(project_id=self.project_id, issue_iid=issue.remote_id, body=body)
+
+    def updated_issues(
+        self, client: "GitlabIssuesClient", since: Optional[str] = None
+    ) -> Iterator["Issue"]:
+        """Stream the GitLab issues updated since a time.
+
+        Args:
+            client: GitLab API client instance.
+            since: ISO timestamp of the last update already seen, None for every issue.
+
+        Yields:
+            Updated issues.
+        """
+        return client.get_issues(project_id=self.project_id, updated_after=since)
+
+    def _async_client(self, logger: "Logger") -> "AsyncGitlabIssuesClient":
+        """Build the non-blocking GitLab API client.
+
+        Args:
+            logger: Logger instance.
+
+        Returns:
+            Async GitLab API client instance.
+        """
+        from bug_buddy.issue import AsyncGitlabIssuesClient
+
+        return AsyncGitlabIssuesClient(
+            logger=logger,
+            timeout=self.timeout,
+            retry=RetryPolicy(max_retries=self.max_retries),
+            **self._url(),
+        )
+
+    async def acreate_issue(
+        self,
+        client: "AsyncGitlabIssuesClient",
+        description: str,
+        labels: list[str],
+        func_name: str,
+        title: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> "Issue":
+        """Create a GitLab issue without blocking the event loop.
+
+        Args:
+            client: Async GitLab API client instance.
+            description: Issue description.
+            labels: Issue labels.
+            func_name: Name of the decorated function.
+            title: Issue title, generated from func_name when not given.
+            idempotency_key: UUID identifying the report, so a retried or replayed create
+                doesn't duplicate the issue where the tracker supports it.
+
+        Returns:
+            Created issue.
+        """
+        return await client.create_issue(
+            project_id=self.project_id,
+            description=description,
+            labels=labels,
+            func_name=func_name,
+            title=title,
         )
 
+    async def acomment_issue(
+        self, client: "AsyncGitlabIssuesClient", issue: "Issue", body: str
+    ) -> None:
+        """Comment on a GitLab issue without blocking the event loop.
+
+        Args:
+            client: Async GitLab API client instance.
+            issue: Issue to comment on.
+            body: Comment body.
+        """
+        await client.comment_issue(
+            project_id=self.project_id, issue_iid=issue.remote_id, body=body
+        )
 
-@pydantic_dataclass
+
+@dataclasses.dataclass
 class GithubIntegration(Integration):
     """GitHub integration configuration."""
 
     repo: str
     """GitHub repository in 'owner/repo' format."""
 
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    """(connect, read) timeouts in seconds for GitHub API requests."""
+
+    max_retries: int = 3
+    """Retries for connection errors, 429 and 5xx responses, with exponential backoff."""
+
+    url: Optional[str] = None
+    """GitHub REST API URL, e.g. "https://github.example.com/api/v3" for GitHub Enterprise
+    Server. None for github.com."""
+
+    def __post_init__(self) -> None:
+        self.timeout = _timeout(self.timeout)
+        self.max_retries = int(self.max_retries)
+
     @property
     def name(self) -> str:
         """Name of the integration."""
         return "GitHub"
 
-    def get_client(self, logger: Logger) -> None:
-        """Get the GitHub API client.
+    @property
+    def scope(self) -> str:
+        """Key identifying where issues are created."""
+        return f"github:{self.repo}"
+
+    def _client(self, logger: "Logger") -> "GithubIssuesClient":
+        """Build the GitHub API client.
 
         Args:
             logger: Logger instance.
@@ -123,16 +564,24 @@ class GithubIntegration(Integration):
         Returns:
             GitHub API client instance.
         """
-        logger.warning("GitHub integration not yet implemented.")
-        return None
+        from bug_buddy.issue import GithubIssuesClient
+
+        return GithubIssuesClient(
+            logger=logger,
+            timeout=self.timeout,
+            retry=RetryPolicy(max_retries=self.max_retries),
+            **self._url(),
+        )
 
     def create_issue(
         self,
-        client,
+        client: "GithubIssuesClient",
         description: str,
         labels: list[str],
         func_name: str,
-    ) -> Issue:
+        title: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> "Issue":
         """Create a GitHub issue.
 
         Args:
@@ -140,14 +589,120 @@ class GithubIntegration(Integration):
             description: Issue description.
             labels: Issue labels.
             func_name: Name of the decorated function.
+            title: Issue title, generated from func_name when not given.
+            idempotency_key: UUID identifying the report, so a retried or replayed create
+                doesn't duplicate the issue where the tracker supports it.
 
         Returns:
             Created issue.
         """
-        raise NotImplementedError("GitHub integration not yet implemented.")
+        return client.create_issue(
+            repo=self.repo,
+            description=description,
+            labels=labels,
+            func_name=func_name,
+            title=title,
+        )
 
+    def find_issue(self, client: "GithubIssuesClient", title: str) -> Optional["Issue"]:
+        """Find a GitHub issue by its exact title.
 
-@pydantic_dataclass
+        Args:
+            client: GitHub API client instance.
+            title: Issue title.
+
+        Returns:
+            The issue, or None if there is none.
+        """
+        return client.find_issue(repo=self.repo, title=title)
+
+    def comment_issue(self, client: "GithubIssuesClient", issue: "Issue", body: str) -> None:
+        """Comment on a GitHub issue.
+
+        Args:
+            client: GitHub API client instance.
+            issue: Issue to comment on.
+            body: Comment body.
+        """
+        client.comment_issue(repo=self.repo, number=issue.remote_id, body=body)
+
+    def updated_issues(
+        self, client: "GithubIssuesClient", since: Optional[str] = None
+    ) -> Iterator["Issue"]:
+        """Stream the GitHub issues updated since a time.
+
+        Args:
+            client: GitHub API client instance.
+            since: ISO timestamp of the last update already seen, None for every issue.
+
+        Yields:
+            Updated issues.
+        """
+        return client.get_issues(repo=self.repo, since=since)
+
+    def _async_client(self, logger: "Logger") -> "AsyncGithubIssuesClient":
+        """Build the non-blocking GitHub API client.
+
+        Args:
+            logger: Logger instance.
+
+        Returns:
+            Async GitHub API client instance.
+        """
+        from bug_buddy.issue import AsyncGithubIssuesClient
+
+        return AsyncGithubIssuesClient(
+            logger=logger,
+            timeout=self.timeout,
+            retry=RetryPolicy(max_retries=self.max_retries),
+            **self._url(),
+        )
+
+    async def acreate_issue(
+        self,
+        client: "AsyncGithubIssuesClient",
+        description: str,
+        labels: list[str],
+        func_name: str,
+        title: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> "Issue":
+        """Create a GitHub issue without blocking the event loop.
+
+        Args:
+            client: Async GitHub API client instance.
+            description: Issue description.
+            labels: Issue labels.
+            func_name: Name of the decorated function.
+            title: Issue title, generated from func_name when not given.
+            idempotency_key: UUID identifying the report, so a retried or replayed create
+                doesn't duplicate the issue where the tracker supports it.
+
+        Returns:
+            Created issue.
+        """
+        return await client.create_issue(
+            repo=self.repo,
+            description=description,
+            labels=labels,
+            func_name=func_name,
+            title=title,
+        )
+
+    async def acomment_issue(
+        self, client: "AsyncGithubIssuesClient", issue: "Issue", body: str
+    ) -> None:
+        """Comment on a GitHub issue without blocking the event loop.
+
+        Args:
+            client: Async GitHub API client instance.
+            issue: Issue to comment on.
+            body: Comment body.
+        """
+        await client.comment_issue(repo=self.repo, number=issue.remote_id, body=body)
+
+
+@dataclasses.dataclass
 class LinearIntegration(Integration):
     """Linear integration configuration."""
 
@@ -157,13 +712,68 @@ class LinearIntegration(Integration):
     project_id: str | None = None
     """Linear project ID (optional)."""
 
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    """(connect, read) timeouts in seconds for Linear API requests."""
+
+    max_retries: int = 3
+    """Retries for connection errors, 429 and 5xx responses, with exponential backoff."""
+
+    label_map: dict[str, str] = dataclasses.field(default_factory=dict)
+    """Exception class name to Linear label name. Unmapped exceptions get the "Bug" label."""
+
+    create_labels: bool = True
+    """Create mapped labels missing from the team."""
+
+    label_ttl: float = 3600.0
+    """Seconds label IDs are cached before the team's labels are fetched again."""
+
+    label_cache: Optional[str] = ".bug_buddy.labels.json"
+    """Label ID cache file name relative to $HOME, None to cache in memory only."""
+
+    url: Optional[str] = None
+    """Linear GraphQL API URL, None for the public API."""
+
+    def __post_init__(self) -> None:
+        self.timeout = _timeout(self.timeout)
+        self.max_retries = int(self.max_retries)
+        self.label_map = dict(self.label_map)
+
     @property
     def name(self) -> str:
         """Name of the integration."""
         return "Linear"
 
-    def get_client(self, logger: Logger) -> LinearIssuesClient:
-        """Get the Linear API client.
+    def _label_cache(self) -> "LabelCache":
+        """Label ID cache shared by the clients of this integration."""
+        from bug_buddy._labels import LabelCache
+        from bug_buddy.cache import cache_path
+
+        return LabelCache(
+            ttl=self.label_ttl,
+            path=cache_path(self.label_cache) if self.label_cache else None,
+        )
+
+    def _label_names(self, labels: list[str]) -> tuple[list[str], bool]:
+        """Map the exception names Bug Buddy labels issues with to Linear label names.
+
+        Args:
+            labels: issue labels, the exception class name.
+
+        Returns:
+            Linear label names, and whether missing ones should be created.
+        """
+        names = [self.label_map[label] for label in labels if label in self.label_map]
+        if names:
+            return names, self.create_labels
+        return ["Bug"], False
+
+    @property
+    def scope(self) -> str:
+        """Key identifying where issues are created."""
+        return f"linear:{self.team_id}:{self.project_id or ''}"
+
+    def _client(self, logger: "Logger") -> "LinearIssuesClient":
+        """Build the Linear API client.
 
         Args:
             logger: Logger instance.
@@ -171,31 +781,199 @@ class LinearIntegration(Integration):
         Returns:
             Linear API client instance.
         """
-        return LinearIssuesClient(logger=logger)
+        from bug_buddy.issue import LinearIssuesClient
+
+        return LinearIssuesClient(
+            logger=logger,
+            timeout=self.timeout,
+            retry=RetryPolicy(max_retries=self.max_retries),
+            label_cache=self._label_cache(),
+            **self._url(),
+        )
 
     def create_issue(
         self,
-        client: LinearIssuesClient,
+        client: "LinearIssuesClient",
         description: str,
         labels: list[str],
         func_name: str,
-    ) -> Issue:
+        title: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> "Issue":
         """Create a Linear issue.
 
         Args:
             client: Linear API client instance.
             description: Issue description.
-            labels: Issue labels (ignored, uses "Bug" label from Linear).
+            labels: Issue labels, mapped through `label_map`.
             func_name: Name of the decorated function.
+            title: Issue title, generated from func_name when not given.
+            idempotency_key: UUID identifying the report, so a retried or replayed create
+                doesn't duplicate the issue where the tracker supports it.
 
         Returns:
             Created issue.
         """
-        # Linear uses the "Bug" label by default (looked up by name)
-        # The labels param from caller contains exception names which aren't useful here
+        names, create = self._label_names(labels)
         return client.create_issue(
             team_id=self.team_id,
             description=description,
             func_name=func_name,
+            title=title,
             project_id=self.project_id,
+            label_names=names,
+            create_labels=create,
+            issue_id=idempotency_key,
         )
+
+    def create_issues(
+        self,
+        client: "LinearIssuesClient",
+        batch: Sequence[IssueDraft],
+        max_workers: Optional[int] = None,
+    ) -> list[BatchResult]:
+        """Create a batch of Linear issues, many per GraphQL request.
+
+        Args:
+            client: Linear API client instance.
+            batch: issues to create, labels mapped through `label_map`.
+            max_workers: unused, Linear issues are created in aliased batches instead.
+
+        Returns:
+            One result per issue, in the order of the batch.
+        """
+        items = []
+        for draft in batch:
+            names, create = self._label_names(draft.labels)
+            items.append(
+                dict(
+                    description=draft.description,
+                    func_name=draft.func_name,
+                    title=draft.title,
+                    label_names=names,
+                    create_labels=create,
+                    issue_id=draft.idempotency_key,
+                )
+            )
+
+        created = client.create_issues(
+            team_id=self.team_id, items=items, project_id=self.project_id
+        )
+        return [
+            BatchResult(draft=draft, error=result)
+            if isinstance(result, Exception)
+            else BatchResult(draft=draft, issue=result)
+            for draft, result in zip(batch, created)
+        ]
+
+    def comment_issue(self, client: "LinearIssuesClient", issue: "Issue", body: str) -> None:
+        """Comment on a Linear issue.
+
+        Args:
+            client: Linear API client instance.
+            issue: Issue to comment on.
+            body: Comment body.
+        """
+        client.comment_issue(issue_id=issue.remote_id, body=body)
+
+    def updated_issues(
+        self, client: "LinearIssuesClient", since: Optional[str] = None
+    ) -> Iterator["Issue"]:
+        """Stream the Linear issues updated since a time.
+
+        Args:
+            client: Linear API client instance.
+            since: ISO timestamp of the last update already seen, None for every issue.
+
+        Yields:
+            Updated issues.
+        """
+        return client.get_issues(
+            team_id=self.team_id, project_id=self.project_id, updated_after=since
+        )
+
+    def _async_client(self, logger: "Logger") -> "AsyncLinearIssuesClient":
+        """Build the non-blocking Linear API client.
+
+        Args:
+            logger: Logger instance.
+
+        Returns:
+            Async Linear API client instance.
+        """
+        from bug_buddy.issue import AsyncLinearIssuesClient
+
+        return AsyncLinearIssuesClient(
+            logger=logger,
+            timeout=self.timeout,
+            retry=RetryPolicy(max_retries=self.max_retries),
+            label_cache=self._label_cache(),
+            **self._url(),
+        )
+
+    async def acreate_issue(
+        self,
+        client: "AsyncLinearIssuesClient",
+        description: str,
+        labels: list[str],
+        func_name: str,
+        title: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> "Issue":
+        """Create a Linear issue without blocking the event loop.
+
+        Args:
+            client: Async Linear API client instance.
+            description: Issue description.
+            labels: Issue labels, mapped through `label_map`.
+            func_name: Name of the decorated function.
+            title: Issue title, generated from func_name when not given.
+            idempotency_key: UUID identifying the report, so a retried or replayed create
+                doesn't duplicate the issue where the tracker supports it.
+
+        Returns:
+            Created issue.
+        """
+        names, create = self._label_names(labels)
+        return await client.create_issue(
+            team_id=self.team_id,
+            description=description,
+            func_name=func_name,
+            title=title,
+            project_id=self.project_id,
+            label_names=names,
+            create_labels=create,
+            issue_id=idempotency_key,
+        )
+
+    async def acomment_issue(
+        self, client: "AsyncLinearIssuesClient", issue: "Issue", body: str
+    ) -> None:
+        """Comment on a Linear issue without blocking the event loop.
+
+        Args:
+            client: Async Linear API client instance.
+            issue: Issue to comment on.
+            body: Comment body.
+        """
+        await client.comment_issue(issue_id=issue.remote_id, body=body)
+
+
+def from_spec(spec: dict[str, Any]) -> Integration:
+    """Rebuild an integration from `Integration.spec`.
+
+    Args:
+        spec: integration spec.
+
+    Returns:
+        Integration instance.
+    """
+
+    integrations = {
+        cls.__name__: cls for cls in (GitlabIntegration, GithubIntegration, LinearIntegration)
+    }
+    try:
+        cls = integrations[spec["type"]]
+    except KeyError:
+        raise ValueError(f"Unknown integration: {spec.get('type')!r}")
+    return cls(**spec["config"])
@@ -1,18 +1,232 @@
-import io
-import json
+import dataclasses
 import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
 from logging import Logger, getLogger
-from typing import Mapping, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional, Sequence, Union
 
 import requests
 from attrs import define, field
 from pydantic.dataclasses import dataclass as pydantic_dataclass
 
+from bug_buddy._http import (
+    DEFAULT_TIMEOUT,
+    RetryPolicy,
+    arequest,
+    build_async_client,
+    build_session,
+    request,
+)
+from bug_buddy._labels import LabelCache
+from bug_buddy.cache import CACHE_FILE, CacheBackend, JsonlCacheBackend, cache_path
+
+if TYPE_CHECKING:
+    import httpx
+
+_LINEAR_LABELS_QUERY = """
+query GetTeamLabels($teamId: String!) {
+    team(id: $teamId) {
+        labels {
+            nodes {
+                id
+                name
+            }
+        }
+    }
+}
+"""
+
+_LINEAR_ISSUE_FIELDS = """
+    id
+    identifier
+    number
+    title
+    description
+    createdAt
+    updatedAt
+    state {
+        name
+    }
+    creator {
+        name
+        email
+    }
+    labels {
+        nodes {
+            name
+        }
+    }
+"""
+
+_LINEAR_CREATE_MUTATION = (
+    """
+mutation CreateIssue(
+    $id: String
+    $teamId: String!
+    $title: String!
+    $description: String
+    $labelIds: [String!]
+    $projectId: String
+) {
+    issueCreate(input: {
+        id: $id
+        teamId: $teamId
+        title: $title
+        description: $description
+        labelIds: $labelIds
+        projectId: $projectId
+    }) {
+        success
+        issue {"""
+    + _LINEAR_ISSUE_FIELDS
+    + """        }
+    }
+}
+"""
+)
+
+_LINEAR_BATCH_SIZE = 20
+"""issueCreate mutations aliased into one request, well within Linear's complexity limit."""
+
+
+@lru_cache(maxsize=None)
+def _linear_batch_mutation(size: int) -> str:
+    """GraphQL document creating `size` issues, aliased `i0` to `i{size - 1}`.
+
+    Args:
+        size: number of issues.
+
+    Returns:
+        GraphQL document taking `$teamId`, `$projectId` and numbered per-issue variables.
+    """
+
+    params = "".join(
+        f"    $id{i}: String\n    $title{i}: String!\n"
+        f"    $description{i}: String\n    $labelIds{i}: [String!]\n"
+        for i in range(size)
+    )
+    creates = "".join(
+        f"""    i{i}: issueCreate(input: {{
+        id: $id{i}
+        teamId: $teamId
+        title: $title{i}
+        description: $description{i}
+        labelIds: $labelIds{i}
+        projectId: $projectId
+    }}) {{
+        success
+        issue {{"""
+        + _LINEAR_ISSUE_FIELDS
+        + """        }
+    }
+"""
+        for i in range(size)
+    )
+    return (
+        f"\nmutation CreateIssues(\n    $teamId: String!\n    $projectId: String\n{params}) {{\n"
+        + creates
+        + "}\n"
+    )
+
+
+_LINEAR_ISSUE_QUERY = (
+    """
+query GetIssue($id: String!) {
+    issue(id: $id) {"""
+    + _LINEAR_ISSUE_FIELDS
+    + """    }
+}
+"""
+)
+
+_LINEAR_ISSUES_QUERY = (
+    """
+query GetIssues($filter: IssueFilter, $first: Int, $after: String) {
+    issues(filter: $filter, first: $first, after: $after, orderBy: updatedAt) {
+        nodes {"""
+    + _LINEAR_ISSUE_FIELDS
+    + """        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+)
+
+_LINEAR_COMMENT_MUTATION = """
+mutation CreateComment($issueId: String!, $body: String!) {
+    commentCreate(input: {issueId: $issueId, body: $body}) {
+        success
+    }
+}
+"""
+
+_LINEAR_LABEL_CREATE_MUTATION = """
+mutation CreateLabel($teamId: String!, $name: String!) {
+    issueLabelCreate(input: {teamId: $teamId, name: $name}) {
+        success
+        issueLabel {
+            id
+        }
+    }
+}
+"""
+
+
+def _labels(labels: Optional[list[str]]) -> list[str]:
+    """Always include the BugBuddy label.
+
+    Args:
+        labels: issue labels.
+
+    Returns:
+        Issue labels including BugBuddy, in a new list.
+    """
+
+    labels = list(labels or [])
+    if "BugBuddy" not in labels:
+        labels.append("BugBuddy")
+    return labels
+
+
+def _title(func_name: Optional[str] = None) -> str:
+    """Generate a unique issue title.
+
+    Args:
+        func_name: name of the decorated function.
+
+    Returns:
+        Issue title.
+    """
+
+    if func_name:
+        return f"BugBuddy-{func_name}-" + str(uuid.uuid4())
+    return "BugBuddy-" + str(uuid.uuid4())
+
+
+_ISSUE_FIELDS = (
+    "id",
+    "title",
+    "state",
+    "project_id",
+    "author",
+    "created_at",
+    "updated_at",
+    "description",
+    "labels",
+    "remote_id",
+)
+
 
 @pydantic_dataclass
-class Issue:
-    """Normalized Remote Issue."""
+class _IssueSchema:
+    """Field types of an issue, validated when an `Issue` is constructed."""
 
     id: int
     """Issue ID."""
@@ -30,59 +244,117 @@ class Issue:
     """Time issue updated."""
     description: str
     """Issue description."""
-    labels: list[str] = field(factory=list)
+    labels: list[str] = dataclasses.field(default_factory=list)
     """Issue labels."""
+    remote_id: Optional[str] = None
+    """Tracker native key used to update the issue (Linear UUID, GitLab IID)."""
 
-    def _clean(self) -> str:
-        """Clean attributes so they're ready for df transformation."""
 
-        attribs = self.__dict__.copy()
-        attribs = {k: v if isinstance(v, (str, int)) else "_".join(v) for k, v in attribs.items()}
-        return attribs
+class _IssueRecord:
+    """Issue fields held in slots, built, compared and serialized without validation."""
 
-    @staticmethod
-    def _jdump(contents: list[dict[str, any]], handler: io.TextIOWrapper) -> str:
-        """Dump to JSON.
+    __slots__ = _ISSUE_FIELDS
 
-        Args:
-            contents: contents to dump.
-            handler: file handler.
+    def __init__(
+        self,
+        id: int,
+        title: str,
+        state: str,
+        project_id: Union[int, str],
+        author: tuple[str, str, str],
+        created_at: str,
+        updated_at: str,
+        description: str,
+        labels: Optional[list[str]] = None,
+        remote_id: Optional[str] = None,
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.state = state
+        self.project_id = project_id
+        self.author = author
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.description = description
+        self.labels = [] if labels is None else labels
+        self.remote_id = remote_id
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in _ISSUE_FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _IssueRecord):
+            return NotImplemented
+        return self._asdict() == other._asdict()
+
+    __hash__ = None
+
+    def _asdict(self) -> dict[str, Any]:
+        """Fields as a dict, as `dataclasses.asdict` would return them."""
+        return {name: getattr(self, name) for name in _ISSUE_FIELDS}
+
+    def _clean(self) -> dict[str, Any]:
+        """Fields as a cache record, with the author joined into one string."""
+
+        record = self._asdict()
+        # labels stay a list so indexed stores can split them back out
+        if not isinstance(self.author, str):
+            record["author"] = "_".join(self.author)
+        return record
+
+    def cache(
+        self,
+        cache: str = CACHE_FILE,
+        backend: Optional[CacheBackend] = None,
+        context: Optional[Mapping[str, any]] = None,
+    ) -> None:
+        """Append to a local cache.
 
-        Returns:
-            JSON string.
+        Args:
+            cache: cache file name, relative to $HOME. Ignored when `backend` is given.
+            backend: cache backend, defaults to an append-only JSON Lines file.
+            context: extra fields stored alongside the issue (e.g. func_name, commit_sha).
         """
 
-        json.dump(
-            contents, handler, indent=4, sort_keys=False, default=str, separators=(",", ": ")
-        )
+        if backend is None:
+            backend = JsonlCacheBackend(path=cache_path(cache))
 
-    def cache(self, cache: str = ".bug_buddy.cache") -> str:
-        """Append to a local cache file.
+        record = self._clean()
+        if context:
+            record.update(context)
 
-        Args:
-            cache: cache file name.
+        backend.append(record)
 
-        Returns:
-            JSON string.
-        """
 
-        cleaned = self._clean()
+class Issue(_IssueRecord):
+    """Normalized Remote Issue.
 
-        # try to open up cache if it exists in $HOME
-        cache = os.path.join(os.environ["HOME"], cache)
-        try:
-            with open(cache, "r+") as rf:
-                existing = json.load(rf)
+    Constructing an issue validates and coerces its fields against `_IssueSchema`. The issues
+    Bug Buddy builds itself, for its reports and from the tracker responses it has picked
+    apart, skip validation through `Issue._unchecked`, so recording a failure costs none.
+    """
+
+    __slots__ = ()
 
-            # add to existing cache
-            existing.append(cleaned)
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        valid = _IssueSchema(*args, **kwargs)
+        super().__init__(**{name: getattr(valid, name) for name in _ISSUE_FIELDS})
 
-            with open(cache, "w") as of:
-                Issue._jdump(existing, of)
+    @classmethod
+    def _unchecked(cls, **fields: Any) -> "Issue":
+        """Build an issue from fields known to be valid.
 
-        except FileNotFoundError:
-            with open(cache, "w") as f:
-                Issue._jdump([cleaned], f)
+        Args:
+            **fields: issue fields.
+
+        Returns:
+            The issue.
+        """
+
+        issue = cls.__new__(cls)
+        _IssueRecord.__init__(issue, **fields)
+        return issue
 
 
 @define
@@ -106,31 +378,32 @@ class LinearIssuesClient:
     def _logger_default(self) -> Logger:
         return getLogger(__name__)
 
-    def _get_label_id(self, team_id: str, label_name: str) -> list[str]:
-        """Look up a label ID by name for a team.
+    session: requests.Session = field(factory=build_session)
+    """Keep-alive session, shared by every report sent through this client."""
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    """(connect, read) timeouts in seconds."""
+    retry: RetryPolicy = field(factory=RetryPolicy)
+    """Retry policy for connection errors, 429 and 5xx responses."""
+    label_cache: LabelCache = field(factory=LabelCache)
+    """Label IDs by team and name, so issues don't cost a label lookup each."""
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request on the pooled session with timeouts and retries."""
+        return request(self.session, method, url, self.timeout, self.retry, self.logger, **kwargs)
+
+    def _graphql(self, query: str, variables: Mapping[str, Any]) -> dict[str, Any]:
+        """POST a GraphQL document.
 
         Args:
-            team_id: Linear team ID.
-            label_name: Label name to look up (e.g., "Bug").
+            query: GraphQL document.
+            variables: GraphQL variables.
 
         Returns:
-            List containing the label ID, or empty list if not found.
-        """
-
-        query = """
-        query GetTeamLabels($teamId: String!) {
-            team(id: $teamId) {
-                labels {
-                    nodes {
-                        id
-                        name
-                    }
-                }
-            }
-        }
+            Response body.
         """
 
-        resp = requests.post(
+        resp = self._request(
+            "POST",
             self.url,
             headers={
                 "Authorization": self.token,
@@ -138,24 +411,101 @@ class LinearIssuesClient:
             },
             json={
                 "query": query,
-                "variables": {"teamId": team_id},
+                "variables": variables,
             },
         )
 
         resp.raise_for_status()
-        result = resp.json()
+        self.logger.debug("Response code: %s", resp.status_code)
+        return resp.json()
+
+    @staticmethod
+    def _team_labels(result: Mapping[str, Any], logger: Logger) -> Optional[dict[str, str]]:
+        """Pick the label listing out of a GetTeamLabels response.
+
+        Args:
+            result: GetTeamLabels response body.
+            logger: Logger instance.
+
+        Returns:
+            Label name to ID, or None if Linear returned errors.
+        """
 
         if "errors" in result:
-            self.logger.warning(f"Could not fetch labels: {result['errors']}")
-            return []
+            logger.warning(f"Could not fetch labels: {result['errors']}")
+            return None
 
         labels = result.get("data", {}).get("team", {}).get("labels", {}).get("nodes", [])
-        for label in labels:
-            if label.get("name") == label_name:
-                return [label.get("id")]
+        return {label.get("name"): label.get("id") for label in labels}
+
+    @staticmethod
+    def _created_label(result: Mapping[str, Any]) -> Optional[str]:
+        """Pick the label ID out of an issueLabelCreate response.
+
+        Args:
+            result: issueLabelCreate response body.
+
+        Returns:
+            Label ID, or None if Linear returned errors.
+        """
 
-        self.logger.warning(f"Label '{label_name}' not found for team {team_id}")
-        return []
+        if "errors" in result:
+            return None
+        return result.get("data", {}).get("issueLabelCreate", {}).get("issueLabel", {}).get("id")
+
+    @staticmethod
+    def _stale_labels(result: Mapping[str, Any]) -> bool:
+        """Whether issueCreate failed because of the label IDs it was given."""
+
+        return any("label" in str(e.get("message", "")).lower() for e in result.get("errors", []))
+
+    def _resolve_labels(self, team_id: str, names: list[str], create: bool = False) -> list[str]:
+        """Resolve label names to IDs through the label cache.
+
+        Args:
+            team_id: Linear team ID.
+            names: label names.
+            create: create labels missing from the team.
+
+        Returns:
+            Label IDs of the labels that exist (or were created).
+        """
+
+        ids = []
+        for name in names:
+            hit, label_id = self.label_cache.lookup(team_id, name)
+            if not hit:
+                labels = self._team_labels(
+                    self._graphql(_LINEAR_LABELS_QUERY, {"teamId": team_id}), self.logger
+                )
+                if labels is not None:
+                    self.label_cache.put_team(team_id, labels)
+                    label_id = labels.get(name)
+            if label_id is None and create:
+                label_id = self._created_label(
+                    self._graphql(_LINEAR_LABEL_CREATE_MUTATION, {"teamId": team_id, "name": name})
+                )
+                if label_id is not None:
+                    self.label_cache.put(team_id, name, label_id)
+            if label_id is None:
+                self.logger.warning(f"Label '{name}' not found for team {team_id}")
+            else:
+                ids.append(label_id)
+
+        return ids
+
+    def _get_label_id(self, team_id: str, label_name: str) -> list[str]:
+        """Look up a label ID by name for a team.
+
+        Args:
+            team_id: Linear team ID.
+            label_name: Label name to look up (e.g., "Bug").
+
+        Returns:
+            List containing the label ID, or empty list if not found.
+        """
+
+        return self._resolve_labels(team_id, [label_name])
 
     @staticmethod
     def _normalize_itype(response_map: Mapping[str, any], team_id: str) -> Issue:
@@ -169,7 +519,7 @@ class LinearIssuesClient:
             Normalized Issue type.
         """
 
-        return Issue(
+        return Issue._unchecked(
             id=response_map.get("number", 0),
             title=response_map.get("title", ""),
             state=response_map.get("state", {}).get("name", "unknown"),
@@ -185,8 +535,94 @@ class LinearIssuesClient:
             labels=[
                 label.get("name", "") for label in response_map.get("labels", {}).get("nodes", [])
             ],
+            remote_id=response_map.get("id"),
         )
 
+    @classmethod
+    def _issue(cls, result: Mapping[str, Any], team_id: str) -> Optional[Issue]:
+        """Normalize a GetIssue response.
+
+        Args:
+            result: GetIssue response body.
+            team_id: Linear team ID.
+
+        Returns:
+            The issue, or None if it doesn't exist.
+        """
+
+        issue_data = (result.get("data") or {}).get("issue")
+        if "errors" in result or not issue_data:
+            return None
+        return cls._normalize_itype(issue_data, team_id)
+
+    def get_issue(self, issue_id: str, team_id: str) -> Optional[Issue]:
+        """Fetch an issue by UUID.
+
+        Args:
+            issue_id: Linear issue UUID.
+            team_id: Linear team ID.
+
+        Returns:
+            The issue, or None if it doesn't exist.
+        """
+
+        return self._issue(self._graphql(_LINEAR_ISSUE_QUERY, {"id": issue_id}), team_id)
+
+    def get_issues(
+        self,
+        team_id: str,
+        project_id: Optional[str] = None,
+        updated_after: Optional[Union[datetime, str]] = None,
+        per_page: int = 100,
+    ) -> Iterator[Issue]:
+        """Stream a team's Bug Buddy issues, every page of them.
+
+        Args:
+            team_id: Linear team ID.
+            project_id: only issues of this Linear project.
+            updated_after: only issues updated after this time.
+            per_page: issues per page, at most 250.
+
+        Yields:
+            Normalized issues.
+        """
+
+        if isinstance(updated_after, datetime):
+            updated_after = updated_after.isoformat()
+        issue_filter = {"team": {"id": {"eq": team_id}}, "title": {"startsWith": "BugBuddy-"}}
+        if project_id is not None:
+            issue_filter["project"] = {"id": {"eq": project_id}}
+        if updated_after is not None:
+            issue_filter["updatedAt"] = {"gt": updated_after}
+
+        after = None
+        while True:
+            result = self._graphql(
+                _LINEAR_ISSUES_QUERY, {"filter": issue_filter, "first": per_page, "after": after}
+            )
+            if "errors" in result:
+                raise ValueError(f"Linear API error: {result['errors']}")
+
+            issues = result["data"]["issues"]
+            for issue in issues["nodes"]:
+                yield self._normalize_itype(issue, team_id)
+
+            if not issues["pageInfo"]["hasNextPage"]:
+                return
+            after = issues["pageInfo"]["endCursor"]
+
+    def comment_issue(self, issue_id: str, body: str) -> None:
+        """Comment on an existing issue.
+
+        Args:
+            issue_id: Linear issue UUID.
+            body: comment body (Markdown).
+        """
+
+        result = self._graphql(_LINEAR_COMMENT_MUTATION, {"issueId": issue_id, "body": body})
+        if "errors" in result:
+            raise ValueError(f"Linear API error: {result['errors']}")
+
     def create_issue(
         self,
         team_id: str,
@@ -195,66 +631,36 @@ class LinearIssuesClient:
         title: Optional[str] = None,
         func_name: Optional[str] = None,
         project_id: Optional[str] = None,
+        label_names: Optional[list[str]] = None,
+        create_labels: bool = False,
+        issue_id: Optional[str] = None,
     ) -> Issue:
         """Create an issue in Linear.
 
         Args:
             team_id: Linear team ID.
             description: issue description.
-            labels: label IDs to apply (Linear requires UUIDs). If None, looks up "Bug" label.
+            labels: label IDs to apply (Linear requires UUIDs). If None, `label_names` are
+                resolved through the label cache.
             title: issue title.
             func_name: name of the decorated function.
             project_id: Linear project ID to add the issue to (optional).
+            label_names: label names to apply when `labels` is None, defaults to "Bug".
+            create_labels: create labels in `label_names` missing from the team.
+            issue_id: UUID to create the issue with. Creating it again returns the existing
+                issue, so retries and replays never duplicate it.
 
         Returns:
             Created issue, normalized.
         """
 
         if title is None:
-            if func_name:
-                title = f"BugBuddy-{func_name}-" + str(uuid.uuid4())
-            else:
-                title = "BugBuddy-" + str(uuid.uuid4())
-
-        # If no labels provided, look up the "Bug" label ID for this team
-        if labels is None:
-            labels = self._get_label_id(team_id, "Bug")
-
-        # GraphQL mutation to create an issue
-        mutation = """
-        mutation CreateIssue($teamId: String!, $title: String!, $description: String, $labelIds: [String!], $projectId: String) {  
-            issueCreate(input: {
-                teamId: $teamId
-                title: $title
-                description: $description
-                labelIds: $labelIds
-                projectId: $projectId
-            }) {
-                success
-                issue {
-                    id
-                    identifier
-                    number
-                    title
-                    description
-                    createdAt
-                    updatedAt
-                    state {
-                        name
-                    }
-                    creator {
-                        name
-                        email
-                    }
-                    labels {
-                        nodes {
-                            name
-                        }
-                    }
-                }
-            }
-        }
-        """
+            title = _title(func_name)
+
+        resolve = labels is None
+        if resolve:
+            label_names = label_names or ["Bug"]
+            labels = self._resolve_labels(team_id, label_names, create_labels)
 
         variables = {
             "teamId": team_id,
@@ -262,29 +668,108 @@ class LinearIssuesClient:
             "description": description,
             "labelIds": labels,
             "projectId": project_id,
+            "id": issue_id,
         }
 
-        resp = requests.post(
-            self.url,
-            headers={
-                "Authorization": self.token,
-                "Content-Type": "application/json",
-            },
-            json={
-                "query": mutation,
-                "variables": variables,
-            },
-        )
+        result = self._graphql(_LINEAR_CREATE_MUTATION, variables)
+        if resolve and self._stale_labels(result):
+            # a cached label was deleted or renamed in Linear
+            self.logger.debug("Label IDs rejected, refreshing labels of team %s", team_id)
+            self.label_cache.invalidate(team_id)
+            variables["labelIds"] = self._resolve_labels(team_id, label_names, create_labels)
+            result = self._graphql(_LINEAR_CREATE_MUTATION, variables)
 
-        resp.raise_for_status()
-        self.logger.debug("Response code: %s", resp.status_code)
+        if issue_id is not None and "errors" in result:
+            # a retried or replayed create may already have gone through
+            existing = self.get_issue(issue_id, team_id)
+            if existing is not None:
+                return existing
+
+        return self._created(result, team_id)
+
+    def create_issues(
+        self,
+        team_id: str,
+        items: Sequence[Mapping[str, Any]],
+        project_id: Optional[str] = None,
+        batch_size: int = _LINEAR_BATCH_SIZE,
+    ) -> list[Union[Issue, Exception]]:
+        """Create many issues, `batch_size` aliased issueCreate mutations per request.
+
+        Issues Linear rejects within a batch are retried one by one with `create_issue`, which
+        refreshes stale label IDs and recovers issues an earlier attempt already created.
+
+        Args:
+            team_id: Linear team ID.
+            items: `create_issue` arguments of each issue: description, and optionally title,
+                func_name, label_names, create_labels and issue_id.
+            project_id: Linear project ID to add the issues to (optional).
+            batch_size: issues created per request.
+
+        Returns:
+            Created issue, or the error it failed with, for each item in order.
+        """
+
+        results = []
+        for start in range(0, len(items), batch_size):
+            results.extend(
+                self._create_batch(team_id, items[start : start + batch_size], project_id)
+            )
+        return results
+
+    def _create_batch(
+        self, team_id: str, items: Sequence[Mapping[str, Any]], project_id: Optional[str]
+    ) -> list[Union[Issue, Exception]]:
+        """Create issues with one aliased GraphQL request, see `create_issues`."""
+
+        variables = {"teamId": team_id, "projectId": project_id}
+        try:
+            for i, item in enumerate(items):
+                variables[f"id{i}"] = item.get("issue_id")
+                variables[f"title{i}"] = item.get("title") or _title(item.get("func_name"))
+                variables[f"description{i}"] = item["description"]
+                variables[f"labelIds{i}"] = self._resolve_labels(
+                    team_id, item.get("label_names") or ["Bug"], item.get("create_labels", False)
+                )
+            result = self._graphql(_linear_batch_mutation(len(items)), variables)
+        except Exception as e:
+            return [e] * len(items)
+
+        data = result.get("data")
+        if not data:
+            # the whole document was rejected, e.g. authentication or complexity
+            return [ValueError(f"Linear API error: {result.get('errors')}")] * len(items)
+
+        results = []
+        for i, item in enumerate(items):
+            issue_data = (data.get(f"i{i}") or {}).get("issue")
+            if issue_data:
+                results.append(self._normalize_itype(issue_data, team_id))
+                continue
+            try:
+                results.append(self.create_issue(team_id=team_id, project_id=project_id, **item))
+            except Exception as e:
+                results.append(e)
+
+        return results
+
+    @classmethod
+    def _created(cls, result: Mapping[str, Any], team_id: str) -> Issue:
+        """Normalize an issueCreate response.
+
+        Args:
+            result: issueCreate response body.
+            team_id: Linear team ID.
+
+        Returns:
+            Created issue, normalized.
+        """
 
-        result = resp.json()
         if "errors" in result:
             raise ValueError(f"Linear API error: {result['errors']}")
 
         issue_data = result.get("data", {}).get("issueCreate", {}).get("issue", {})
-        return self._normalize_itype(issue_data, team_id)
+        return cls._normalize_itype(issue_data, team_id)
 
 
 @define
@@ -316,6 +801,21 @@ class GitlabIssuesClient:
     def _logger_default(self) -> Logger:
         return getLogger(__name__)
 
+    session: requests.Session = field(factory=build_session)
+    """Keep-alive session, shared by every report sent through this client."""
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    """(connect, read) timeouts in seconds."""
+    retry: RetryPolicy = field(factory=RetryPolicy)
+    """Retry policy for connection errors, 429 and 5xx responses."""
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request on the pooled session with timeouts and retries.
+
+        The token goes in the PRIVATE-TOKEN header, never the URL, so it stays out of logs.
+        """
+        kwargs["headers"] = {"PRIVATE-TOKEN": self.token, **kwargs.get("headers", {})}
+        return request(self.session, method, url, self.timeout, self.retry, self.logger, **kwargs)
+
     @staticmethod
     def _normalize_itype(response_map: Mapping[str, any]) -> Issue:
         """Normalize issue type.
@@ -327,7 +827,7 @@ class GitlabIssuesClient:
             Normalized Issue type.
         """
 
-        return Issue(
+        return Issue._unchecked(
             id=response_map["id"],
             title=response_map["title"],
             state=response_map["state"],
@@ -341,6 +841,7 @@ class GitlabIssuesClient:
             updated_at=response_map["updated_at"],
             description=response_map["description"],
             labels=response_map["labels"],
+            remote_id=str(response_map["iid"]),
         )
 
     def get_issues(
@@ -348,36 +849,57 @@ class GitlabIssuesClient:
         project_id: int,
         id: Optional[int] = None,
         normalize: bool = True,
-    ) -> Union[Issue, list[dict[str, any]]]:
-        """Project-pinned issues.
+        labels: Optional[str] = "BugBuddy",
+        state: Optional[str] = None,
+        updated_after: Optional[Union[datetime, str]] = None,
+        per_page: int = 100,
+    ) -> Iterator[Union[Issue, dict[str, Any]]]:
+        """Stream project-pinned issues, every page of them.
+
+        Pages are followed through the `Link` header with keyset pagination, and filters are
+        applied by GitLab, so memory use doesn't grow with the size of the project. Issues are
+        normalized one at a time as they are consumed.
 
         Args:
             project_id: project ID.
-            id: issue ID.
+            id: issue IID.
             normalize: whether to normalize issue type.
+            labels: comma separated labels issues must all have, None for any.
+            state: `opened` or `closed`, None for both.
+            updated_after: only issues updated at or after this time.
+            per_page: issues per page, at most 100.
 
-        Returns:
-            Project-pinned issues, normalzied or raw.
+        Yields:
+            Project-pinned issues, normalized or raw.
         """
 
         self.logger.debug("Getting issues for project %s", project_id)
 
-        resp = requests.get(
-            os.path.join(self.url, self.endpoint.format(project_id=project_id)),
-            params={
-                "private_token": self.token,
-                "iids": id,
-            },
-        )
+        if isinstance(updated_after, datetime):
+            updated_after = updated_after.isoformat()
+        params = {
+            "iids[]": id,
+            "labels": labels,
+            "state": state,
+            "updated_after": updated_after,
+            "per_page": per_page,
+            "pagination": "keyset",
+            "order_by": "updated_at",
+            "sort": "asc",
+        }
+        url = os.path.join(self.url, self.endpoint.format(project_id=project_id))
+        params = {k: v for k, v in params.items() if v is not None}
 
-        resp.raise_for_status()
-        self.logger.debug("Response code: %s", resp.status_code)
-        issue = resp.json()
+        while url:
+            resp = self._request("GET", url, params=params)
+            resp.raise_for_status()
+            self.logger.debug("Response code: %s", resp.status_code)
 
-        if normalize:
-            return [self._normalize_itype(issue) for issue in resp.json()]
-        else:
-            return issue
+            for issue in resp.json():
+                yield self._normalize_itype(issue) if normalize else issue
+
+            # the next page's URL carries every parameter, including the keyset cursor
+            url, params = resp.links.get("next", {}).get("url"), None
 
     def create_issue(
         self,
@@ -401,21 +923,12 @@ class GitlabIssuesClient:
         """
 
         if title is None:
-            if func_name:
-                title = f"BugBuddy-{func_name}-" + str(uuid.uuid4())
-            else:
-                title = "BugBuddy-" + str(uuid.uuid4())
-        # always include BugBuddy label
-        if labels is None:
-            labels = ["BugBuddy"]
-        elif "BugBuddy" not in labels:
-            labels.append("BugBuddy")
-
-        resp = requests.post(
+            title = _title(func_name)
+        labels = _labels(labels)
+
+        resp = self._request(
+            "POST",
             os.path.join(self.url, self.endpoint.format(project_id=project_id)),
-            params={
-                "private_token": self.token,
-            },
             json={
                 "title": title,
                 "description": description,
@@ -427,3 +940,832 @@ class GitlabIssuesClient:
         self.logger.debug("Response code: %s", resp.status_code)
         issue = resp.json()
         return self._normalize_itype(issue)
+
+    def find_issue(self, project_id: int, title: str) -> Optional[Issue]:
+        """Find a Bug Buddy issue by its exact title.
+
+        Titles carry a UUID, so this tells whether an earlier attempt created the issue.
+
+        Args:
+            project_id: project ID.
+            title: issue title.
+
+        Returns:
+            The issue, or None if there is none.
+        """
+
+        resp = self._request(
+            "GET",
+            os.path.join(self.url, self.endpoint.format(project_id=project_id)),
+            params={
+                "search": title,
+                "in": "title",
+                "labels": "BugBuddy",
+            },
+        )
+
+        resp.raise_for_status()
+        self.logger.debug("Response code: %s", resp.status_code)
+        for issue in resp.json():
+            if issue.get("title") == title:
+                return self._normalize_itype(issue)
+        return None
+
+    def comment_issue(self, project_id: int, issue_iid: str, body: str) -> None:
+        """Comment on an existing issue.
+
+        Args:
+            project_id: project ID.
+            issue_iid: project-scoped issue IID.
+            body: comment body (Markdown).
+        """
+
+        resp = self._request(
+            "POST",
+            os.path.join(
+                self.url, self.endpoint.format(project_id=project_id), str(issue_iid), "notes"
+            ),
+            json={
+                "body": body,
+            },
+        )
+
+        resp.raise_for_status()
+        self.logger.debug("Response code: %s", resp.status_code)
+
+
+@define
+class _RateLimit:
+    """GitHub rate limit state, as last reported by the API."""
+
+    remaining: Optional[int] = None
+    """Requests left in the current window."""
+    reset: float = 0.0
+    """Epoch seconds the window resets at."""
+    next_write: float = 0.0
+    """Monotonic time the next content-creating request may be sent at."""
+
+
+@define
+class GithubIssuesClient:
+    """GitHub Issues REST API.
+
+    Requests wait for the rate limit window to reset once fewer than `min_remaining` are left,
+    and content-creating requests are spaced `write_interval` apart, as GitHub asks, to stay
+    clear of its secondary rate limits. Lookups are conditional on the ETag of the previous
+    response, and 304 Not Modified responses don't count against the rate limit.
+    """
+
+    url: str = "https://api.github.com"
+    """GitHub REST API URL."""
+
+    token: str = field(converter=str)
+    """Fine-grained or classic personal access token, or a GitHub Actions token."""
+
+    @token.default
+    def _token_default(self) -> str:
+        return os.environ["GITHUB_TOKEN"]
+
+    logger: Logger = field()
+    """Logging instance."""
+
+    @logger.default
+    def _logger_default(self) -> Logger:
+        return getLogger(__name__)
+
+    session: requests.Session = field(factory=build_session)
+    """Keep-alive session, shared by every report sent through this client."""
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    """(connect, read) timeouts in seconds."""
+    retry: RetryPolicy = field(factory=RetryPolicy)
+    """Retry policy for connection errors, 429 and 5xx responses."""
+    min_remaining: int = 5
+    """Requests kept in reserve, below which requests wait for the rate limit to reset."""
+    max_wait: float = 60.0
+    """Longest pause for a rate limit, beyond which the request is sent (or returned) as is."""
+    write_interval: float = 1.0
+    """Minimum seconds between content-creating requests."""
+    max_etags: int = 256
+    """Lookups whose response is kept for conditional requests."""
+
+    _limit: _RateLimit = field(factory=_RateLimit, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _etags: "OrderedDict[str, tuple[str, Any]]" = field(factory=OrderedDict, init=False)
+
+    def _pace(self, method: str) -> None:
+        """Wait out an exhausted rate limit, and space content-creating requests."""
+
+        with self._lock:
+            wait = 0.0
+            limit = self._limit
+            if limit.remaining is not None and limit.remaining < self.min_remaining:
+                wait = max(0.0, limit.reset - time.time())
+            if method != "GET":
+                now = time.monotonic()
+                wait = max(wait, limit.next_write - now)
+                limit.next_write = max(now, limit.next_write) + self.write_interval
+            wait = min(wait, self.max_wait)
+
+        if wait > 0:
+            self.logger.debug("Pausing %.2fs for the GitHub rate limit", wait)
+            time.sleep(wait)
+
+    def _observe(self, resp: requests.Response) -> Optional[float]:
+        """Record the rate limit a response reports.
+
+        Args:
+            resp: API response.
+
+        Returns:
+            Seconds to wait before retrying if the request was rate limited, None otherwise.
+        """
+
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        reset = resp.headers.get("X-RateLimit-Reset")
+        with self._lock:
+            if remaining is not None and remaining.isdigit():
+                self._limit.remaining = int(remaining)
+            if reset is not None and reset.isdigit():
+                self._limit.reset = float(reset)
+
+        if resp.status_code not in (403, 429):
+            return None
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after is not None:
+            return float(retry_after) if retry_after.isdigit() else self.max_wait
+        if remaining == "0":
+            return max(0.0, self._limit.reset - time.time())
+        return None
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request on the pooled session, within GitHub's primary and secondary limits."""
+
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            **kwargs.pop("headers", {}),
+        }
+
+        self._pace(method)
+        resp = request(
+            self.session,
+            method,
+            url,
+            self.timeout,
+            self.retry,
+            self.logger,
+            headers=headers,
+            **kwargs,
+        )
+        wait = self._observe(resp)
+        if wait is not None and wait <= self.max_wait:
+            self.logger.debug("Rate limited by GitHub, retrying in %.2fs", wait)
+            resp.close()
+            time.sleep(wait)
+            self._pace(method)
+            resp = request(
+                self.session,
+                method,
+                url,
+                self.timeout,
+                self.retry,
+                self.logger,
+                headers=headers,
+                **kwargs,
+            )
+            self._observe(resp)
+
+        return resp
+
+    def _get(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Any:
+        """GET a resource, conditional on the ETag of its last response.
+
+        Args:
+            url: resource URL.
+            params: query parameters.
+
+        Returns:
+            Response body, the cached one when the resource is not modified.
+        """
+
+        key = url + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        with self._lock:
+            cached = self._etags.get(key)
+
+        resp = self._request(
+            "GET", url, params=params, headers={"If-None-Match": cached[0]} if cached else {}
+        )
+        if resp.status_code == 304 and cached:
+            self.logger.debug("Not modified: %s", url)
+            with self._lock:
+                if key in self._etags:
+                    self._etags.move_to_end(key)
+            return cached[1]
+
+        resp.raise_for_status()
+        self.logger.debug("Response code: %s", resp.status_code)
+        body = resp.json()
+        etag = resp.headers.get("ETag")
+        if etag:
+            with self._lock:
+                self._etags[key] = (etag, body)
+                self._etags.move_to_end(key)
+                while len(self._etags) > self.max_etags:
+                    self._etags.popitem(last=False)
+        return body
+
+    def _issues_url(self, repo: str, *parts: str) -> str:
+        """URL of a repository's issues endpoint."""
+        return "/".join([self.url, "repos", repo, "issues", *parts])
+
+    @staticmethod
+    def _normalize_itype(response_map: Mapping[str, any], repo: str) -> Issue:
+        """Normalize issue type from a GitHub response.
+
+        Args:
+            response_map: response mapping from GitHub API.
+            repo: repository in 'owner/repo' format.
+
+        Returns:
+            Normalized Issue type.
+        """
+
+        user = response_map.get("user") or {}
+        return Issue._unchecked(
+            id=response_map["number"],
+            title=response_map["title"],
+            state=response_map["state"],
+            project_id=repo,
+            author=(user.get("login", "unknown"), user.get("html_url", "unknown"), "active"),
+            created_at=response_map["created_at"],
+            updated_at=response_map["updated_at"],
+            description=response_map.get("body") or "",
+            labels=[label["name"] for label in response_map.get("labels", [])],
+            remote_id=str(response_map["number"]),
+        )
+
+    def get_issue(self, repo: str, number: int) -> Optional[Issue]:
+        """Fetch an issue by number.
+
+        Args:
+            repo: repository in 'owner/repo' format.
+            number: issue number.
+
+        Returns:
+            The issue, or None if it doesn't exist.
+        """
+
+        try:
+            issue = self._get(self._issues_url(repo, str(number)))
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in (404, 410):
+                return None
+            raise
+        return self._normalize_itype(issue, repo)
+
+    def get_issues(
+        self,
+        repo: str,
+        since: Optional[Union[datetime, str]] = None,
+        labels: Optional[str] = "BugBuddy",
+        state: str = "all",
+        per_page: int = 100,
+    ) -> Iterator[Issue]:
+        """Stream a repository's issues, every page of them, least recently updated first.
+
+        Args:
+            repo: repository in 'owner/repo' format.
+            since: only issues updated at or after this time.
+            labels: comma separated labels issues must all have, None for any.
+            state: `open`, `closed` or `all`.
+            per_page: issues per page, at most 100.
+
+        Yields:
+            Normalized issues.
+        """
+
+        if isinstance(since, datetime):
+            since = since.isoformat()
+        params = {
+            "labels": labels,
+            "state": state,
+            "since": since,
+            "sort": "updated",
+            "direction": "asc",
+            "per_page": per_page,
+        }
+        url = self._issues_url(repo)
+        params = {k: v for k, v in params.items() if v is not None}
+
+        while url:
+            resp = self._request("GET", url, params=params)
+            resp.raise_for_status()
+
+            for issue in resp.json():
+                # the issues endpoint lists pull requests too
+                if "pull_request" not in issue:
+                    yield self._normalize_itype(issue, repo)
+
+            # the next page's URL carries every parameter
+            url, params = resp.links.get("next", {}).get("url"), None
+
+    def find_issue(self, repo: str, title: str) -> Optional[Issue]:
+        """Find a Bug Buddy issue by its exact title.
+
+        Titles carry a UUID, so this tells whether an earlier attempt created the issue. Bug
+        Buddy issues are looked through newest first, page by page, until the title turns up.
+        The first page is a conditional request that costs no rate limit quota while nothing
+        changed. The search API isn't used, as it lags behind newly created issues.
+
+        Args:
+            repo: repository in 'owner/repo' format.
+            title: issue title.
+
+        Returns:
+            The issue, or None if there is none.
+        """
+
+        params = {
+            "labels": "BugBuddy",
+            "state": "all",
+            "sort": "created",
+            "direction": "desc",
+            "per_page": 100,
+        }
+        issues = self._get(self._issues_url(repo), params=params)
+        url = None
+        if len(issues) == params["per_page"]:
+            params["page"] = 2
+            url = self._issues_url(repo)
+
+        while True:
+            for issue in issues:
+                if issue.get("title") == title and "pull_request" not in issue:
+                    return self._normalize_itype(issue, repo)
+            if not url:
+                return None
+
+            resp = self._request("GET", url, params=params)
+            resp.raise_for_status()
+            issues = resp.json()
+            # the next page's URL carries every parameter
+            url, params = resp.links.get("next", {}).get("url"), None
+
+    def create_issue(
+        self,
+        repo: str,
+        description: str,
+        labels: Optional[list[str]] = None,
+        title: Optional[str] = None,
+        func_name: Optional[str] = None,
+    ) -> Issue:
+        """Create an issue.
+
+        Args:
+            repo: repository in 'owner/repo' format.
+            description: issue description.
+            labels: issue labels.
+            title: issue title.
+            func_name: name of the decorated function.
+
+        Returns:
+            Created issue, normalized.
+        """
+
+        if title is None:
+            title = _title(func_name)
+
+        resp = self._request(
+            "POST",
+            self._issues_url(repo),
+            json={
+                "title": title,
+                "body": description,
+                "labels": _labels(labels),
+            },
+        )
+
+        resp.raise_for_status()
+        self.logger.debug("Response code: %s", resp.status_code)
+        return self._normalize_itype(resp.json(), repo)
+
+    def comment_issue(self, repo: str, number: str, body: str) -> None:
+        """Comment on an existing issue.
+
+        Args:
+            repo: repository in 'owner/repo' format.
+            number: issue number.
+            body: comment body (Markdown).
+        """
+
+        resp = self._request(
+            "POST", self._issues_url(repo, str(number), "comments"), json={"body": body}
+        )
+
+        resp.raise_for_status()
+        self.logger.debug("Response code: %s", resp.status_code)
+
+
+@define
+class AsyncLinearIssuesClient:
+    """Non-blocking Linear Issues API using GraphQL over httpx."""
+
+    url: str = "https://api.linear.app/graphql"
+    """Linear GraphQL API URL."""
+
+    token: str = field(converter=str)
+    """Linear API key."""
+
+    @token.default
+    def _token_default(self) -> str:
+        return os.environ["LINEAR_API_KEY"]
+
+    logger: Logger = field()
+    """Logging instance."""
+
+    @logger.default
+    def _logger_default(self) -> Logger:
+        return getLogger(__name__)
+
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    """(connect, read) timeouts in seconds."""
+    retry: RetryPolicy = field(factory=RetryPolicy)
+    """Retry policy for connection errors, 429 and 5xx responses."""
+    label_cache: LabelCache = field(factory=LabelCache)
+    """Label IDs by team and name, so issues don't cost a label lookup each."""
+    http: "httpx.AsyncClient" = field()
+    """Pooled HTTP client, shared by every task reporting through this client."""
+
+    @http.default
+    def _http_default(self) -> "httpx.AsyncClient":
+        return build_async_client(self.timeout)
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """Send a request on the pooled client with retries."""
+        return await arequest(self.http, method, url, self.retry, self.logger, **kwargs)
+
+    async def _post(self, query: str, variables: Mapping[str, Any]) -> dict[str, Any]:
+        """POST a GraphQL document.
+
+        Args:
+            query: GraphQL document.
+            variables: GraphQL variables.
+
+        Returns:
+            Response body.
+        """
+
+        resp = await self._request(
+            "POST",
+            self.url,
+            headers={
+                "Authorization": self.token,
+                "Content-Type": "application/json",
+            },
+            json={
+                "query": query,
+                "variables": variables,
+            },
+        )
+
+        resp.raise_for_status()
+        self.logger.debug("Response code: %s", resp.status_code)
+        return resp.json()
+
+    async def _resolve_labels(
+        self, team_id: str, names: list[str], create: bool = False
+    ) -> list[str]:
+        """Resolve label names to IDs through the label cache.
+
+        Args:
+            team_id: Linear team ID.
+            names: label names.
+            create: create labels missing from the team.
+
+        Returns:
+            Label IDs of the labels that exist (or were created).
+        """
+
+        ids = []
+        for name in names:
+            hit, label_id = self.label_cache.lookup(team_id, name)
+            if not hit:
+                labels = LinearIssuesClient._team_labels(
+                    await self._post(_LINEAR_LABELS_QUERY, {"teamId": team_id}), self.logger
+                )
+                if labels is not None:
+                    self.label_cache.put_team(team_id, labels)
+                    label_id = labels.get(name)
+            if label_id is None and create:
+                label_id = LinearIssuesClient._created_label(
+                    await self._post(
+                        _LINEAR_LABEL_CREATE_MUTATION, {"teamId": team_id, "name": name}
+                    )
+                )
+                if label_id is not None:
+                    self.label_cache.put(team_id, name, label_id)
+            if label_id is None:
+                self.logger.warning(f"Label '{name}' not found for team {team_id}")
+            else:
+                ids.append(label_id)
+
+        return ids
+
+    async def create_issue(
+        self,
+        team_id: str,
+        description: str,
+        labels: Optional[list[str]] = None,
+        title: Optional[str] = None,
+        func_name: Optional[str] = None,
+        project_id: Optional[str] = None,
+        label_names: Optional[list[str]] = None,
+        create_labels: bool = False,
+        issue_id: Optional[str] = None,
+    ) -> Issue:
+        """Create an issue in Linear.
+
+        Args:
+            team_id: Linear team ID.
+            description: issue description.
+            labels: label IDs to apply (Linear requires UUIDs). If None, `label_names` are
+                resolved through the label cache.
+            title: issue title.
+            func_name: name of the decorated function.
+            project_id: Linear project ID to add the issue to (optional).
+            label_names: label names to apply when `labels` is None, defaults to "Bug".
+            create_labels: create labels in `label_names` missing from the team.
+            issue_id: UUID to create the issue with. Creating it again returns the existing
+                issue, so retries and replays never duplicate it.
+
+        Returns:
+            Created issue, normalized.
+        """
+
+        if title is None:
+            title = _title(func_name)
+
+        resolve = labels is None
+        if resolve:
+            label_names = label_names or ["Bug"]
+            labels = await self._resolve_labels(team_id, label_names, create_labels)
+
+        variables = {
+            "teamId": team_id,
+            "title": title,
+            "description": description,
+            "labelIds": labels,
+            "projectId": project_id,
+            "id": issue_id,
+        }
+
+        result = await self._post(_LINEAR_CREATE_MUTATION, variables)
+        if resolve and LinearIssuesClient._stale_labels(result):
+            self.logger.debug("Label IDs rejected, refreshing labels of team %s", team_id)
+            self.label_cache.invalidate(team_id)
+            variables["labelIds"] = await self._resolve_labels(team_id, label_names, create_labels)
+            result = await self._post(_LINEAR_CREATE_MUTATION, variables)
+
+        if issue_id is not None and "errors" in result:
+            existing = await self.get_issue(issue_id, team_id)
+            if existing is not None:
+                return existing
+        return LinearIssuesClient._created(result, team_id)
+
+    async def get_issue(self, issue_id: str, team_id: str) -> Optional[Issue]:
+        """Fetch an issue by UUID.
+
+        Args:
+            issue_id: Linear issue UUID.
+            team_id: Linear team ID.
+
+        Returns:
+            The issue, or None if it doesn't exist.
+        """
+
+        result = await self._post(_LINEAR_ISSUE_QUERY, {"id": issue_id})
+        return LinearIssuesClient._issue(result, team_id)
+
+    async def comment_issue(self, issue_id: str, body: str) -> None:
+        """Comment on an existing issue.
+
+        Args:
+            issue_id: Linear issue UUID.
+            body: comment body (Markdown).
+        """
+
+        result = await self._post(_LINEAR_COMMENT_MUTATION, {"issueId": issue_id, "body": body})
+        if "errors" in result:
+            raise ValueError(f"Linear API error: {result['errors']}")
+
+
+@define
+class AsyncGitlabIssuesClient:
+    """Non-blocking GitLab Project-pinned Issues API over httpx."""
+
+    url: str = "https://gitlab.com/api/v4"
+    """GitLab API URL."""
+    endpoint: str = field(default="projects/{project_id}/issues")
+    """Project-pinned GitLab issues endpoint."""
+
+    @endpoint.validator
+    def _validate_endpoint(self, attribute: str, value: str) -> str:
+        """Validate endpoint doesn't start with a forward slash."""
+        if value.startswith("/"):
+            raise ValueError("Endpoint cannot start with a forward slash.")
+
+    token: str = field(converter=str)
+    """Personal, project, or group token."""
+
+    @token.default
+    def _token_default(self) -> str:
+        return os.environ["GITLAB_TOKEN"]
+
+    logger: Logger = field()
+    """Logging instance."""
+
+    @logger.default
+    def _logger_default(self) -> Logger:
+        return getLogger(__name__)
+
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    """(connect, read) timeouts in seconds."""
+    retry: RetryPolicy = field(factory=RetryPolicy)
+    """Retry policy for connection errors, 429 and 5xx responses."""
+    http: "httpx.AsyncClient" = field()
+    """Pooled HTTP client, shared by every task reporting through this client."""
+
+    @http.default
+    def _http_default(self) -> "httpx.AsyncClient":
+        return build_async_client(self.timeout)
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """Send a request on the pooled client with retries, authenticated by header."""
+        kwargs["headers"] = {"PRIVATE-TOKEN": self.token, **kwargs.get("headers", {})}
+        return await arequest(self.http, method, url, self.retry, self.logger, **kwargs)
+
+    async def create_issue(
+        self,
+        project_id: int,
+        description: str,
+        labels: Optional[list[str]] = None,
+        title: Optional[str] = None,
+        func_name: Optional[str] = None,
+    ) -> Issue:
+        """Create an issue.
+
+        Args:
+            project_id: project ID.
+            description: issue description.
+            labels: issue labels.
+            title: issue title.
+            func_name: name of the decorated function.
+
+        Returns:
+            Created issue, normalized.
+        """
+
+        if title is None:
+            title = _title(func_name)
+
+        resp = await self._request(
+            "POST",
+            os.path.join(self.url, self.endpoint.format(project_id=project_id)),
+            json={
+                "title": title,
+                "description": description,
+                "labels": _labels(labels),
+            },
+        )
+
+        resp.raise_for_status()
+        self.logger.debug("Response code: %s", resp.status_code)
+        return GitlabIssuesClient._normalize_itype(resp.json())
+
+    async def comment_issue(self, project_id: int, issue_iid: str, body: str) -> None:
+        """Comment on an existing issue.
+
+        Args:
+            project_id: project ID.
+            issue_iid: project-scoped issue IID.
+            body: comment body (Markdown).
+        """
+
+        resp = await self._request(
+            "POST",
+            os.path.join(
+                self.url, self.endpoint.format(project_id=project_id), str(issue_iid), "notes"
+            ),
+            json={
+                "body": body,
+            },
+        )
+
+        resp.raise_for_status()
+        self.logger.debug("Response code: %s", resp.status_code)
+
+
+@define
+class AsyncGithubIssuesClient:
+    """Non-blocking GitHub Issues REST API over httpx.
+
+    Reports from coroutines are rare next to the rate limits, so only the retries shared with
+    the other async clients apply, not the pacing of `GithubIssuesClient`.
+    """
+
+    url: str = "https://api.github.com"
+    """GitHub REST API URL."""
+
+    token: str = field(converter=str)
+    """Fine-grained or classic personal access token, or a GitHub Actions token."""
+
+    @token.default
+    def _token_default(self) -> str:
+        return os.environ["GITHUB_TOKEN"]
+
+    logger: Logger = field()
+    """Logging instance."""
+
+    @logger.default
+    def _logger_default(self) -> Logger:
+        return getLogger(__name__)
+
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    """(connect, read) timeouts in seconds."""
+    retry: RetryPolicy = field(factory=RetryPolicy)
+    """Retry policy for connection errors, 429 and 5xx responses."""
+    http: "httpx.AsyncClient" = field()
+    """Pooled HTTP client, shared by every task reporting through this client."""
+
+    @http.default
+    def _http_default(self) -> "httpx.AsyncClient":
+        return build_async_client(self.timeout)
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """Send a request on the pooled client with retries, authenticated by header."""
+        kwargs["headers"] = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            **kwargs.get("headers", {}),
+        }
+        return await arequest(self.http, method, url, self.retry, self.logger, **kwargs)
+
+    def _issues_url(self, repo: str, *parts: str) -> str:
+        """URL of a repository's issues endpoint."""
+        return "/".join([self.url, "repos", repo, "issues", *parts])
+
+    async def create_issue(
+        self,
+        repo: str,
+        description: str,
+        labels: Optional[list[str]] = None,
+        title: Optional[str] = None,
+        func_name: Optional[str] = None,
+    ) -> Issue:
+        """Create an issue.
+
+        Args:
+            repo: repository in 'owner/repo' format.
+            description: issue description.
+            labels: issue labels.
+            title: issue title.
+            func_name: name of the decorated function.
+
+        Returns:
+            Created issue, normalized.
+        """
+
+        if title is None:
+            title = _title(func_name)
+
+        resp = await self._request(
+            "POST",
+            self._issues_url(repo),
+            json={
+                "title": title,
+                "body": description,
+                "labels": _labels(labels),
+            },
+        )
+
+        resp.raise_for_status()
+        self.logger.debug("Response code: %s", resp.status_code)
+        return GithubIssuesClient._normalize_itype(resp.json(), repo)
+
+    async def comment_issue(self, repo: str, number: str, body: str) -> None:
+        """Comment on an existing issue.
+
+        Args:
+            repo: repository in 'owner/repo' format.
+            number: issue number.
+            body: comment body (Markdown).
+        """
+
+        resp = await self._request(
+            "POST", self._issues_url(repo, str(number), "comments"), json={"body": body}
+        )
+
+        resp.raise_for_status()
+        self.logger.debug("Response code: %s", resp.status_code)
@@ -1,38 +1,34 @@
 """Listener for Bug Buddy."""
 
+import json
 import os
-import platform
-import re
+import sys
+import time
 import traceback
+import uuid
 from datetime import datetime, timezone
+from functools import partial
 from logging import Logger, getLogger
-from typing import TYPE_CHECKING, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Sequence, Union
 
+import attrs
 from attrs import define, field
 
+from bug_buddy._render import DescriptionRenderer
+from bug_buddy.cache import CacheBackend, JsonlCacheBackend
+from bug_buddy.collector import CollectorClient
+from bug_buddy.context import execution_context
+from bug_buddy.fingerprint import FingerprintIndex, Occurrence, fingerprint
 from bug_buddy.issue import Issue
+from bug_buddy.outbox import Outbox
+from bug_buddy.policy import ReportPolicy
+from bug_buddy.reporter import BackgroundReporter
 
 if TYPE_CHECKING:
-    from bug_buddy.integration import Integration
-
-# Environment variables to check for CI/execution context
-_CI_ENV_VARS = [
-    # GitHub Actions
-    ("GITHUB_ACTIONS", "GitHub Actions"),
-    ("GITHUB_RUN_ID", "Run ID"),
-    ("GITHUB_RUN_URL", "Run URL"),
-    ("GITHUB_REPOSITORY", "Repository"),
-    ("GITHUB_REF_NAME", "Branch/Tag"),
-    ("GITHUB_SHA", "Commit SHA"),
-    ("GITHUB_ACTOR", "Triggered by"),
-    # GitLab CI
-    ("GITLAB_CI", "GitLab CI"),
-    ("CI_JOB_ID", "Job ID"),
-    ("CI_JOB_URL", "Job URL"),
-    ("CI_PROJECT_PATH", "Project"),
-    ("CI_COMMIT_REF_NAME", "Branch/Tag"),
-    ("CI_COMMIT_SHA", "Commit SHA"),
-]
+    from bug_buddy.integration import Integration, IssueDraft
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+"""Directory of the bug_buddy package, whose frames are left out of reports."""
 
 
 @define
@@ -48,6 +44,28 @@ class Listener:
     def _logger_default(self) -> Logger:
         return getLogger(__name__)
 
+    cache: CacheBackend = field(factory=JsonlCacheBackend)
+    """Local cache backend."""
+    index: Optional[FingerprintIndex] = field(factory=FingerprintIndex)
+    """Fingerprint index used to deduplicate repeat failures, None to disable."""
+    update_interval: Optional[float] = None
+    """Minimum seconds between comments on the remote issue of a repeat failure, None to never
+    comment."""
+    reporter: Optional[BackgroundReporter] = None
+    """Background queue remote issues are created from, None to create them inline."""
+    outbox: Optional[Outbox] = None
+    """Spool for reports the tracker could not take, replayed after the next successful report.
+    None lets tracker errors propagate."""
+    offline: bool = False
+    """Spool every report without contacting the tracker."""
+    renderer: DescriptionRenderer = field(factory=DescriptionRenderer)
+    """Issue description renderer, with its size budget."""
+    policy: Optional[ReportPolicy] = None
+    """Rate limits and sampling applied before a failure is recorded."""
+    collector: Optional[CollectorClient] = None
+    """Connection to the host's collector, which records failures for every process when it's
+    listening. None always records in-process."""
+
     @property
     def mascot(self):
         """Buzzzzz"""
@@ -63,56 +81,68 @@ class Listener:
             Filtered traceback.
         """
 
-        # Files that are part of bug_buddy internals
-        bug_buddy_files = {"listener.py", "bb.py", "_di_container.py"}
+        return [t for t in tb if not t.filename.startswith(_PACKAGE_DIR)]
 
-        filtered_tb = []
-        for t in tb:
-            if os.path.basename(t.filename) not in bug_buddy_files:
-                filtered_tb.append(t)
+    def admit(self, tb: Sequence[traceback.FrameSummary], exception: type, func_name: str) -> bool:
+        """Decide whether a failure should be recorded, before any work is spent on it.
 
-        return filtered_tb
-
-    def _get_execution_context(self) -> list[tuple[str, str]]:
-        """Gather execution context information.
+        Args:
+            tb: traceback.
+            exception: exception type.
+            func_name: name of the decorated function.
 
         Returns:
-            List of (label, value) tuples for context info.
+            Whether to record the failure, always True without a policy.
         """
-        context = []
 
-        # Timestamp
-        context.append(("Timestamp", datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")))
+        if self.policy is None:
+            return True
+        fp = fingerprint(exception, self.filter_tb(tb))
+        if self.policy.admit(fp, func_name):
+            return True
+        if self.index is not None:
+            # still counted, so the issue's next update reports every occurrence
+            self.index.seen(fp, self.integration.scope if self.integration else "local")
+        return False
 
-        # Machine info
-        context.append(("Platform", platform.platform()))
-        context.append(("Python", platform.python_version()))
+    def detected(self, issue: Issue) -> None:
+        """Log where a failure was recorded.
 
-        # Working directory
-        context.append(("Working Directory", os.getcwd()))
+        Args:
+            issue: issue returned by `record`.
+        """
 
-        # User (if available)
-        user = os.environ.get("USER") or os.environ.get("USERNAME")
-        if user:
-            context.append(("User", user))
+        integration = self.integration
+        detection = self.mascot + " cached."
+        if issue.state == "collected":
+            detection = self.mascot + " sent to the collector."
+        elif integration and issue.state == "pending":
+            detection += f" Queued for {integration.name}."
+        elif integration and issue.state == "spooled":
+            detection += f" Spooled for {integration.name}."
+        elif integration:
+            detection += f" Tracking at {integration.name} issue {issue.id}."
 
-        # CI/environment context
-        ci_context = []
-        for env_var, label in _CI_ENV_VARS:
-            value = os.environ.get(env_var)
-            if value:
-                ci_context.append((label, value))
+        self.logger.info(detection)
 
-        if ci_context:
-            context.extend(ci_context)
+    def _get_execution_context(self) -> list[tuple[str, str]]:
+        """Gather execution context information.
 
-        return context
+        Everything but the timestamp comes from a per-process snapshot, see
+        `bug_buddy.context`.
+
+        Returns:
+            List of (label, value) tuples for context info.
+        """
+        return execution_context()
 
     def description(
         self,
         tb: Sequence[traceback.FrameSummary],
         func_name: str,
         func_source: Optional[str] = None,
+        context: Optional[Sequence[tuple[str, str]]] = None,
+        exc: Optional[BaseException] = None,
     ) -> str:
         """Format the description of the issue.
 
@@ -124,97 +154,737 @@ class Listener:
             tb: traceback.
             func_name: name of the decorated function.
             func_source: source code of the decorated function.
+            context: execution context, gathered when not given.
+            exc: the exception, defaults to the one being handled.
 
         Returns:
-            Formatted description.
+            Formatted description, within the renderer's byte budget.
         """
 
-        rows = []
+        if context is None:
+            context = self._get_execution_context()
+        if exc is None:
+            exc = sys.exc_info()[1]
 
-        # Function source code
-        rows.append("### Origin")
-        rows.append("```python")
-        if func_source:
-            rows.append(func_source.rstrip())
-        else:
-            rows.append(func_name)
-        rows.append("```")
-        rows.append("")
-
-        # Source/execution context
-        rows.append("### Platform")
-        rows.append("| Property | Value |")
-        rows.append("| --- | --- |")
-        for label, value in self._get_execution_context():
-            rows.append(f"| {label} | `{value}` |")
-        rows.append("")
-
-        # Traceback table
-        rows.append("### Traceback")
-        rows.append("| File | Callable | Line | Code |")
-        rows.append("| --- | --- | --- | --- |")
-        for t in tb:
-            esc_callable = re.sub("_", r"\_", t.name)
-            rows.append(f"| {t.filename} | {esc_callable} | {t.lineno} | {t.line} |")
-
-        # Raw traceback
-        rows.append("")
-        rows.append("### Raw traceback")
-        rows.append("```")
-        rows.append(traceback.format_exc())
-        rows.append("```")
-
-        return "\n".join(rows)
+        return self.renderer.render(tb, func_name, func_source, context=context, exc=exc)
 
-    def record(
+    def _update_body(self, issue: Issue, occurrence: Occurrence) -> Optional[str]:
+        """Claim a comment on the remote issue of a repeat failure, once per update interval.
+
+        Args:
+            issue: issue created for the first occurrence.
+            occurrence: latest occurrence of the failure.
+
+        Returns:
+            Comment body if a comment is due, else None.
+        """
+
+        if not self.integration or self.update_interval is None or not issue.remote_id:
+            return None
+        if not self.index.claim_update(
+            occurrence.fingerprint, occurrence.scope, self.update_interval
+        ):
+            return None
+
+        last_seen = datetime.fromtimestamp(occurrence.last_seen, timezone.utc)
+        return (
+            f"Seen {occurrence.count} times, most recently at "
+            f"`{last_seen.strftime('%Y-%m-%d %H:%M:%S UTC')}`."
+        )
+
+    def _comment(self, issue: Issue, body: str) -> None:
+        """Comment on a remote issue.
+
+        Args:
+            issue: remote issue.
+            body: comment body.
+        """
+
+        client = self.integration.get_client(self.logger)
+        self.integration.comment_issue(client=client, issue=issue, body=body)
+
+    async def _acomment(self, issue: Issue, body: str) -> None:
+        """Comment on a remote issue without blocking the event loop.
+
+        Args:
+            issue: remote issue.
+            body: comment body.
+        """
+
+        client = self.integration.get_async_client(self.logger)
+        await self.integration.acomment_issue(client=client, issue=issue, body=body)
+
+    @staticmethod
+    def _local_issue(
+        title: str, description: str, labels: list[str], state: str = "local"
+    ) -> Issue:
+        """Build an issue that exists only on this machine.
+
+        Args:
+            title: issue title.
+            description: issue description.
+            labels: issue labels.
+            state: issue state.
+
+        Returns:
+            Local issue.
+        """
+
+        now = datetime.now().isoformat()
+        return Issue._unchecked(
+            id=0,
+            title=title,
+            state=state,
+            project_id=0,
+            author=("local", "local", "active"),
+            created_at=now,
+            updated_at=now,
+            description=description,
+            labels=labels,
+        )
+
+    def _prepare(
         self,
         tb: Sequence[traceback.FrameSummary],
         exception: type,
         func_name: str,
         func_source: Optional[str] = None,
-    ) -> Issue:
-        """Record the traceback.
+        exc: Optional[BaseException] = None,
+    ) -> tuple[Optional["_Draft"], Issue, Optional[str]]:
+        """Deduplicate a failure and render the report of a new one.
 
         Args:
             tb: traceback.
             exception: exception type.
             func_name: name of the decorated function.
             func_source: source code of the decorated function.
+            exc: the exception, defaults to the one being handled.
 
         Returns:
-            Issue metadata.
+            See `_stage`.
         """
 
         # filter and format traceback for issue description
         filtered_tb = self.filter_tb(tb)
-        desc = self.description(filtered_tb, func_name, func_source)
+        fp = fingerprint(exception, filtered_tb)
+
+        if self.collector is not None and self.collector.available():
+            issue = self._collect(fp, filtered_tb, exception, func_name, func_source, exc)
+            if issue is not None:
+                return None, issue, None
+
+        return self._stage(
+            fp,
+            func_name,
+            [exception.__name__],
+            partial(self.description, filtered_tb, func_name, func_source, exc=exc),
+        )
+
+    def _collect(
+        self,
+        fp: str,
+        tb: Sequence[traceback.FrameSummary],
+        exception: type,
+        func_name: str,
+        func_source: Optional[str],
+        exc: Optional[BaseException],
+    ) -> Optional[Issue]:
+        """Send a rendered failure to the collector, which deduplicates and records it.
+
+        Args:
+            fp: failure fingerprint.
+            tb: filtered traceback.
+            exception: exception type.
+            func_name: name of the decorated function.
+            func_source: source code of the decorated function.
+            exc: the exception, defaults to the one being handled.
+
+        Returns:
+            Issue in the `collected` state, or the indexed issue of a repeat failure, None if
+            the collector didn't take the report.
+        """
+
+        spec = self.integration.spec() if self.integration else None
+        scope = self.integration.scope if self.integration else "local"
+        occurrence = self.index.get(fp, scope) if self.index is not None else None
+        if occurrence is not None:
+            # a repeat is only counted, by the collector, so it isn't rendered
+            sent = self.collector.send(
+                {"integration": spec, "fingerprint": fp, "func_name": func_name, "repeat": True}
+            )
+            return Issue._unchecked(**occurrence.issue) if sent else None
+
+        context = self._get_execution_context()
+        description = self.description(tb, func_name, func_source, context=context, exc=exc)
+        labels = [exception.__name__]
+        sent = self.collector.send(
+            {
+                "integration": spec,
+                "fingerprint": fp,
+                "func_name": func_name,
+                "labels": labels,
+                "description": description,
+                "context": context,
+            }
+        )
+        if not sent:
+            return None
+
+        return self._local_issue(f"BugBuddy-{func_name}", description, labels, state="collected")
+
+    def _stage(
+        self,
+        fp: str,
+        func_name: str,
+        labels: list[str],
+        render: Callable[..., str],
+        context: Optional[Sequence[tuple[str, str]]] = None,
+    ) -> tuple[Optional["_Draft"], Issue, Optional[str]]:
+        """Deduplicate a fingerprinted failure and draft the report of a new one.
+
+        Args:
+            fp: failure fingerprint.
+            func_name: name of the decorated function.
+            labels: issue labels.
+            render: renders the description given `context=`, only called for a new failure.
+            context: execution context, gathered when not given.
+
+        Returns:
+            The draft report of a new failure (None for a repeat), the issue to return to the
+            caller (the existing issue for a repeat, a local or pending issue otherwise) and the
+            comment due on the remote issue of a repeat, if any.
+        """
+
+        scope = self.integration.scope if self.integration else "local"
+        state = "pending" if self.integration else "local"
+        key = str(uuid.uuid4())
+        title = f"BugBuddy-{func_name}-{key}"
+        if self.index is not None:
+            # claimed before the remote issue exists so concurrent repeats are deduplicated,
+            # the description is only rendered by the winner
+            claimed = self._local_issue(title, "", labels, state=state)
+            occurrence = self.index.claim(fp, scope, claimed._asdict())
+            if occurrence is not None:
+                issue = Issue._unchecked(**occurrence.issue)
+                self.logger.debug("%s seen %s times as %s", fp[:12], occurrence.count, issue.title)
+                return None, issue, self._update_body(issue, occurrence)
+
+        if context is None:
+            context = self._get_execution_context()
+        draft = _Draft(
+            key=key,
+            fingerprint=fp,
+            scope=scope,
+            title=title,
+            description=render(context=context),
+            labels=labels,
+            func_name=func_name,
+            cache_context={
+                "func_name": func_name,
+                "commit_sha": dict(context).get("Commit SHA"),
+                "fingerprint": fp,
+            },
+        )
+
+        issue = self._local_issue(draft.title, draft.description, draft.labels, state=state)
+        return draft, issue, None
+
+    def _tracked(self, draft: "_Draft", issue: Issue) -> Issue:
+        """Index and cache a newly created issue.
+
+        Args:
+            draft: report the issue was created from.
+            issue: created issue.
+
+        Returns:
+            The issue.
+        """
+
+        if self.index is not None:
+            # replaces the pending issue claimed by _stage
+            self.index.add(draft.fingerprint, draft.scope, issue._asdict(), replace=True)
+
+        # cache issues to a local archive
+        issue.cache(backend=self.cache, context=draft.cache_context)
+
+        return issue
+
+    def _replayed(self, delivered: Sequence[tuple["_Draft", Issue]]) -> None:
+        """Index the issues created for spooled reports, and update their cached records.
+
+        The `spooled` records cached by `_spool` are updated in place, in one pass, matched by
+        title, which carries the report's idempotency key. Backends without updates get the
+        issues appended instead.
+
+        Args:
+            delivered: each replayed report, with the issue created for it.
+        """
+
+        if not delivered:
+            return
+        if self.index is not None:
+            for draft, issue in delivered:
+                self.index.add(draft.fingerprint, draft.scope, issue._asdict(), replace=True)
+
+        records = [{**issue._clean(), **draft.cache_context} for draft, issue in delivered]
+        if self.cache.supports_update:
+            self.cache.update(records, by=("title",))
+        else:
+            for record in records:
+                self.cache.append(record)
+
+    def _forget(self, draft: "_Draft") -> None:
+        """Release the fingerprint of a report that was never delivered.
+
+        Args:
+            draft: undelivered report.
+        """
+
+        if self.index is not None:
+            self.index.forget(draft.fingerprint, draft.scope)
+
+    def _spool(self, draft: "_Draft", error: Optional[BaseException] = None) -> Issue:
+        """Spool a report to the outbox and cache it locally until it is replayed.
+
+        Args:
+            draft: undelivered report.
+            error: why the report could not be delivered.
+
+        Returns:
+            Local issue in the `spooled` state.
+        """
+
+        self.outbox.put(
+            draft.key,
+            {
+                "integration": self.integration.spec(),
+                "draft": attrs.asdict(draft),
+                "spooled_at": time.time(),
+                "attempts": 0 if error is None else 1,
+                "error": None if error is None else repr(error),
+            },
+        )
+        if error is not None:
+            self.logger.warning(
+                f"Could not reach {self.integration.name} ({type(error).__name__}), "
+                f"report spooled to {self.outbox.path}."
+            )
+
+        issue = self._local_issue(draft.title, draft.description, draft.labels, state="spooled")
+        if self.index is not None:
+            # a spooled report is replayed, not re-claimed once its pending entry goes stale
+            self.index.add(draft.fingerprint, draft.scope, issue._asdict(), replace=True)
+        issue.cache(backend=self.cache, context=draft.cache_context)
+        return issue
+
+    def _undelivered(self, draft: "_Draft", error: BaseException) -> Issue:
+        """Spool a report whose remote issue could not be created, or re-raise.
+
+        Args:
+            draft: undelivered report.
+            error: error raised creating the remote issue.
+
+        Returns:
+            Spooled issue.
+        """
+
+        if self.outbox is None or not isinstance(error, Exception):
+            self._forget(draft)
+            raise error
+
+        return self._spool(draft, error)
+
+    def _delivered(self, draft: "_Draft", issue: Issue) -> Issue:
+        """Track a created issue, and replay the outbox now that the tracker is reachable.
+
+        Args:
+            draft: report the issue was created from.
+            issue: created issue.
+
+        Returns:
+            The issue.
+        """
+
+        issue = self._tracked(draft, issue)
+        if self.outbox is not None:
+            self.outbox.replay_in_background(self.deliver_batch)
+        return issue
+
+    def deliver(self, entry: dict[str, Any]) -> Issue:
+        """Create the remote issue of a spooled report.
+
+        The report's idempotency key is passed to the tracker, and trackers without idempotency
+        keys are first searched for an issue created by an earlier attempt, so replaying a
+        report never creates a duplicate.
+
+        Args:
+            entry: report spooled by `_spool`.
+
+        Returns:
+            Created (or previously created) issue.
+        """
+
+        from bug_buddy.integration import from_spec
+
+        integration = from_spec(entry["integration"])
+        draft = _Draft(**entry["draft"])
+        client = integration.get_client(self.logger)
+
+        issue = integration.find_issue(client, draft.title)
+        if issue is None:
+            issue = integration.create_issue(
+                client=client,
+                description=draft.description,
+                labels=draft.labels,
+                func_name=draft.func_name,
+                title=draft.title,
+                idempotency_key=draft.key,
+            )
+
+        self._replayed([(draft, issue)])
+        return issue
+
+    def deliver_batch(self, entries: Sequence[dict[str, Any]]) -> list[Optional[Exception]]:
+        """Create the remote issues of spooled reports, batched per integration.
 
-        if self.integration:
+        Same as `deliver`, but the issues not found on the tracker are created with one
+        `Integration.create_issues` call per integration.
+
+        Args:
+            entries: reports spooled by `_spool`.
+
+        Returns:
+            None for each delivered report, the error for each report that wasn't, in order.
+        """
+
+        from bug_buddy.integration import from_spec
+
+        errors: list[Optional[Exception]] = [None] * len(entries)
+        groups: dict[str, list[int]] = {}
+        for i, entry in enumerate(entries):
+            groups.setdefault(json.dumps(entry["integration"], sort_keys=True), []).append(i)
+
+        for indices in groups.values():
+            integration = from_spec(entries[indices[0]]["integration"])
+            client = integration.get_client(self.logger)
+
+            missing, delivered = [], []
+            for i in indices:
+                draft = _Draft(**entries[i]["draft"])
+                try:
+                    issue = integration.find_issue(client, draft.title)
+                except Exception as e:
+                    errors[i] = e
+                    continue
+                if issue is None:
+                    missing.append((i, draft))
+                else:
+                    delivered.append((draft, issue))
+
+            results = integration.create_issues(client, [d.issue_draft() for _, d in missing])
+            for (i, draft), result in zip(missing, results):
+                if result.ok:
+                    delivered.append((draft, result.issue))
+                else:
+                    errors[i] = result.error
+
+            self._replayed(delivered)
+
+        return errors
+
+    def _track(self, draft: "_Draft") -> Issue:
+        """Create the remote issue for a new failure.
+
+        Args:
+            draft: report to create the issue from.
+
+        Returns:
+            Created issue, or the spooled issue if it could not be created.
+        """
+
+        if self.offline and self.outbox is not None:
+            return self._spool(draft)
+
+        try:
+            # a client that can't be built fails like the request would, releasing the draft
             client = self.integration.get_client(self.logger)
             issue = self.integration.create_issue(
                 client=client,
-                description=desc,
-                labels=[exception.__name__],
-                func_name=func_name,
+                description=draft.description,
+                labels=draft.labels,
+                func_name=draft.func_name,
+                title=draft.title,
+                idempotency_key=draft.key,
             )
-        else:
-            # Create a local-only issue when no integration is configured
-            import uuid
-            from datetime import datetime
-
-            issue = Issue(
-                id=0,
-                title=f"BugBuddy-{func_name}-" + str(uuid.uuid4()),
-                state="local",
-                project_id=0,
-                author=("local", "local", "active"),
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat(),
-                description=desc,
-                labels=[exception.__name__],
+        except BaseException as e:
+            return self._undelivered(draft, e)
+
+        return self._delivered(draft, issue)
+
+    async def _atrack(self, draft: "_Draft") -> Issue:
+        """Create the remote issue for a new failure without blocking the event loop.
+
+        Args:
+            draft: report to create the issue from.
+
+        Returns:
+            Created issue, or the spooled issue if it could not be created.
+        """
+
+        if self.offline and self.outbox is not None:
+            return self._spool(draft)
+
+        try:
+            # a client that can't be built fails like the request would, releasing the draft
+            client = self.integration.get_async_client(self.logger)
+            issue = await self.integration.acreate_issue(
+                client=client,
+                description=draft.description,
+                labels=draft.labels,
+                func_name=draft.func_name,
+                title=draft.title,
+                idempotency_key=draft.key,
             )
+        except BaseException as e:
+            return self._undelivered(draft, e)
 
-        # cache issues to a local archive
-        issue.cache()
+        return self._delivered(draft, issue)
 
-        return issue
+    def record(
+        self,
+        tb: Sequence[traceback.FrameSummary],
+        exception: type,
+        func_name: str,
+        func_source: Optional[str] = None,
+        exc: Optional[BaseException] = None,
+    ) -> Issue:
+        """Record the traceback.
+
+        Failures whose fingerprint was already seen in the same integration scope only bump the
+        local occurrence counter and return the existing issue. With a background reporter the
+        remote issue is created off the calling thread and a pending issue is returned.
+
+        Args:
+            tb: traceback.
+            exception: exception type.
+            func_name: name of the decorated function.
+            func_source: source code of the decorated function.
+            exc: the exception, defaults to the one being handled.
+
+        Returns:
+            Issue metadata.
+        """
+
+        return self._record(*self._prepare(tb, exception, func_name, func_source, exc=exc))
+
+    def record_rendered(
+        self,
+        fingerprint: str,
+        func_name: str,
+        labels: list[str],
+        description: str,
+        context: Sequence[tuple[str, str]] = (),
+    ) -> Issue:
+        """Record a failure fingerprinted and rendered elsewhere, e.g. in another process.
+
+        Args:
+            fingerprint: failure fingerprint.
+            func_name: name of the failed function.
+            labels: issue labels.
+            description: rendered issue description.
+            context: execution context the description was rendered with.
+
+        Returns:
+            Issue metadata.
+        """
+
+        staged = self._stage(
+            fingerprint, func_name, labels, lambda context: description, context=context
+        )
+        return self._record(*staged)
+
+    def record_repeat(self, fingerprint: str, func_name: str) -> Issue:
+        """Record another occurrence of an indexed failure, e.g. one sent without its report.
+
+        Args:
+            fingerprint: failure fingerprint.
+            func_name: name of the failed function.
+
+        Returns:
+            Issue created for the first occurrence.
+
+        Raises:
+            LookupError: if the fingerprint isn't indexed, e.g. its remote issue couldn't be
+                created meanwhile.
+        """
+
+        scope = self.integration.scope if self.integration else "local"
+        occurrence = None
+        if self.index is not None:
+            occurrence = self.index.seen(fingerprint, scope)
+        if occurrence is None:
+            raise LookupError(f"{func_name} failure {fingerprint[:12]} is not indexed.")
+
+        issue = Issue._unchecked(**occurrence.issue)
+        return self._record(None, issue, self._update_body(issue, occurrence))
+
+    def record_rendered_batch(
+        self, failures: Sequence[Mapping[str, Any]], max_workers: Optional[int] = None
+    ) -> list[Union[Issue, Exception]]:
+        """Record failures rendered elsewhere, creating the remote issues of new ones in one batch.
+
+        Args:
+            failures: `record_rendered` arguments of each failure, or `record_repeat` arguments
+                with `repeat` set for the repeats of an indexed failure.
+            max_workers: issues created in parallel, see `Integration.create_issues`.
+
+        Returns:
+            Issue metadata, or the error recording failed with, for each failure in order.
+        """
+
+        results: list[Union[Issue, Exception, None]] = [None] * len(failures)
+        batch = []
+        for i, failure in enumerate(failures):
+            try:
+                if failure.get("repeat"):
+                    results[i] = self.record_repeat(failure["fingerprint"], failure["func_name"])
+                    continue
+                description = failure["description"]
+                draft, issue, update = self._stage(
+                    failure["fingerprint"],
+                    failure["func_name"],
+                    failure["labels"],
+                    lambda context, description=description: description,
+                    context=failure.get("context", ()),
+                )
+                if draft is None or not self.integration or self.reporter is not None:
+                    results[i] = self._record(draft, issue, update)
+                elif self.offline and self.outbox is not None:
+                    results[i] = self._spool(draft)
+                else:
+                    batch.append((i, draft))
+            except Exception as e:
+                results[i] = e
+
+        if batch:
+            drafts = [draft.issue_draft() for _, draft in batch]
+            try:
+                client = self.integration.get_client(self.logger)
+            except Exception as e:
+                from bug_buddy.integration import BatchResult
+
+                created = [BatchResult(d, error=e) for d in drafts]
+            else:
+                created = self.integration.create_issues(client, drafts, max_workers=max_workers)
+            for (i, draft), result in zip(batch, created):
+                try:
+                    if result.ok:
+                        results[i] = self._delivered(draft, result.issue)
+                    else:
+                        results[i] = self._undelivered(draft, result.error)
+                except Exception as e:
+                    results[i] = e
+
+        return results
+
+    def _record(self, draft: Optional["_Draft"], issue: Issue, update: Optional[str]) -> Issue:
+        """Comment on, cache or create the issue of a staged failure, see `record`."""
+
+        if update is not None:
+            if self.reporter is not None:
+                self.reporter.submit(partial(self._comment, issue, update))
+            else:
+                self._comment(issue, update)
+
+        if draft is None:
+            return issue
+
+        if not self.integration:
+            issue.cache(backend=self.cache, context=draft.cache_context)
+            return issue
+
+        if self.reporter is not None:
+            self.reporter.submit(partial(self._track, draft), on_drop=partial(self._forget, draft))
+            return issue
+
+        return self._track(draft)
+
+    async def arecord(
+        self,
+        tb: Sequence[traceback.FrameSummary],
+        exception: type,
+        func_name: str,
+        func_source: Optional[str] = None,
+        exc: Optional[BaseException] = None,
+    ) -> Issue:
+        """Record the traceback from a coroutine.
+
+        Same as `record`, but the remote issue is created through the integration's shared
+        async client so reporting never blocks the event loop.
+
+        Args:
+            tb: traceback.
+            exception: exception type.
+            func_name: name of the decorated function.
+            func_source: source code of the decorated function.
+            exc: the exception, defaults to the one being handled.
+
+        Returns:
+            Issue metadata.
+        """
+
+        draft, issue, update = self._prepare(tb, exception, func_name, func_source, exc=exc)
+
+        if update is not None:
+            if self.reporter is not None:
+                self.reporter.submit(partial(self._comment, issue, update))
+            else:
+                await self._acomment(issue, update)
+
+        if draft is None:
+            return issue
+
+        if not self.integration:
+            issue.cache(backend=self.cache, context=draft.cache_context)
+            return issue
+
+        if self.reporter is not None:
+            self.reporter.submit(partial(self._track, draft), on_drop=partial(self._forget, draft))
+            return issue
+
+        return await self._atrack(draft)
+
+
+@define
+class _Draft:
+    """Rendered report of a new failure, ready to be sent to the tracker."""
+
+    key: str
+    """Idempotency key, also the UUID in the issue title."""
+    fingerprint: str
+    """Failure fingerprint."""
+    scope: str
+    """Integration scope."""
+    title: str
+    """Issue title."""
+    description: str
+    """Issue description."""
+    labels: list[str]
+    """Issue labels."""
+    func_name: str
+    """Name of the decorated function."""
+    cache_context: dict[str, Any]
+    """Extra fields cached alongside the issue."""
+
+    def issue_draft(self) -> "IssueDraft":
+        """The issue to create for this report."""
+
+        from bug_buddy.integration import IssueDraft
+
+        return IssueDraft(
+            description=self.description,
+            labels=self.labels,
+            func_name=self.func_name,
+            title=self.title,
+            idempotency_key=self.key,
+        )
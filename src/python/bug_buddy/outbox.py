@@ -0,0 +1,213 @@
+"""Durable outbox of undelivered reports for Bug Buddy."""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger, getLogger
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence
+
+from attrs import define, field
+
+from bug_buddy.cache import cache_path
+
+OUTBOX_DIR = ".bug_buddy.outbox"
+"""Default outbox directory name, relative to $HOME."""
+
+Deliver = Callable[[list[dict[str, Any]]], Sequence[Optional[BaseException]]]
+"""Sends a batch of reports to their tracker, returning None or the error for each report."""
+
+_PENDING = ".json"
+_INFLIGHT = ".inflight"
+
+
+@define
+class Outbox:
+    """Spool directory of reports whose remote issue could not be created.
+
+    Each report is one JSON file named by its idempotency key, written atomically and fsynced.
+    A replay claims a report by renaming it, so concurrent flushes never send the same report
+    twice, delivers the claimed reports in batches, and puts back the ones whose delivery fails
+    again.
+    """
+
+    path: str = field(factory=lambda: cache_path(OUTBOX_DIR))
+    """Spool directory."""
+    concurrency: int = 4
+    """Batches delivered in parallel during a replay."""
+    batch_size: int = 20
+    """Reports delivered per batch."""
+    stale_after: float = 600.0
+    """Seconds after which a claimed report whose replay never finished is claimable again."""
+    logger: Logger = field()
+    """Logger instance."""
+
+    @logger.default
+    def _logger_default(self) -> Logger:
+        return getLogger(__name__)
+
+    _replaying: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def _file(self, key: str, suffix: str = _PENDING) -> str:
+        """Path of a spooled report."""
+        return os.path.join(self.path, key + suffix)
+
+    def put(self, key: str, entry: Mapping[str, Any]) -> None:
+        """Spool a report.
+
+        Args:
+            key: idempotency key of the report.
+            entry: JSON serializable report.
+        """
+
+        os.makedirs(self.path, exist_ok=True)
+        tmp = self._file(key, f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._file(key))
+
+    def pending(self) -> list[str]:
+        """Keys of the reports waiting to be replayed.
+
+        Returns:
+            Idempotency keys, oldest first.
+        """
+
+        try:
+            names = [e for e in os.scandir(self.path) if e.name.endswith(_PENDING)]
+        except FileNotFoundError:
+            return []
+
+        names.sort(key=lambda e: e.stat().st_mtime)
+        return [e.name[: -len(_PENDING)] for e in names]
+
+    def _recover(self) -> None:
+        """Release claims left behind by replays that died."""
+
+        try:
+            entries = list(os.scandir(self.path))
+        except FileNotFoundError:
+            return
+
+        cutoff = time.time() - self.stale_after
+        for e in entries:
+            if e.name.endswith(_INFLIGHT) and e.stat().st_mtime < cutoff:
+                key = e.name[: -len(_INFLIGHT)]
+                try:
+                    os.replace(e.path, self._file(key))
+                except OSError:
+                    continue
+                self.logger.debug("Recovered abandoned report %s", key)
+
+    def _claim(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Claim pending reports, skipping any another replay got to first.
+
+        Yields:
+            Idempotency key and report.
+        """
+
+        for key in self.pending():
+            inflight = self._file(key, _INFLIGHT)
+            try:
+                os.rename(self._file(key), inflight)
+                # the claim's age is what marks it stale
+                os.utime(inflight)
+                with open(inflight, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except FileNotFoundError:
+                continue
+            except ValueError:
+                self.logger.warning("Discarding unreadable report %s", key)
+                os.remove(inflight)
+                continue
+            yield key, entry
+
+    def _settle(self, key: str, entry: dict[str, Any], error: Optional[BaseException]) -> bool:
+        """Release a claimed report, spooling it back if its delivery failed.
+
+        Returns:
+            Whether the report was delivered.
+        """
+
+        if error is not None:
+            entry["attempts"] = entry.get("attempts", 0) + 1
+            entry["error"] = repr(error)
+            self.logger.debug("Replay of %s failed: %r", key, error)
+            self.put(key, entry)
+
+        os.remove(self._file(key, _INFLIGHT))
+        return error is None
+
+    def _deliver(self, deliver: Deliver, claimed: list[tuple[str, dict[str, Any]]]) -> int:
+        """Deliver a batch of claimed reports.
+
+        Returns:
+            Number of reports delivered.
+        """
+
+        entries = [entry for _, entry in claimed]
+        try:
+            errors = deliver([dict(entry) for entry in entries])
+        except Exception as e:
+            errors = [e] * len(claimed)
+
+        return sum(self._settle(key, entry, error) for (key, entry), error in zip(claimed, errors))
+
+    def _batches(self) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+        """Claimed reports, `batch_size` at a time."""
+
+        batch = []
+        for claimed in self._claim():
+            batch.append(claimed)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def replay(self, deliver: Deliver) -> tuple[int, int]:
+        """Deliver every spooled report, in batches of `batch_size`, `concurrency` at a time.
+
+        Args:
+            deliver: callable sending a batch of reports to their tracker, returning None for
+                each delivered report and the error for each one that wasn't.
+
+        Returns:
+            Number of reports delivered and number spooled back.
+        """
+
+        if not self._replaying.acquire(blocking=False):
+            return 0, 0
+
+        try:
+            self._recover()
+            with ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="bug-buddy-outbox"
+            ) as pool:
+                futures = [
+                    (len(batch), pool.submit(self._deliver, deliver, batch))
+                    for batch in self._batches()
+                ]
+                claimed = sum(size for size, _ in futures)
+                delivered = sum(future.result() for _, future in futures)
+        finally:
+            self._replaying.release()
+
+        return delivered, claimed - delivered
+
+    def replay_in_background(self, deliver: Deliver) -> None:
+        """Replay on a daemon thread, if any report is waiting and no replay is running.
+
+        Args:
+            deliver: callable sending a batch of reports to their tracker, see `replay`.
+        """
+
+        if self._replaying.locked() or not self.pending():
+            return
+
+        threading.Thread(
+            target=self.replay, args=(deliver,), name="bug-buddy-outbox", daemon=True
+        ).start()
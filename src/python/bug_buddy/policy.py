@@ -0,0 +1,196 @@
+"""Rate limiting and sampling of failure reports for Bug Buddy."""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from logging import Logger, getLogger
+from typing import Optional
+
+from attrs import define, field
+
+
+@define
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second, up to `burst`."""
+
+    rate: float
+    """Tokens added per second."""
+    burst: float
+    """Bucket capacity."""
+    tokens: float = field()
+    """Tokens available."""
+    updated: float = field(factory=time.monotonic)
+    """Monotonic time of the last refill."""
+
+    @tokens.default
+    def _tokens_default(self) -> float:
+        return self.burst
+
+    def take(self, now: float) -> bool:
+        """Take a token if one is available.
+
+        Args:
+            now: monotonic time.
+
+        Returns:
+            Whether a token was taken.
+        """
+
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def refund(self) -> None:
+        """Give back a token taken for something that didn't happen after all."""
+
+        self.tokens = min(self.burst, self.tokens + 1)
+
+
+@define
+class _Failure:
+    """Admission state of one fingerprint."""
+
+    bucket: TokenBucket
+    """Per fingerprint token bucket."""
+    func_name: str
+    """Name of the decorated function that failed."""
+    count: int = 0
+    """Occurrences seen by this process."""
+    suppressed: int = 0
+    """Occurrences suppressed since the last summary."""
+
+
+@define
+class ReportPolicy:
+    """Decides which failures are worth reporting, so failure storms cost a bounded amount.
+
+    An occurrence is reported only if it passes, in order:
+
+    1. sampling: past the first `sample_after` occurrences of a fingerprint, only a
+       `sample_rate` fraction is considered;
+    2. the fingerprint's token bucket, `rate` reports per second with bursts of `burst`;
+    3. the process wide token bucket, `global_rate` per second with bursts of `global_burst`.
+       An occurrence it refuses gives its token back to the fingerprint's bucket.
+
+    Suppressed occurrences are counted and summarized in one log line at most every
+    `summary_interval` seconds, covering the time since the previous summary.
+    """
+
+    rate: float = 1.0
+    """Reports per second per fingerprint."""
+    burst: float = 10.0
+    """Reports a fingerprint may burst to."""
+    global_rate: float = 10.0
+    """Reports per second across all fingerprints."""
+    global_burst: float = 50.0
+    """Reports all fingerprints may burst to together."""
+    sample_after: int = 100
+    """Occurrences of a fingerprint always considered before sampling starts."""
+    sample_rate: float = 0.01
+    """Fraction of later occurrences considered."""
+    summary_interval: float = 60.0
+    """Seconds between summaries of suppressed occurrences."""
+    max_fingerprints: int = 10_000
+    """Fingerprints tracked, least recently seen are forgotten first."""
+    logger: Logger = field()
+    """Logger instance."""
+
+    @logger.default
+    def _logger_default(self) -> Logger:
+        return getLogger(__name__)
+
+    _global: TokenBucket = field(init=False)
+    _failures: "OrderedDict[str, _Failure]" = field(factory=OrderedDict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _timer: Optional[threading.Timer] = field(default=None, init=False)
+    # suppressed occurrences of forgotten fingerprints, still due in the next summary
+    _evicted: int = field(default=0, init=False)
+    _flushed: float = field(factory=time.monotonic, init=False)
+
+    @_global.default
+    def _global_default(self) -> TokenBucket:
+        return TokenBucket(rate=self.global_rate, burst=self.global_burst)
+
+    def _failure(self, fingerprint: str, func_name: str, now: float) -> _Failure:
+        """State of a fingerprint, tracking it if it is new."""
+
+        failure = self._failures.get(fingerprint)
+        if failure is None:
+            # filled as of `now`, which an occurrence reads before taking the lock
+            bucket = TokenBucket(rate=self.rate, burst=self.burst, updated=now)
+            failure = _Failure(bucket, func_name)
+            self._failures[fingerprint] = failure
+            if len(self._failures) > self.max_fingerprints:
+                _, evicted = self._failures.popitem(last=False)
+                self._evicted += evicted.suppressed
+        else:
+            self._failures.move_to_end(fingerprint)
+        return failure
+
+    def admit(self, fingerprint: str, func_name: str = "") -> bool:
+        """Count an occurrence and decide whether to report it.
+
+        Args:
+            fingerprint: failure fingerprint.
+            func_name: name of the decorated function, for the summary.
+
+        Returns:
+            Whether the occurrence should be reported.
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            failure = self._failure(fingerprint, func_name, now)
+            failure.count += 1
+            if (
+                failure.count <= self.sample_after or random.random() < self.sample_rate
+            ) and failure.bucket.take(now):
+                if self._global.take(now):
+                    return True
+                # a storm elsewhere doesn't spend this fingerprint's budget
+                failure.bucket.refund()
+
+            failure.suppressed += 1
+            if self._timer is None:
+                self._timer = threading.Timer(self.summary_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        return False
+
+    def flush(self) -> int:
+        """Log a summary of the occurrences suppressed since the last one.
+
+        Returns:
+            Number of occurrences summarized.
+        """
+
+        with self._lock:
+            suppressed = {
+                (fingerprint, failure.func_name): failure.suppressed
+                for fingerprint, failure in self._failures.items()
+                if failure.suppressed
+            }
+            for failure in self._failures.values():
+                failure.suppressed = 0
+            evicted, self._evicted = self._evicted, 0
+            self._timer = None
+            now = time.monotonic()
+            elapsed, self._flushed = now - self._flushed, now
+
+        total = sum(suppressed.values()) + evicted
+        if total:
+            self.logger.warning(
+                "Suppressed %s occurrences of %s failures in the last %ss",
+                f"{total:,}",
+                len(suppressed) + bool(evicted),
+                f"{elapsed:.1f}",
+            )
+            for (fingerprint, func_name), count in suppressed.items():
+                self.logger.debug("  %s %s: %s suppressed", fingerprint[:12], func_name, count)
+
+        return total
@@ -0,0 +1,186 @@
+"""pytest plugin reporting the failures of a test session with Bug Buddy.
+
+Enable with `pytest --bug-buddy` (or `bug_buddy = true` in the ini file). Failures are
+fingerprinted and rendered as they happen, on the xdist worker that ran the test, and forwarded
+to the controller on the test report. At the end of the session every unique failure is
+reported once, all in one `Integration.create_issues` batch.
+"""
+
+import inspect
+import json
+from typing import TYPE_CHECKING, Any, Optional
+
+import pytest
+
+if TYPE_CHECKING:
+    from bug_buddy._frames import Frame
+    from bug_buddy.integration import Integration
+    from bug_buddy.issue import Issue
+    from bug_buddy.listener import Listener
+
+_PLUGIN = "bug-buddy-session"
+
+
+class _Hooks:
+    """Hooks conftest.py files may implement."""
+
+    @pytest.hookspec(firstresult=True)
+    def pytest_bug_buddy_integration(self, config: pytest.Config) -> Optional["Integration"]:
+        """Integration to report failures to, e.g. `LinearIntegration(team_id=...)`.
+
+        Overrides `--bug-buddy-integration`. Failures are only cached locally without one.
+        """
+
+
+def pytest_addhooks(pluginmanager: pytest.PytestPluginManager) -> None:
+    pluginmanager.add_hookspecs(_Hooks)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("bug-buddy")
+    group.addoption("--bug-buddy", action="store_true", default=None, help="report test failures.")
+    group.addoption(
+        "--bug-buddy-integration",
+        metavar="SPEC",
+        help='integration as JSON, e.g. \'{"type": "GitlabIntegration", "config": '
+        '{"project_id": 1}}\'.',
+    )
+    group.addoption(
+        "--bug-buddy-concurrency",
+        type=int,
+        default=4,
+        help="issues created in parallel at the end of the session (default: 4).",
+    )
+    parser.addini("bug_buddy", type="bool", default=False, help="report test failures.")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    enabled = config.getoption("bug_buddy")
+    if enabled is None:
+        enabled = config.getini("bug_buddy")
+    if enabled:
+        config.pluginmanager.register(SessionReporter(config), _PLUGIN)
+
+
+def _integration(config: pytest.Config) -> Optional["Integration"]:
+    """Integration from the conftest hook or the command line."""
+
+    integration = config.hook.pytest_bug_buddy_integration(config=config)
+    if integration is None and config.getoption("bug_buddy_integration"):
+        from bug_buddy.integration import from_spec
+
+        integration = from_spec(json.loads(config.getoption("bug_buddy_integration")))
+    return integration
+
+
+def _frames(item: pytest.Item, tb: Any) -> list["Frame"]:
+    """Frames of a failure, starting at the test's own file to leave pytest out."""
+
+    from bug_buddy._frames import walk
+
+    frames = walk(tb)
+    for i, frame in enumerate(frames):
+        if frame.filename == str(item.path):
+            return frames[i:]
+    return frames
+
+
+class SessionReporter:
+    """Collects the failures of a session and reports each unique one at the end of it."""
+
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        # workers only render failures, the controller reports them
+        self.controller = not hasattr(config, "workerinput")
+        self.failures: dict[str, dict[str, Any]] = {}
+        self.occurrences: dict[str, int] = {}
+        self.issues: list["Issue"] = []
+        self.errors = 0
+        self._listener: Optional["Listener"] = None
+
+    @property
+    def listener(self) -> "Listener":
+        """Listener reporting the session's failures, built on the first failure."""
+
+        if self._listener is None:
+            from bug_buddy._di_container import BugBuddyInjector
+
+            di = BugBuddyInjector()
+            logger = di.logger(di.config().log_level)
+            integration = _integration(self.config) if self.controller else None
+            # every failure of the session is reported, deduplicated by fingerprint
+            self._listener = di.listener(integration=integration, logger=logger, policy=False)
+        return self._listener
+
+    def _render(self, item: pytest.Item, excinfo: pytest.ExceptionInfo) -> dict[str, Any]:
+        """Fingerprint and render a failure, as JSON to travel on the test report."""
+
+        from bug_buddy.context import execution_context
+        from bug_buddy.fingerprint import fingerprint
+
+        listener = self.listener
+        tb = listener.filter_tb(_frames(item, excinfo.tb))
+        try:
+            source = inspect.getsource(item.obj)
+        except (AttributeError, OSError, TypeError):
+            source = None
+        context = execution_context()
+
+        return {
+            "fingerprint": fingerprint(excinfo.type, tb),
+            "func_name": item.name,
+            "labels": [excinfo.type.__name__],
+            "description": listener.description(
+                tb, item.name, source, context=context, exc=excinfo.value
+            ),
+            "context": [list(row) for row in context],
+        }
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo):
+        report = (yield).get_result()
+        if not report.failed or call.excinfo is None:
+            return
+        try:
+            report.bug_buddy = self._render(item, call.excinfo)
+        except Exception:
+            self.errors += 1
+            self.listener.logger.warning("Could not render %s", item.nodeid, exc_info=True)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        failure = getattr(report, "bug_buddy", None)
+        if not self.controller or failure is None:
+            return
+        fp = failure["fingerprint"]
+        self.failures.setdefault(fp, failure)
+        self.occurrences[fp] = self.occurrences.get(fp, 0) + 1
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if not self.controller or not self.failures:
+            return
+        failures = [
+            dict(failure, context=[tuple(row) for row in failure["context"]])
+            for failure in self.failures.values()
+        ]
+        results = self.listener.record_rendered_batch(
+            failures, max_workers=max(1, self.config.getoption("bug_buddy_concurrency"))
+        )
+        for failure, result in zip(failures, results):
+            if isinstance(result, Exception):
+                self.errors += 1
+                self.listener.logger.warning(
+                    "Could not report %s", failure["func_name"], exc_info=result
+                )
+            else:
+                self.issues.append(result)
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        if not self.controller or not (self.failures or self.errors):
+            return
+        terminalreporter.section("bug-buddy")
+        terminalreporter.write_line(
+            f"{sum(self.occurrences.values())} failures, {len(self.failures)} unique, "
+            f"{len(self.issues)} reported" + (f", {self.errors} errors" if self.errors else "")
+        )
+        for issue in self.issues:
+            terminalreporter.write_line(f"  {issue.title}: {issue.state} {issue.id}")
@@ -0,0 +1,212 @@
+"""Background reporting queue for Bug Buddy."""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from logging import Logger, getLogger
+from typing import Any, Callable, Optional
+
+from attrs import define, field
+from attrs.validators import in_
+
+OVERFLOW_POLICIES = ("drop-oldest", "drop-new", "block")
+"""What to do with a report when the queue is full."""
+
+
+@define
+class BackgroundReporter:
+    """Bounded in-process queue drained to the issue tracker by a daemon worker thread.
+
+    The failing code path only enqueues a job, so it never waits on the tracker. Jobs left in
+    the queue at interpreter exit are flushed for up to `flush_timeout` seconds.
+    """
+
+    maxsize: int = 1000
+    """Maximum number of queued reports."""
+    overflow: str = field(default="drop-oldest", validator=in_(OVERFLOW_POLICIES))
+    """Overflow policy: drop the oldest queued report, drop the new report, or block."""
+    block_timeout: Optional[float] = None
+    """Seconds to wait for room under the `block` policy before dropping, None waits forever."""
+    flush_timeout: float = 5.0
+    """Seconds to spend flushing queued reports at interpreter exit."""
+    logger: Logger = field()
+    """Logger instance."""
+
+    @logger.default
+    def _logger_default(self) -> Logger:
+        return getLogger(__name__)
+
+    submitted: int = field(default=0, init=False)
+    """Reports accepted onto the queue."""
+    reported: int = field(default=0, init=False)
+    """Reports delivered by the worker."""
+    failed: int = field(default=0, init=False)
+    """Reports whose delivery raised."""
+    dropped: int = field(default=0, init=False)
+    """Reports dropped by the overflow policy."""
+
+    _queue: Optional[queue.Queue] = field(default=None, init=False)
+    _thread: Optional[threading.Thread] = field(default=None, init=False)
+    _pid: Optional[int] = field(default=None, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _atexit: bool = field(default=False, init=False)
+    # guards the counters and `_pending`, notified once no report is pending
+    _idle: threading.Condition = field(factory=threading.Condition, init=False)
+    # reports queued or being delivered
+    _pending: int = field(default=0, init=False)
+
+    @property
+    def depth(self) -> int:
+        """Number of reports waiting in the queue."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def metrics(self) -> dict[str, int]:
+        """Snapshot of the queue metrics.
+
+        Returns:
+            Queue depth and report counters.
+        """
+
+        with self._idle:
+            return {
+                "depth": self.depth,
+                "submitted": self.submitted,
+                "reported": self.reported,
+                "failed": self.failed,
+                "dropped": self.dropped,
+            }
+
+    def _settle(self, counter: str) -> None:
+        """Count how a pending report ended, waking `flush` once none are left.
+
+        Args:
+            counter: `reported`, `failed` or `dropped`.
+        """
+
+        with self._idle:
+            setattr(self, counter, getattr(self, counter) + 1)
+            self._pending -= 1
+            if not self._pending:
+                self._idle.notify_all()
+
+    def _ensure_worker(self) -> queue.Queue:
+        """Start the worker on first use, and again in a forked child."""
+
+        if self._pid == os.getpid() and self._thread.is_alive():
+            return self._queue
+
+        with self._lock:
+            if self._pid != os.getpid() or not self._thread.is_alive():
+                if self._pid != os.getpid():
+                    # the parent's pending reports stay the parent's
+                    self._idle = threading.Condition()
+                    self._pending = 0
+                self._queue = queue.Queue(maxsize=self.maxsize)
+                self._thread = threading.Thread(
+                    target=self._drain, name="bug-buddy-reporter", daemon=True
+                )
+                self._thread.start()
+                self._pid = os.getpid()
+                if not self._atexit:
+                    atexit.register(self.flush, self.flush_timeout)
+                    self._atexit = True
+
+        return self._queue
+
+    def _drain(self) -> None:
+        """Worker loop: deliver queued reports one at a time."""
+
+        q = self._queue
+        while True:
+            job, on_drop = q.get()
+            try:
+                job()
+            except Exception:
+                self.logger.warning("Background report failed.", exc_info=True)
+                self._run(on_drop)
+                self._settle("failed")
+            else:
+                self._settle("reported")
+
+    def _run(self, on_drop: Optional[Callable[[], Any]]) -> None:
+        """Run a drop callback, never raising."""
+
+        if on_drop is not None:
+            try:
+                on_drop()
+            except Exception:
+                self.logger.debug("Drop callback failed.", exc_info=True)
+
+    def _drop(self, on_drop: Optional[Callable[[], Any]]) -> None:
+        """Count a dropped report and run its drop callback."""
+
+        self._run(on_drop)
+        self._settle("dropped")
+
+    def submit(self, job: Callable[[], Any], on_drop: Optional[Callable[[], Any]] = None) -> bool:
+        """Enqueue a report.
+
+        Args:
+            job: callable delivering the report, run on the worker thread.
+            on_drop: callable run if the report is dropped or its delivery fails.
+
+        Returns:
+            Whether the report was queued.
+        """
+
+        q = self._ensure_worker()
+        # pending before it is queued, so the worker never settles it first
+        with self._idle:
+            self._pending += 1
+
+        if self.overflow == "block":
+            try:
+                q.put((job, on_drop), timeout=self.block_timeout)
+            except queue.Full:
+                self._drop(on_drop)
+                return False
+        else:
+            with self._lock:
+                while True:
+                    try:
+                        q.put_nowait((job, on_drop))
+                        break
+                    except queue.Full:
+                        if self.overflow == "drop-new":
+                            self._drop(on_drop)
+                            return False
+                        try:
+                            _, oldest_on_drop = q.get_nowait()
+                        except queue.Empty:
+                            continue
+                        self._drop(oldest_on_drop)
+
+        with self._idle:
+            self.submitted += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued reports to be delivered.
+
+        Args:
+            timeout: maximum seconds to wait, None waits until the queue is empty.
+
+        Returns:
+            Whether the queue was fully drained.
+        """
+
+        if self._queue is None or self._pid != os.getpid():
+            return True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self.logger.warning("Gave up flushing %s queued bug reports.", self._pending)
+                    return False
+                self._idle.wait(remaining)
+
+        return True
@@ -0,0 +1,340 @@
+"""SQLite backed, indexed issue store for Bug Buddy."""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, ClassVar, Iterable, Iterator, Mapping, Optional, Sequence, Union
+
+from attrs import define, field
+
+from bug_buddy.cache import REMOTE_KEY, CacheBackend, cache_path, record_key
+
+STORE_FILE = ".bug_buddy.db"
+"""Default store file name, relative to $HOME."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    rowid INTEGER PRIMARY KEY,
+    issue_id TEXT,
+    title TEXT,
+    state TEXT,
+    project_id TEXT,
+    func_name TEXT,
+    commit_sha TEXT,
+    created_at REAL NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_issues_func_name ON issues (func_name, created_at);
+CREATE INDEX IF NOT EXISTS idx_issues_created_at ON issues (created_at);
+CREATE INDEX IF NOT EXISTS idx_issues_commit_sha ON issues (commit_sha);
+CREATE INDEX IF NOT EXISTS idx_issues_remote_id ON issues (json_extract(record, '$.remote_id'));
+CREATE INDEX IF NOT EXISTS idx_issues_title ON issues (title);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    issue_rowid INTEGER NOT NULL REFERENCES issues (rowid) ON DELETE CASCADE,
+    label TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_issue_labels_label ON issue_labels (label, issue_rowid);
+"""
+
+# columns (or indexed expressions) records can be matched on by `update`
+_KEY_COLUMNS = {
+    "id": "issue_id",
+    "title": "title",
+    "project_id": "project_id",
+    "remote_id": "json_extract(record, '$.remote_id')",
+}
+
+# one connection per (process, database); reset after fork
+_CONNECTIONS: dict[str, sqlite3.Connection] = {}
+_CONNECTIONS_PID = os.getpid()
+_CONNECTIONS_LOCK = threading.Lock()
+# connections are shared between threads, so transactions are serialized in-process
+_WRITE_LOCK = threading.RLock()
+
+Since = Union[None, float, datetime, timedelta, str]
+"""Lower time bound: epoch seconds, an aware/naive datetime, a timedelta back from now, or a
+string holding either a duration back from now (`30m`, `24h`, `7d`) or an ISO timestamp."""
+
+_DURATION = re.compile(r"^(\d+(?:\.\d+)?)([smhdw])$")
+_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def connect(path: str, schema: str = _SCHEMA) -> sqlite3.Connection:
+    """Get the process-wide connection for a database, creating the schema on first use.
+
+    Args:
+        path: database path.
+        schema: SQL script creating the tables and indexes of the database.
+
+    Returns:
+        SQLite connection in WAL mode, shared by all threads of this process.
+    """
+
+    global _CONNECTIONS_PID
+
+    with _CONNECTIONS_LOCK:
+        if _CONNECTIONS_PID != os.getpid():
+            # connections must not cross a fork
+            _CONNECTIONS.clear()
+            _CONNECTIONS_PID = os.getpid()
+
+        conn = _CONNECTIONS.get(path)
+        if conn is None:
+            conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(schema)
+            _CONNECTIONS[path] = conn
+
+        return conn
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run statements in one immediate transaction on a shared connection.
+
+    Args:
+        conn: connection from `connect`.
+
+    Yields:
+        The connection, inside the transaction.
+    """
+
+    with _WRITE_LOCK:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+def _epoch(value: Any) -> float:
+    """Convert an ISO timestamp to epoch seconds, assuming local time when naive.
+
+    Args:
+        value: ISO 8601 timestamp.
+
+    Returns:
+        Epoch seconds, or the current time if the value can't be parsed.
+    """
+
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return time.time()
+
+
+def _since(since: Since) -> Optional[float]:
+    """Normalize a lower time bound to epoch seconds.
+
+    Args:
+        since: lower time bound.
+
+    Returns:
+        Epoch seconds or None.
+
+    Raises:
+        ValueError: for a string that is neither a duration nor an ISO timestamp.
+    """
+
+    if since is None:
+        return None
+    if isinstance(since, str):
+        match = _DURATION.match(since)
+        if match:
+            since = timedelta(**{_UNITS[match.group(2)]: float(match.group(1))})
+        else:
+            since = datetime.fromisoformat(since)
+    if isinstance(since, timedelta):
+        return time.time() - since.total_seconds()
+    if isinstance(since, datetime):
+        return since.timestamp()
+    return float(since)
+
+
+def _labels(record: Mapping[str, Any]) -> list[str]:
+    """Labels of a cached record; legacy records hold one joined string."""
+
+    labels = record.get("labels") or []
+    if isinstance(labels, str):
+        return [labels]
+    return list(labels)
+
+
+@define
+class SqliteIssueStore(CacheBackend):
+    """Indexed issue store.
+
+    Records are kept whole as JSON, with `func_name`, `created_at`, the CI commit SHA and each
+    label pulled out into indexed columns for the query API.
+    """
+
+    supports_update: ClassVar[bool] = True
+
+    path: str = field(factory=lambda: cache_path(STORE_FILE))
+    """Database path."""
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Process-wide connection to this store."""
+        return connect(self.path)
+
+    def append(self, record: Mapping[str, Any]) -> None:
+        """Insert a record and its labels in one transaction.
+
+        Args:
+            record: cleaned issue record.
+        """
+
+        with transaction(self.conn) as conn:
+            cur = conn.execute(
+                "INSERT INTO issues (issue_id, title, state, project_id, func_name, "
+                "commit_sha, created_at, record) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(record.get("id")),
+                    record.get("title"),
+                    record.get("state"),
+                    str(record.get("project_id")),
+                    record.get("func_name"),
+                    record.get("commit_sha"),
+                    _epoch(record.get("created_at")),
+                    json.dumps(record, default=str, separators=(",", ":")),
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO issue_labels (issue_rowid, label) VALUES (?, ?)",
+                [(cur.lastrowid, label) for label in _labels(record)],
+            )
+
+    def update(self, records: Iterable[Mapping[str, Any]], by: Sequence[str] = REMOTE_KEY) -> int:
+        """Update cached records in place with newer versions of the same issues.
+
+        Matching records are found through the remote ID and title indexes, and updated in one
+        transaction along with their labels.
+
+        Args:
+            records: newer issue records, merged into the cached records with the same key.
+            by: record fields matching a newer record to the cached ones: any of `id`,
+                `title`, `project_id` and `remote_id`.
+
+        Returns:
+            Number of cached records updated.
+        """
+
+        try:
+            where = " AND ".join(f"{_KEY_COLUMNS[name]} = ?" for name in by)
+        except KeyError as e:
+            raise ValueError(f"Records can't be matched on {e.args[0]!r}.") from None
+
+        updated = 0
+        with transaction(self.conn) as conn:
+            for record in records:
+                key = record_key(record, by)
+                if key is None:
+                    continue
+                rows = conn.execute(f"SELECT rowid, record FROM issues WHERE {where}", key)
+                for rowid, cached in rows.fetchall():
+                    merged = {**json.loads(cached), **record}
+                    conn.execute(
+                        "UPDATE issues SET issue_id = ?, title = ?, state = ?, project_id = ?, "
+                        "record = ? WHERE rowid = ?",
+                        (
+                            str(merged.get("id")),
+                            merged.get("title"),
+                            merged.get("state"),
+                            str(merged.get("project_id")),
+                            json.dumps(merged, default=str, separators=(",", ":")),
+                            rowid,
+                        ),
+                    )
+                    conn.execute("DELETE FROM issue_labels WHERE issue_rowid = ?", (rowid,))
+                    conn.executemany(
+                        "INSERT INTO issue_labels (issue_rowid, label) VALUES (?, ?)",
+                        [(rowid, label) for label in _labels(merged)],
+                    )
+                    updated += 1
+
+        return updated
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Stream all records, oldest first.
+
+        Yields:
+            Issue records.
+        """
+
+        return self.query()
+
+    def query(
+        self,
+        func_name: Optional[str] = None,
+        label: Optional[str] = None,
+        commit_sha: Optional[str] = None,
+        since: Since = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Query cached issues. Every filter is served by an index.
+
+        Args:
+            func_name: decorated function name.
+            label: issue label, e.g. the exception class name.
+            commit_sha: CI commit SHA the failure was recorded at.
+            since: only issues created at or after this time.
+            limit: maximum number of issues.
+
+        Yields:
+            Matching issue records, oldest first.
+        """
+
+        sql = "SELECT i.record FROM issues i"
+        clauses, params = [], []
+        if label is not None:
+            sql += " JOIN issue_labels l ON l.issue_rowid = i.rowid"
+            clauses.append("l.label = ?")
+            params.append(label)
+        if func_name is not None:
+            clauses.append("i.func_name = ?")
+            params.append(func_name)
+        if commit_sha is not None:
+            clauses.append("i.commit_sha = ?")
+            params.append(commit_sha)
+        if since is not None:
+            clauses.append("i.created_at >= ?")
+            params.append(_since(since))
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY i.created_at"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        for (record,) in self.conn.execute(sql, params):
+            yield json.loads(record)
+
+    def count_by_label(self, since: Since = None) -> dict[str, int]:
+        """Count cached issues per label.
+
+        Args:
+            since: only count issues created at or after this time.
+
+        Returns:
+            Mapping of label to issue count, most frequent first.
+        """
+
+        sql = "SELECT l.label, COUNT(*) FROM issue_labels l"
+        params = []
+        if since is not None:
+            sql += " JOIN issues i ON i.rowid = l.issue_rowid WHERE i.created_at >= ?"
+            params.append(_since(since))
+        sql += " GROUP BY l.label ORDER BY COUNT(*) DESC"
+
+        return dict(self.conn.execute(sql, params).fetchall())
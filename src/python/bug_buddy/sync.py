@@ -0,0 +1,202 @@
+"""Incremental sync of the local cache with the issue tracker for Bug Buddy."""
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from attrs import define, field
+
+from bug_buddy.cache import REMOTE_KEY, cache_path, locked
+
+if TYPE_CHECKING:
+    from bug_buddy.listener import Listener
+
+SYNC_FILE = ".bug_buddy.sync.json"
+"""Default sync cursor file name, relative to $HOME."""
+
+
+@define
+class SyncResult:
+    """Outcome of a sync."""
+
+    pulled: int = 0
+    """Remote issues updated since the last sync."""
+    updated: int = 0
+    """Cached records updated in place."""
+    pushed: int = 0
+    """Spooled reports and local issues created on the tracker."""
+    failed: int = 0
+    """Spooled reports and local issues that could not be created."""
+
+
+@define
+class IssueSync:
+    """Keeps the local cache in step with the tracker, both ways.
+
+    A pull asks the tracker only for the Bug Buddy issues updated since the last sync (the
+    cursor, the latest `updated_at` seen, kept per integration scope) and merges them into the
+    cached records with the same remote ID, so each sync costs a few requests however many
+    issues there are. A push replays the listener's outbox and creates the issues of local
+    records, those cached while no integration was configured, then updates them in place.
+    """
+
+    listener: "Listener"
+    """Listener whose integration, cache and outbox are synced."""
+    path: str = field(factory=lambda: cache_path(SYNC_FILE))
+    """Sync cursor file."""
+
+    def cursor(self) -> Optional[str]:
+        """Latest remote update seen by the last sync of the listener's integration.
+
+        Returns:
+            ISO timestamp, None before the first sync.
+        """
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f).get(self.listener.integration.scope)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _advance(self, cursor: str) -> None:
+        """Store the cursor of the listener's integration."""
+
+        with locked(self.path, os.O_RDWR | os.O_CREAT) as fd, open(fd, "rb", closefd=False) as f:
+            try:
+                cursors = json.loads(f.read() or b"{}")
+            except ValueError:
+                cursors = {}
+            cursors[self.listener.integration.scope] = cursor
+
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as out:
+                json.dump(cursors, out, indent=2)
+            # swapped in while locked, so a concurrent sync waiting on the old file rereads
+            os.replace(tmp, self.path)
+
+    def _merge(self, records: list[dict[str, Any]], by: Sequence[str]) -> int:
+        """Update cached records in place, or append them where the cache can't update.
+
+        Args:
+            records: newer issue records.
+            by: record fields matching a newer record to the cached ones, see `record_key`.
+
+        Returns:
+            Cached records updated.
+        """
+
+        cache = self.listener.cache
+        if cache.supports_update:
+            return cache.update(records, by=by)
+        for record in records:
+            cache.append(record)
+        return 0
+
+    def pull(self) -> tuple[int, int]:
+        """Update cached records with the remote issues updated since the last sync.
+
+        Returns:
+            (remote issues pulled, cached records updated).
+        """
+
+        integration, logger = self.listener.integration, self.listener.logger
+        since = cursor = self.cursor()
+        client = integration.get_client(logger)
+
+        records = []
+        for issue in integration.updated_issues(client, since):
+            records.append(issue._clean())
+            cursor = max(cursor or "", issue.updated_at)
+        logger.debug("Pulled %s issues updated since %s", len(records), since)
+
+        updated = self._merge(records, REMOTE_KEY)
+        if cursor != since:
+            self._advance(cursor)
+
+        return len(records), updated
+
+    def _local_records(self) -> list[dict[str, Any]]:
+        """Cached records of issues that exist only on this machine."""
+
+        return [
+            record
+            for record in self.listener.cache.iter_records()
+            if record.get("state") == "local" and not record.get("remote_id")
+        ]
+
+    def push(self) -> tuple[int, int]:
+        """Create the issues of spooled reports and local records on the tracker.
+
+        Local records are first looked up by title, so a push interrupted after creating an
+        issue doesn't create it twice.
+
+        Returns:
+            (issues created, issues that could not be created).
+        """
+
+        from bug_buddy.integration import IssueDraft
+
+        listener = self.listener
+        integration, logger = listener.integration, listener.logger
+
+        pushed = failed = 0
+        if listener.outbox is not None:
+            pushed, failed = listener.outbox.replay(listener.deliver_batch)
+
+        local = self._local_records()
+        if not local:
+            return pushed, failed
+
+        client = integration.get_client(logger)
+        created, missing = [], []
+        for record in local:
+            try:
+                issue = integration.find_issue(client, record["title"])
+            except Exception:
+                logger.warning("Could not look up %s", record["title"], exc_info=True)
+                failed += 1
+                continue
+            if issue is None:
+                missing.append(record)
+            else:
+                created.append(issue)
+
+        drafts = []
+        for record in missing:
+            labels = record.get("labels") or []
+            drafts.append(
+                IssueDraft(
+                    description=record.get("description") or "",
+                    labels=[labels] if isinstance(labels, str) else list(labels),
+                    func_name=record.get("func_name") or "",
+                    title=record["title"],
+                )
+            )
+        for result in integration.create_issues(client, drafts):
+            if result.ok:
+                created.append(result.issue)
+            else:
+                logger.warning("Could not push %s", result.draft.title, exc_info=result.error)
+                failed += 1
+
+        # titles carry a UUID, so they match a created issue to its local record
+        self._merge([issue._clean() for issue in created], ("title",))
+
+        return pushed + len(created), failed
+
+    def sync(self, push: bool = True) -> SyncResult:
+        """Push pending issues, then pull the issues updated since the last sync.
+
+        Args:
+            push: whether to push spooled reports and local issues first.
+
+        Returns:
+            Counts of what was synced.
+        """
+
+        result = SyncResult()
+        if push:
+            result.pushed, result.failed = self.push()
+        result.pulled, result.updated = self.pull()
+
+        return result
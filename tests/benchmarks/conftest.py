@@ -0,0 +1,138 @@
+"""Benchmarks of Bug Buddy's overhead, against a local stub of the issue trackers.
+
+Not collected by a plain `pytest` run. Run them, with results written as JSON, with:
+
+    pytest tests/benchmarks --benchmark-json=benchmarks.json
+"""
+
+import itertools
+import json
+import os
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from bug_buddy.integration import GitlabIntegration, LinearIntegration
+
+_IDS = itertools.count(1)
+
+
+def _gitlab_issue(title: str, description: str) -> dict:
+    number = next(_IDS)
+    return {
+        "id": number,
+        "iid": number,
+        "project_id": 1,
+        "title": title,
+        "state": "opened",
+        "author": {"name": "Bug Buddy", "username": "bug-buddy", "state": "active"},
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+        "description": description,
+        "labels": ["BugBuddy"],
+    }
+
+
+def _linear_issue(title: str, description: str) -> dict:
+    number = next(_IDS)
+    return {
+        "id": str(uuid.uuid4()),
+        "identifier": f"BB-{number}",
+        "number": number,
+        "title": title,
+        "description": description,
+        "createdAt": "2026-01-01T00:00:00Z",
+        "updatedAt": "2026-01-01T00:00:00Z",
+        "state": {"name": "Todo"},
+        "creator": {"name": "Bug Buddy", "email": "bug-buddy@example.com"},
+        "labels": {"nodes": [{"name": "Bug"}]},
+    }
+
+
+class _Tracker(BaseHTTPRequestHandler):
+    """Answers GitLab's REST API under /api/v4 and Linear's GraphQL API under /graphql."""
+
+    # keep-alive, so pooled sessions are measured as they run against the real trackers
+    protocol_version = "HTTP/1.1"
+    # headers and body go out in separate writes, which Nagle's algorithm would hold back
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _reply(self, status: int, body: object) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        # issue searches and listings find nothing
+        self._reply(200, [])
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+
+        if self.path.startswith("/graphql"):
+            query, variables = body["query"], body.get("variables") or {}
+            if "GetTeamLabels" in query:
+                nodes = [{"id": "label-bug", "name": "Bug"}]
+                self._reply(200, {"data": {"team": {"labels": {"nodes": nodes}}}})
+            else:
+                issue = _linear_issue(variables["title"], variables.get("description") or "")
+                self._reply(200, {"data": {"issueCreate": {"success": True, "issue": issue}}})
+            return
+
+        if self.path.endswith("/issues"):
+            self.server.created.append(body["title"])
+        self._reply(201, _gitlab_issue(body["title"], body.get("description") or ""))
+
+
+@pytest.fixture(scope="session")
+def tracker_server() -> ThreadingHTTPServer:
+    """Stub tracker serving on localhost for the whole session."""
+
+    os.environ.setdefault("GITLAB_TOKEN", "benchmark")
+    os.environ.setdefault("LINEAR_API_KEY", "benchmark")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Tracker)
+    server.daemon_threads = True
+    server.created = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def tracker(tracker_server) -> str:
+    """Base URL of the stub tracker."""
+
+    return f"http://127.0.0.1:{tracker_server.server_port}"
+
+
+@pytest.fixture
+def created(tracker_server) -> list[str]:
+    """Titles of the GitLab issues the stub tracker created during the test."""
+
+    tracker_server.created.clear()
+    return tracker_server.created
+
+
+@pytest.fixture(params=["local", "gitlab", "linear"])
+def integration(request, tracker):
+    """No integration, then each tracker's integration pointed at the stub."""
+
+    if request.param == "gitlab":
+        return GitlabIntegration(project_id=1, url=f"{tracker}/api/v4")
+    if request.param == "linear":
+        return LinearIntegration(team_id="team", url=f"{tracker}/graphql", label_cache=None)
+    return None
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
@@ -0,0 +1,67 @@
+"""Append cost of Issue.cache as the cache grows."""
+
+import pytest
+from bug_buddy.cache import JsonlCacheBackend, _encode
+from bug_buddy.issue import Issue
+from bug_buddy.store import SqliteIssueStore, transaction
+
+SIZES = [10, 10_000, 1_000_000]
+
+ISSUE = Issue(
+    id=1,
+    title="BugBuddy-benchmark-00000000-0000-0000-0000-000000000000",
+    state="opened",
+    project_id=1,
+    author=("Bug Buddy", "bug-buddy", "active"),
+    created_at="2026-01-01T00:00:00",
+    updated_at="2026-01-01T00:00:00",
+    description="### Origin\n" + "x" * 2048,
+    labels=["ValueError"],
+)
+CONTEXT = {"func_name": "benchmark", "commit_sha": "0" * 40, "fingerprint": "f" * 40}
+
+
+def _records(size):
+    record = dict(ISSUE._clean(), **CONTEXT, description="x" * 128)
+    for n in range(size):
+        yield dict(record, id=n)
+
+
+def _populate_jsonl(path, size):
+    with open(path, "wb") as f:
+        f.writelines(_encode(record) for record in _records(size))
+    return JsonlCacheBackend(path=path)
+
+
+def _populate_sqlite(path, size):
+    store = SqliteIssueStore(path=path)
+    with transaction(store.conn) as conn:
+        conn.executemany(
+            "INSERT INTO issues (issue_id, title, state, project_id, func_name, commit_sha, "
+            "created_at, record) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (str(n), ISSUE.title, "opened", "1", "benchmark", "0" * 40, n, "{}")
+                for n in range(size)
+            ),
+        )
+    return store
+
+
+@pytest.fixture(
+    scope="module",
+    params=[(name, size) for name in ("jsonl", "sqlite") for size in SIZES],
+    ids=lambda param: f"{param[0]}-{param[1]}",
+)
+def backend(request, tmp_path_factory):
+    """Cache backend already holding `size` records, built once for the module."""
+
+    name, size = request.param
+    path = str(tmp_path_factory.mktemp(f"{name}-{size}") / "cache")
+    if name == "jsonl":
+        return _populate_jsonl(path, size)
+    return _populate_sqlite(path, size)
+
+
+@pytest.mark.benchmark(group="cache append")
+def test_cache_append(benchmark, backend):
+    benchmark(ISSUE.cache, backend=backend, context=CONTEXT)
@@ -0,0 +1,74 @@
+"""Throughput of concurrent failures across threads and processes."""
+
+import itertools
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from bug_buddy import bug_buddy
+from bug_buddy.integration import GitlabIntegration
+
+WORKERS = 8
+FAILURES = 25
+_ROUNDS = itertools.count()
+
+
+def _errors(distinct):
+    """One exception type per failure, or the same one for all of them."""
+
+    if not distinct:
+        return [ValueError] * (WORKERS * FAILURES)
+    # a new set of fingerprints every round, so no round is deduplicated against the last
+    n = next(_ROUNDS)
+    return [type(f"BenchmarkError{n}_{i}", (Exception,), {}) for i in range(WORKERS * FAILURES)]
+
+
+def _fail_all(fail, errors):
+    for error in errors:
+        try:
+            fail(error)
+        except Exception:
+            pass
+
+
+def _threads(fail, errors):
+    with ThreadPoolExecutor(WORKERS) as pool:
+        list(pool.map(lambda w: _fail_all(fail, errors[w::WORKERS]), range(WORKERS)))
+
+
+def _processes(fail, errors):
+    ctx = multiprocessing.get_context("fork")
+    procs = [
+        ctx.Process(target=_fail_all, args=(fail, errors[w::WORKERS])) for w in range(WORKERS)
+    ]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+        assert p.exitcode == 0
+
+
+@pytest.mark.benchmark(group="concurrent failures")
+@pytest.mark.parametrize("distinct", [True, False], ids=["distinct", "repeated"])
+@pytest.mark.parametrize("run", [_threads, _processes], ids=["threads", "processes"])
+def test_concurrent_failures(benchmark, home, tracker, created, run, distinct):
+    integration = GitlabIntegration(project_id=1, url=f"{tracker}/api/v4")
+    rounds = []
+
+    # no rate limits, so every distinct failure goes through the whole pipeline
+    @bug_buddy(integration=integration, policy=False)
+    def fail(error):
+        raise error("benchmark failure")
+
+    def one_round():
+        rounds.append(None)
+        run(fail, _errors(distinct))
+
+    benchmark.pedantic(one_round, rounds=3, iterations=1)
+
+    # one issue per distinct failure, a single one for a failure repeated everywhere
+    assert len(created) == (len(rounds) * WORKERS * FAILURES if distinct else 1)
+    benchmark.extra_info["failures"] = WORKERS * FAILURES
+    # no stats with --benchmark-disable
+    if benchmark.stats is not None:
+        benchmark.extra_info["failures_per_second"] = WORKERS * FAILURES / benchmark.stats["mean"]
@@ -0,0 +1,20 @@
+"""Success path overhead of @bug_buddy against an undecorated call."""
+
+import pytest
+from bug_buddy import bug_buddy
+
+
+def _add(a, b=1):
+    return a + b
+
+
+@pytest.mark.benchmark(group="success path")
+def test_undecorated(benchmark):
+    assert benchmark(_add, 1, b=2) == 3
+
+
+@pytest.mark.benchmark(group="success path")
+def test_decorated(benchmark):
+    decorated = bug_buddy(_add)
+
+    assert benchmark(decorated, 1, b=2) == 3
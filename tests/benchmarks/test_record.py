@@ -0,0 +1,64 @@
+"""Failure path latency through Listener.record, for shallow and deep tracebacks."""
+
+import sys
+from logging import getLogger
+
+import pytest
+from bug_buddy._frames import walk
+from bug_buddy.cache import JsonlCacheBackend
+from bug_buddy.listener import Listener
+
+DEPTHS = [1, 1000]
+
+
+def _recurse(depth):
+    if depth <= 1:
+        raise ValueError("benchmark failure")
+    _recurse(depth - 1)
+
+
+def _failure(depth):
+    """Frames of a failure `depth` calls deep, captured as @bug_buddy captures them."""
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, depth + 100))
+    try:
+        _recurse(depth)
+    except ValueError as e:
+        return walk(e.__traceback__)
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+@pytest.mark.benchmark(group="record")
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_record_new_failure(benchmark, home, integration, depth):
+    # every record is a new issue: rendered, cached and created on the stub tracker
+    listener = Listener(
+        integration=integration,
+        cache=JsonlCacheBackend(path=str(home / "cache")),
+        index=None,
+        logger=getLogger("benchmark"),
+    )
+    tb = _failure(depth)
+
+    issue = benchmark(listener.record, tb, ValueError, "_recurse")
+
+    assert issue.title.startswith("BugBuddy-_recurse-")
+
+
+@pytest.mark.benchmark(group="record")
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_record_repeat_failure(benchmark, home, integration, depth):
+    # every record after the first is deduplicated by fingerprint
+    listener = Listener(
+        integration=integration,
+        cache=JsonlCacheBackend(path=str(home / "cache")),
+        logger=getLogger("benchmark"),
+    )
+    tb = _failure(depth)
+    first = listener.record(tb, ValueError, "_recurse")
+
+    issue = benchmark(listener.record, tb, ValueError, "_recurse")
+
+    assert issue.title == first.title
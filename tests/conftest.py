@@ -0,0 +1,73 @@
+"""Fixtures shared by the tests."""
+
+import itertools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _Github(BaseHTTPRequestHandler):
+    """Answers the issues endpoints of one repository, paginated by `page`."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _reply(self, status: int, body: object, headers: dict = {}) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        path, _, query = self.path.partition("?")
+        params = dict(p.split("=", 1) for p in query.split("&") if p)
+        page, per_page = int(params.get("page", 1)), int(params.get("per_page", 30))
+        issues = self.server.issues[::-1][(page - 1) * per_page : page * per_page]
+        headers = {}
+        if page * per_page < len(self.server.issues):
+            url = f"http://127.0.0.1:{self.server.server_port}{path}"
+            headers["Link"] = f'<{url}?per_page={per_page}&page={page + 1}>; rel="next"'
+        self._reply(200, issues, headers)
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path.endswith("/comments"):
+            self._reply(201, {"id": 1})
+            return
+        issue = {
+            "number": next(self.server.numbers),
+            "title": body["title"],
+            "state": "open",
+            "user": {"login": "bug-buddy", "html_url": "https://github.com/bug-buddy"},
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+            "body": body.get("body"),
+            "labels": [{"name": name} for name in body.get("labels", [])],
+        }
+        self.server.issues.append(issue)
+        self._reply(201, issue)
+
+
+@pytest.fixture
+def github(tmp_path, monkeypatch):
+    """Stub GitHub API URL, with $HOME in a temporary directory."""
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("GITHUB_TOKEN", "test")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Github)
+    server.daemon_threads = True
+    server.issues, server.numbers = [], itertools.count(1)
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
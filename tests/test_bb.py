@@ -0,0 +1,83 @@
+"""Wrappers of the bug_buddy decorator."""
+
+import asyncio
+import linecache
+
+import pytest
+from bug_buddy import bug_buddy
+from bug_buddy.cache import JsonlCacheBackend
+from bug_buddy.listener import Listener
+
+
+def test_async_generator_receives_sent_and_thrown_values():
+    closed = []
+
+    @bug_buddy(policy=False, outbox=False)
+    async def doubler():
+        value = 0
+        try:
+            while True:
+                try:
+                    value = yield value * 2
+                except KeyError:
+                    value = -1
+        finally:
+            closed.append(True)
+
+    async def main():
+        gen = doubler()
+        received = [await gen.asend(None), await gen.asend(3), await gen.asend(5)]
+        received.append(await gen.athrow(KeyError()))
+        await gen.aclose()
+        return received
+
+    assert asyncio.run(main()) == [0, 6, 10, -2]
+    assert closed == [True]
+
+
+def test_repeat_failure_reads_no_source_lines(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    lookups = []
+    getline = linecache.getline
+
+    def counting(*args):
+        lookups.append(args)
+        return getline(*args)
+
+    @bug_buddy(policy=False, outbox=False)
+    def fail():
+        raise ValueError("repeated failure")
+
+    monkeypatch.setattr(linecache, "getline", counting)
+    for attempt in range(2):
+        lookups.clear()
+        with pytest.raises(ValueError):
+            fail()
+        if attempt == 0:
+            assert lookups
+
+    assert lookups == []
+    records = list(JsonlCacheBackend().iter_records())
+    assert len(records) == 1
+    assert "ValueError: repeated failure" in records[0]["description"]
+
+
+def test_failure_is_recorded_with_its_exception(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    recorded = []
+    record = Listener.record
+
+    def recording(self, *args, **kwargs):
+        recorded.append(kwargs.get("exc"))
+        return record(self, *args, **kwargs)
+
+    monkeypatch.setattr(Listener, "record", recording)
+
+    @bug_buddy(policy=False, outbox=False)
+    def fail():
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError) as e:
+        fail()
+
+    assert recorded == [e.value]
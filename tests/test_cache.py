@@ -0,0 +1,70 @@
+"""Migration and durability of the JSON Lines cache."""
+
+import json
+import os
+import time
+
+import pytest
+from bug_buddy import cache
+from bug_buddy.cache import JsonlCacheBackend, migrate_json_array
+
+RECORDS = [{"title": f"BugBuddy-f-{n}", "labels": ["ValueError"], "n": n} for n in range(3)]
+
+
+@pytest.fixture
+def legacy(tmp_path) -> str:
+    """Cache written by Bug Buddy <= 1.1, an indented JSON array."""
+
+    path = tmp_path / "cache"
+    path.write_text(json.dumps(RECORDS, indent=4))
+    return str(path)
+
+
+def test_legacy_array_is_migrated_once(legacy, monkeypatch):
+    migrations = []
+    migrate = cache.migrate_json_array
+
+    def counting(path: str) -> int:
+        migrations.append(path)
+        return migrate(path)
+
+    monkeypatch.setattr(cache, "migrate_json_array", counting)
+    backend = JsonlCacheBackend(path=legacy)
+
+    assert list(backend.iter_records()) == RECORDS
+    backend.append({"title": "BugBuddy-g-3"})
+    assert migrations == [legacy]
+
+    with open(legacy, "rb") as f:
+        lines = f.read().splitlines()
+    assert [json.loads(line) for line in lines] == [*RECORDS, {"title": "BugBuddy-g-3"}]
+
+    inode = os.stat(legacy).st_ino
+    titles = [r["title"] for r in JsonlCacheBackend(path=legacy).iter_records()]
+    assert titles == [r["title"] for r in RECORDS] + ["BugBuddy-g-3"]
+    assert migrate_json_array(legacy) == 0
+    assert os.stat(legacy).st_ino == inode
+
+
+def test_missing_cache_needs_no_migration(tmp_path):
+    assert migrate_json_array(str(tmp_path / "cache")) == 0
+    assert list(JsonlCacheBackend(path=str(tmp_path / "cache")).iter_records()) == []
+
+
+@pytest.mark.parametrize("policy, expected", [("never", 0), ("always", 4), ("interval", 2)])
+def test_fsync_policy(tmp_path, monkeypatch, policy, expected):
+    backend = JsonlCacheBackend(path=str(tmp_path / "cache"), fsync=policy, fsync_interval=1.0)
+    synced, now = [], [time.monotonic() + 10]
+    monkeypatch.setattr(os, "fsync", synced.append)
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    for step in (0, 0.4, 0.4, 0.4):
+        now[0] += step
+        backend.append({"title": "BugBuddy-f"})
+
+    assert len(synced) == expected
+
+
+def test_unknown_fsync_policy_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        JsonlCacheBackend(path=str(tmp_path / "cache"), fsync="sometimes")
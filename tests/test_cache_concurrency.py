@@ -0,0 +1,68 @@
+"""Contention tests for the JSON Lines cache shared by many processes."""
+
+import glob
+import multiprocessing
+
+import pytest
+from bug_buddy.cache import JsonlCacheBackend, merge_shards
+
+PROCESSES = 32
+RECORDS = 50
+# larger than PIPE_BUF, so O_APPEND alone would not keep concurrent writes whole
+DESCRIPTION = "x" * 8192
+
+
+def _append(path: str, shard: bool, worker: int) -> None:
+    backend = JsonlCacheBackend(path=path, shard=shard)
+    for n in range(RECORDS):
+        backend.append({"id": f"{worker}-{n}", "description": DESCRIPTION})
+
+
+def _contend(path: str, shard: bool) -> None:
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_append, args=(path, shard, w)) for w in range(PROCESSES)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+        assert p.exitcode == 0
+
+
+def _ids(path: str) -> list[str]:
+    records = list(JsonlCacheBackend(path=path).iter_records())
+    assert all(r["description"] == DESCRIPTION for r in records)
+    return [r["id"] for r in records]
+
+
+@pytest.mark.parametrize("shard", [False, True])
+def test_concurrent_appends_keep_every_record(tmp_path, shard):
+    path = str(tmp_path / "cache")
+
+    _contend(path, shard)
+    # at the end of the session, as multiprocessing children skip atexit
+    merged = merge_shards(path)
+
+    ids = _ids(path)
+    assert len(ids) == PROCESSES * RECORDS
+    assert len(set(ids)) == len(ids)
+    assert merged == (len(ids) if shard else 0)
+    assert glob.glob(path + ".*.shard") == []
+
+
+def test_merge_shards_left_behind(tmp_path):
+    path = str(tmp_path / "cache")
+    (tmp_path / "cache.123.shard").write_text('{"id":"a","description":""}\n{"id":')
+
+    assert merge_shards(path) == 1
+    assert [r["id"] for r in JsonlCacheBackend(path=path).iter_records()] == ["a"]
+    assert glob.glob(path + ".*.shard") == []
+
+
+def test_corrupt_tail_is_skipped(tmp_path):
+    path = tmp_path / "cache"
+    path.write_text('{"id":"a"}\n{"id":"b","descr')
+    backend = JsonlCacheBackend(path=str(path))
+
+    backend.append({"id": "c"})
+
+    assert [r["id"] for r in backend.iter_records()] == ["a", "c"]
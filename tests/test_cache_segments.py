@@ -0,0 +1,56 @@
+"""Rotation, compaction and retention of the JSON Lines cache."""
+
+import glob
+import os
+
+from bug_buddy.cache import JsonlCacheBackend, segments
+
+RECORDS = 300
+DESCRIPTION = "x" * 100
+
+
+def _fill(backend: JsonlCacheBackend, issues: int) -> None:
+    for n in range(RECORDS):
+        backend.append({"title": f"issue-{n % issues}", "n": n, "description": DESCRIPTION})
+    backend.maintain()
+
+
+def test_rotated_segments_are_compressed_and_read_in_order(tmp_path):
+    backend = JsonlCacheBackend(path=str(tmp_path / "cache"), max_bytes=4096)
+
+    _fill(backend, RECORDS)
+
+    assert len(segments(backend.path)) > 1
+    assert glob.glob(backend.path + ".*.seg") == []
+    assert [r["n"] for r in backend.iter_records()] == list(range(RECORDS))
+
+
+def test_compact_merges_duplicates(tmp_path):
+    backend = JsonlCacheBackend(path=str(tmp_path / "cache"), max_bytes=4096)
+    _fill(backend, 10)
+    backend.update([{"title": "issue-3", "state": "closed"}], by=("title",))
+
+    result = backend.compact()
+
+    records = list(backend.iter_records())
+    assert result.records == 10 and result.merged == RECORDS - 10
+    assert sorted(r["title"] for r in records) == sorted(f"issue-{n}" for n in range(10))
+    assert [r.get("state") for r in records if r["title"] == "issue-3"] == ["closed"]
+    # each issue keeps its latest version
+    assert max(r["n"] for r in records) == RECORDS - 1
+
+
+def test_retention_caps_disk_use(tmp_path):
+    path = str(tmp_path / "cache")
+    _fill(JsonlCacheBackend(path=path, max_bytes=4096, compression="none"), RECORDS)
+
+    backend = JsonlCacheBackend(
+        path=path, max_bytes=4096, compression="none", max_total_bytes=16384
+    )
+    dropped = backend.maintain()
+
+    files = glob.glob(path + "*")
+    assert dropped > 0
+    assert sum(os.path.getsize(f) for f in files if not f.endswith(".lock")) <= 16384
+    # the newest records survive
+    assert [r["n"] for r in backend.iter_records()][-1] == RECORDS - 1
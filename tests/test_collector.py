@@ -0,0 +1,79 @@
+"""Reports sent to the host's collector."""
+
+import sys
+import threading
+import time
+import traceback
+
+import pytest
+from bug_buddy._render import DescriptionRenderer
+from bug_buddy.collector import Collector, CollectorClient
+from bug_buddy.fingerprint import fingerprint
+from bug_buddy.listener import Listener
+
+
+def _wait(condition) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def collector(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    collector = Collector(path=str(tmp_path / "collector.sock"))
+    thread = threading.Thread(target=collector.serve_forever, daemon=True)
+    thread.start()
+    _wait(lambda: collector._server is not None)
+    yield collector
+    collector.shutdown()
+    thread.join()
+
+
+def test_repeats_are_counted_without_rendering(collector, monkeypatch):
+    listener = Listener(collector=CollectorClient(path=collector.path))
+    rendered = []
+    render = DescriptionRenderer.render
+    monkeypatch.setattr(
+        DescriptionRenderer,
+        "render",
+        lambda *args, **kwargs: rendered.append(args) or render(*args, **kwargs),
+    )
+    try:
+        raise ValueError("failure")
+    except ValueError as e:
+        tb = traceback.extract_tb(e.__traceback__)
+
+    first = listener.record(tb, ValueError, "fail")
+    _wait(lambda: collector.recorded == 1)
+    repeat = listener.record(tb, ValueError, "fail")
+    _wait(lambda: collector.recorded == 2)
+
+    occurrence = listener.index.get(fingerprint(ValueError, listener.filter_tb(tb)), "local")
+    assert first.state == "collected" and repeat.state == "local"
+    assert len(rendered) == 1 and occurrence.count == 2
+
+
+def test_counters_add_up_under_concurrent_puts():
+    collector = Collector(maxsize=1000)
+
+    def put():
+        for n in range(500):
+            collector.put({"n": n})
+
+    # switch threads as often as possible, to interleave the counter updates
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=put) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    metrics = collector.metrics()
+    assert metrics["received"] == 4000
+    assert (metrics["depth"], metrics["dropped"]) == (1000, 3000)
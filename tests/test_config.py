@@ -0,0 +1,14 @@
+"""Configuration read from the environment."""
+
+from bug_buddy._di_container import BugBuddyInjector
+from bug_buddy.cache import JsonlCacheBackend
+from bug_buddy.store import SqliteIssueStore
+
+
+def test_cache_backend_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    di = BugBuddyInjector()
+
+    assert isinstance(di.cache(di.config()), JsonlCacheBackend)
+    monkeypatch.setenv("BUG_BUDDY_CACHE_BACKEND", "sqlite")
+    assert isinstance(di.cache(di.config()), SqliteIssueStore)
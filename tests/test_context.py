@@ -0,0 +1,25 @@
+"""Execution context of reports."""
+
+import subprocess
+
+from bug_buddy import context
+
+
+def test_snapshot_runs_no_provider_by_default(monkeypatch):
+    def run(*args, **kwargs):
+        raise AssertionError("the default snapshot forked a process")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    monkeypatch.setattr(context, "_SNAPSHOT", None)
+
+    labels = [label for label, _ in context.execution_context()]
+
+    assert context._PROVIDERS == {}
+    assert {"Container", "Kubernetes Pod"}.isdisjoint(labels)
+
+
+def test_opt_in_provider(monkeypatch):
+    monkeypatch.setattr(context, "_PROVIDERS", {})
+    context.register_provider("git", lambda: [("Commit SHA", "abc123")])
+
+    assert ("Commit SHA", "abc123") in context.snapshot()
@@ -0,0 +1,62 @@
+"""Deduplication of failures through the fingerprint index."""
+
+import asyncio
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from bug_buddy import GithubIntegration, bug_buddy
+from bug_buddy.fingerprint import FingerprintIndex
+from bug_buddy.listener import Listener
+
+
+def test_one_of_concurrent_first_occurrences_claims(tmp_path):
+    index = FingerprintIndex(path=str(tmp_path / "index.db"))
+
+    with ThreadPoolExecutor(8) as pool:
+        claims = list(pool.map(lambda n: index.claim("fp", "scope", {"n": n}), range(32)))
+
+    owners = [claim for claim in claims if claim is None]
+    assert len(owners) == 1
+    assert max(claim.count for claim in claims if claim is not None) == 32
+
+
+def test_client_failure_releases_the_fingerprint(github, monkeypatch):
+    integration = GithubIntegration(repo="o/r", url=github.url)
+
+    @bug_buddy(integration=integration, policy=False, outbox=False)
+    def fail():
+        raise ValueError("failure")
+
+    @bug_buddy(integration=integration, policy=False, outbox=False)
+    async def afail():
+        fail()
+
+    monkeypatch.delenv("GITHUB_TOKEN")
+    for call in (fail, lambda: asyncio.run(afail())):
+        with pytest.raises(ValueError):
+            call()
+    assert github.issues == []
+
+    monkeypatch.setenv("GITHUB_TOKEN", "test")
+    with pytest.raises(ValueError):
+        fail()
+    assert len(github.issues) == 1
+
+
+def test_stale_pending_fingerprint_is_reclaimed(github):
+    try:
+        raise ValueError("failure")
+    except ValueError as e:
+        tb = traceback.extract_tb(e.__traceback__)
+    integration = GithubIntegration(repo="o/r", url=github.url)
+
+    # the process creating the issue dies once the fingerprint is claimed
+    Listener(integration=integration)._prepare(tb, ValueError, "fail")
+    assert Listener(integration=integration).record(tb, ValueError, "fail").state == "pending"
+
+    listener = Listener(integration=integration, index=FingerprintIndex(pending_ttl=0))
+    issue = listener.record(tb, ValueError, "fail")
+
+    assert issue.remote_id == "1" and len(github.issues) == 1
+    assert listener.record(tb, ValueError, "fail").remote_id == "1"
@@ -0,0 +1,36 @@
+"""GitHub integration against a local stub of its REST API."""
+
+import asyncio
+import logging
+
+import pytest
+from bug_buddy import GithubIntegration, bug_buddy
+from bug_buddy.cache import JsonlCacheBackend
+
+
+def test_async_failure_creates_issue(github):
+    integration = GithubIntegration(repo="o/r", url=github.url)
+
+    @bug_buddy(integration=integration, policy=False)
+    async def fail():
+        raise ValueError("async failure")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            asyncio.run(fail())
+
+    assert [issue["title"].split("-")[1] for issue in github.issues] == ["fail"]
+    records = list(JsonlCacheBackend().iter_records())
+    assert [(r["state"], r["remote_id"]) for r in records] == [("open", "1")]
+
+
+def test_find_issue_looks_past_the_first_page(github):
+    integration = GithubIntegration(repo="o/r", url=github.url)
+    client = integration.get_client(logging.getLogger(__name__))
+    first = client.create_issue(repo="o/r", description="", func_name="old")
+    client.write_interval = 0
+    for n in range(150):
+        github.issues.append({**github.issues[0], "number": n + 2, "title": f"BugBuddy-{n}"})
+
+    assert integration.find_issue(client, first.title).remote_id == first.remote_id
+    assert integration.find_issue(client, "BugBuddy-missing") is None
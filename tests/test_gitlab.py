@@ -0,0 +1,108 @@
+"""GitLab integration against stubbed clients."""
+
+import json
+import threading
+import time
+
+import requests
+from bug_buddy import GitlabIntegration
+from bug_buddy.integration import IssueDraft
+from bug_buddy.issue import GitlabIssuesClient
+from bug_buddy.listener import Listener
+
+
+def test_batch_is_created_on_a_bounded_pool(monkeypatch):
+    lock, running, peak = threading.Lock(), [0], [0]
+
+    def create_issue(self, client, description, labels, func_name, title=None, **kwargs):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        if title == "BugBuddy-f3":
+            raise ConnectionError(title)
+        return Listener._local_issue(title, description, labels, state="opened")
+
+    monkeypatch.setattr(GitlabIntegration, "create_issue", create_issue)
+    batch = [
+        IssueDraft(description="", labels=["ValueError"], func_name="f", title=f"BugBuddy-f{i}")
+        for i in range(8)
+    ]
+    results = GitlabIntegration(project_id=1).create_issues(None, batch, max_workers=3)
+
+    assert peak[0] == 3
+    assert [result.draft for result in results] == batch
+    assert [result.ok for result in results] == [i != 3 for i in range(8)]
+    assert isinstance(results[3].error, ConnectionError)
+    assert [r.issue.title for r in results if r.ok] == [
+        f"BugBuddy-f{i}" for i in range(8) if i != 3
+    ]
+
+
+def _gitlab_issue(iid: int) -> dict:
+    return {
+        "id": 100 + iid,
+        "iid": iid,
+        "title": f"BugBuddy-f{iid}",
+        "state": "opened",
+        "project_id": 1,
+        "author": {"name": "bug-buddy", "username": "bug-buddy", "state": "active"},
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+        "description": "",
+        "labels": ["BugBuddy"],
+    }
+
+
+class _Pages:
+    """Session serving three pages of issues, each linking to the next."""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, timeout=None, params=None, headers=None, **kwargs):
+        self.requests.append((url, params, headers))
+        page = len(self.requests)
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = json.dumps([_gitlab_issue(2 * page - 1), _gitlab_issue(2 * page)]).encode()
+        if page < 3:
+            url = f"https://gitlab.test/api/v4/projects/1/issues?cursor={page}"
+            resp.headers["Link"] = f'<{url}>; rel="next"'
+        return resp
+
+
+def test_get_issues_follows_every_page_lazily(monkeypatch):
+    normalized = []
+    normalize = GitlabIssuesClient._normalize_itype
+
+    def counting(issue):
+        normalized.append(issue["iid"])
+        return normalize(issue)
+
+    monkeypatch.setattr(GitlabIssuesClient, "_normalize_itype", staticmethod(counting))
+    session = _Pages()
+    client = GitlabIssuesClient(url="https://gitlab.test/api/v4", token="secret", session=session)
+
+    issues = client.get_issues(project_id=1, per_page=2)
+    first = next(issues)
+    assert (first.remote_id, normalized, len(session.requests)) == ("1", [1], 1)
+
+    rest = list(issues)
+    assert [issue.remote_id for issue in rest] == [str(iid) for iid in range(2, 7)]
+    assert normalized == list(range(1, 7))
+    assert [url for url, _, _ in session.requests] == [
+        "https://gitlab.test/api/v4/projects/1/issues",
+        "https://gitlab.test/api/v4/projects/1/issues?cursor=1",
+        "https://gitlab.test/api/v4/projects/1/issues?cursor=2",
+    ]
+    # the first request carries the filters, the next links carry them and the cursor
+    assert session.requests[0][1]["pagination"] == "keyset"
+    assert [params for _, params, _ in session.requests[1:]] == [None, None]
+
+    for url, params, headers in session.requests:
+        assert "private_token" not in url
+        assert "private_token" not in (params or {})
+        assert headers == {"PRIVATE-TOKEN": "secret"}
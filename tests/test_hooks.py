@@ -0,0 +1,47 @@
+"""Process wide exception capture."""
+
+import json
+import subprocess
+import sys
+
+# installed at import time, before the program imports asyncio and runs its loop
+PROGRAM = """
+import bug_buddy, json, sys
+
+bug_buddy.install(policy=False, outbox=False)
+imported = "asyncio" in sys.modules
+
+import asyncio
+
+
+def fail():
+    raise ValueError("failure")
+
+
+async def main():
+    asyncio.get_running_loop().call_soon(fail)
+    await asyncio.sleep(0.01)
+
+
+asyncio.run(main())
+asyncio.run(main())
+from bug_buddy.cache import JsonlCacheBackend
+
+print(json.dumps([imported, [r["func_name"] for r in JsonlCacheBackend().iter_records()]]))
+"""
+
+
+def test_loops_created_after_install_are_hooked(tmp_path):
+    stdout = subprocess.run(
+        [sys.executable, "-c", PROGRAM],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"HOME": str(tmp_path), "PATH": ""},
+    ).stdout
+
+    # the last line, after the logged detections
+    imported, recorded = json.loads(stdout.splitlines()[-1])
+    assert not imported
+    # one cached issue, the second loop's failure is a repeat
+    assert recorded == ["fail"]
@@ -0,0 +1,135 @@
+"""Retries and pooled clients for the issue trackers' HTTP APIs."""
+
+import asyncio
+import logging
+import os
+import time
+
+import pytest
+import requests
+from bug_buddy import _http, integration
+from bug_buddy._http import RetryPolicy, arequest, request
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _Response:
+    def __init__(self, status_code: int, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _Session:
+    """Serve the given responses, or raise the given exceptions, one per request."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def _next(self):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def request(self, method, url, timeout=None, **kwargs):
+        return self._next()
+
+    async def arequest(self, method, url, **kwargs):
+        return self._next()
+
+
+def _flaky():
+    return _Session(_Response(503), _Response(429, {"Retry-After": "2"}), _Response(200))
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(time, "sleep", slept.append)
+    return slept
+
+
+def test_retries_until_success(sleeps):
+    session = _flaky()
+    first = session.outcomes[0]
+    resp = request(
+        session, "POST", "https://t/issues", (1, 1), RetryPolicy(backoff_factor=0), LOGGER
+    )
+
+    assert resp.status_code == 200
+    assert session.calls == 3
+    assert sleeps == [0, 2.0]
+    assert first.closed
+
+
+def test_gives_up_after_max_retries(sleeps):
+    session = _Session(*(_Response(503) for _ in range(3)))
+    resp = request(
+        session, "GET", "https://t", (1, 1), RetryPolicy(max_retries=2, backoff_factor=0), LOGGER
+    )
+
+    assert resp.status_code == 503
+    assert session.calls == 3
+    assert len(sleeps) == 2
+
+
+def test_retries_connection_errors_but_not_read_timeouts(sleeps):
+    policy = RetryPolicy(backoff_factor=0)
+    session = _Session(requests.ConnectionError(), _Response(201))
+    assert request(session, "POST", "https://t", (1, 1), policy, LOGGER).status_code == 201
+    assert session.calls == 2
+
+    session = _Session(requests.ReadTimeout(), _Response(201))
+    with pytest.raises(requests.ReadTimeout):
+        request(session, "POST", "https://t", (1, 1), policy, LOGGER)
+    assert session.calls == 1
+
+
+def test_retry_after_is_a_floor():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=30.0)
+
+    for attempt in range(4):
+        assert policy.delay(attempt, "5") >= 5.0
+        assert policy.delay(attempt) <= 0.5 * 2**attempt
+    assert policy.delay(0, "120") == 30.0
+    assert policy.delay(0, "not a date") <= 0.5
+
+
+def test_async_retries_until_success(monkeypatch):
+    slept = []
+
+    async def sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    session = _flaky()
+    session.request = session.arequest
+    resp = asyncio.run(
+        arequest(session, "POST", "https://t/issues", RetryPolicy(backoff_factor=0), LOGGER)
+    )
+
+    assert resp.status_code == 200
+    assert session.calls == 3
+    assert slept == [0, 2.0]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_clients_are_not_shared_with_forked_children(monkeypatch):
+    monkeypatch.setitem(integration._CLIENTS, "parent", _http.build_session())
+
+    pid = os.fork()
+    if pid == 0:
+        os._exit(1 if integration._CLIENTS else 0)
+    _, status = os.waitpid(pid, 0)
+
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert "parent" in integration._CLIENTS
@@ -0,0 +1,50 @@
+"""Guards on the cold import cost of bug_buddy."""
+
+import json
+import subprocess
+import sys
+
+# HTTP and validation machinery must only load once something fails
+LAZY_MODULES = ["requests", "pydantic", "attrs", "httpx", "sqlite3", "asyncio"]
+# generous enough for slow CI runners; eager imports cost over 300ms
+MAX_IMPORT_TIME_US = 60_000
+IMPORT = "import bug_buddy; from bug_buddy import bug_buddy, GitlabIntegration, LinearIntegration"
+
+
+def _top_level_import_times(code: str) -> dict[str, int]:
+    """Cumulative microseconds of each top-level import `python -X importtime` reports."""
+
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time():
+    startup = _top_level_import_times("pass")
+    imported = _top_level_import_times(IMPORT)
+
+    cost = sum(us for name, us in imported.items() if name not in startup)
+    assert cost < MAX_IMPORT_TIME_US, imported
+
+
+def test_import_is_lazy():
+    code = f"{IMPORT}; import json, sys; print(json.dumps(sorted(sys.modules)))"
+    modules = json.loads(
+        subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+    )
+
+    assert [m for m in LAZY_MODULES if m in modules] == []
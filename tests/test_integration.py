@@ -0,0 +1,42 @@
+"""Integration configurations."""
+
+import dataclasses
+
+import pytest
+from bug_buddy.integration import Integration, from_spec
+
+
+@dataclasses.dataclass
+class _Partial(Integration):
+    """Integration implementing only what creating an issue takes."""
+
+    name = "Partial"
+    scope = "partial"
+
+    def _client(self, logger):
+        return None
+
+    def create_issue(self, client, description, labels, func_name, title=None, **kwargs):
+        raise AssertionError("unreachable")
+
+
+def test_integrations_must_implement_every_operation():
+    with pytest.raises(TypeError) as e:
+        _Partial()
+
+    for method in ("comment_issue", "updated_issues", "_async_client", "acreate_issue"):
+        assert method in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"type": "GitlabIntegration", "config": {"project_id": 1}},
+        {"type": "GithubIntegration", "config": {"repo": "o/r"}},
+        {"type": "LinearIntegration", "config": {"team_id": "team"}},
+    ],
+)
+def test_shipped_integrations_are_complete(spec):
+    integration = from_spec(spec)
+
+    assert from_spec(integration.spec()) == integration
@@ -0,0 +1,96 @@
+"""Normalized issues and their cache records."""
+
+import json
+import sys
+
+import pytest
+from bug_buddy import cache
+from bug_buddy.cache import _encode
+from bug_buddy.issue import Issue
+
+FIELDS = dict(
+    id=7,
+    title="BugBuddy-f-1",
+    state="open",
+    project_id="o/r",
+    author=("bug-buddy", "bug_buddy", "active"),
+    created_at="2026-01-01T00:00:00Z",
+    updated_at="2026-01-02T00:00:00Z",
+    description="boom",
+    labels=["ValueError"],
+    remote_id="7",
+)
+
+
+def test_fields_are_coerced():
+    issue = Issue(**{**FIELDS, "id": "7", "author": ["bug-buddy", "bug_buddy", "active"]})
+
+    assert issue.id == 7
+    assert issue.author == ("bug-buddy", "bug_buddy", "active")
+    assert issue == Issue._unchecked(**FIELDS)
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [("id", "seven"), ("title", None), ("author", ("bug-buddy", "active")), ("labels", "Bug")],
+)
+def test_invalid_fields_are_rejected(field, value):
+    with pytest.raises(ValueError, match=field):
+        Issue(**{**FIELDS, field: value})
+
+
+def test_unchecked_issue_round_trips_through_its_record():
+    issue = Issue._unchecked(**FIELDS)
+    record = issue._clean()
+
+    assert record == {**FIELDS, "author": "bug-buddy_bug_buddy_active"}
+    assert Issue._unchecked(**record)._clean() == record
+    assert Issue._unchecked(**{**record, "author": FIELDS["author"]}) == issue
+    assert json.loads(_encode(record)) == record
+
+
+def test_equality():
+    issue = Issue._unchecked(**FIELDS)
+
+    assert issue == Issue(**FIELDS)
+    assert issue != Issue._unchecked(**{**FIELDS, "state": "closed"})
+    assert issue != FIELDS
+    with pytest.raises(TypeError):
+        hash(issue)
+
+
+@pytest.fixture(params=["orjson", "msgspec", "json"])
+def encoder(request, monkeypatch):
+    """Cache line encoder, as picked when only the given library is installed."""
+
+    if request.param == "json":
+        monkeypatch.setattr(cache, "_FAST_ENCODE", None)
+        return request.param
+    pytest.importorskip(request.param)
+    if request.param == "msgspec":
+        # orjson is preferred when both are installed
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setattr(cache, "_FAST_ENCODE", cache._fast_encoder())
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        Issue._unchecked(**FIELDS)._clean(),
+        {"nested": {"list": [1, 2.5, None, True]}, "empty": {}},
+        # wider than 64 bits, which only the json module encodes
+        {"id": 2**127 + 1},
+    ],
+)
+def test_encoders_write_compact_json_lines(encoder, record):
+    assert _encode(record) == (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+
+def test_encoders_agree_on_non_ascii_text(encoder):
+    record = {"description": "échec ❌", "labels": ["ValueError"]}
+
+    line = _encode(record)
+
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert json.loads(line) == record
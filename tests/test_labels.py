@@ -0,0 +1,103 @@
+"""TTL-bounded cache of Linear label IDs."""
+
+import json
+import os
+import time
+
+from bug_buddy._labels import LabelCache
+from bug_buddy.issue import LinearIssuesClient
+
+
+def test_labels_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    labels = LabelCache(ttl=60)
+    labels.put("team", "Bug", "label-bug")
+
+    assert labels.lookup("team", "Bug") == (True, "label-bug")
+    now[0] += 61
+    assert labels.lookup("team", "Bug") == (False, None)
+
+
+def test_full_listing_answers_for_missing_labels(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    labels = LabelCache(ttl=60)
+    labels.put_team("team", {"Bug": "label-bug"})
+
+    assert labels.lookup("team", "Missing") == (True, None)
+    assert labels.lookup("other", "Missing") == (False, None)
+    now[0] += 61
+    assert labels.lookup("team", "Missing") == (False, None)
+
+
+def test_invalidate_forgets_a_team(tmp_path):
+    path = str(tmp_path / "labels.json")
+    labels = LabelCache(path=path)
+    labels.put_team("team", {"Bug": "stale"})
+    labels.put_team("other", {"Bug": "kept"})
+
+    labels.invalidate("team")
+
+    assert labels.lookup("team", "Bug") == (False, None)
+    assert labels.lookup("other", "Bug") == (True, "kept")
+    assert LabelCache(path=path).lookup("team", "Bug") == (False, None)
+
+
+def test_labels_persist_between_runs(tmp_path):
+    path = str(tmp_path / "labels.json")
+    LabelCache(path=path).put_team("team", {"Bug": "label-bug"})
+
+    restored = LabelCache(path=path)
+
+    assert restored.lookup("team", "Bug") == (True, "label-bug")
+    assert restored.lookup("team", "Missing") == (True, None)
+    assert os.listdir(tmp_path) == ["labels.json"]
+
+
+def test_failed_save_leaves_no_partial_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "labels.json")
+
+    def replace(src, dst):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(os, "replace", replace)
+    labels = LabelCache(path=path)
+    labels.put_team("team", {"Bug": "label-bug"})
+
+    assert labels.lookup("team", "Bug") == (True, "label-bug")
+    assert os.listdir(tmp_path) == []
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    path = tmp_path / "labels.json"
+    path.write_text("{not json")
+
+    labels = LabelCache(path=str(path))
+
+    assert labels.lookup("team", "Bug") == (False, None)
+    labels.put("team", "Bug", "label-bug")
+    assert json.loads(path.read_text())["labels"][0][:3] == ["team", "Bug", "label-bug"]
+
+
+def test_stale_label_is_refreshed_after_a_rejection(tmp_path, monkeypatch):
+    calls = []
+
+    def graphql(client, query, variables):
+        calls.append(dict(variables))
+        if "GetTeamLabels" in query:
+            return {"data": {"team": {"labels": {"nodes": [{"name": "Bug", "id": "fresh"}]}}}}
+        if variables["labelIds"] == ["stale"]:
+            return {"errors": [{"message": "Label not found"}]}
+        return {"data": {"issueCreate": {"issue": {"number": 1, "title": variables["title"]}}}}
+
+    monkeypatch.setattr(LinearIssuesClient, "_graphql", graphql)
+    path = str(tmp_path / "labels.json")
+    LabelCache(path=path).put_team("team", {"Bug": "stale"})
+    client = LinearIssuesClient(token="test", label_cache=LabelCache(path=path))
+
+    issue = client.create_issue("team", "description", title="BugBuddy-f")
+
+    assert issue.title == "BugBuddy-f"
+    assert [c.get("labelIds") for c in calls] == [["stale"], None, ["fresh"]]
+    assert LabelCache(path=path).lookup("team", "Bug") == (True, "fresh")
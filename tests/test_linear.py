@@ -0,0 +1,118 @@
+"""Linear integration against a stubbed GraphQL API."""
+
+import re
+
+import pytest
+from bug_buddy import LinearIntegration
+from bug_buddy._labels import LabelCache
+from bug_buddy.integration import IssueDraft
+from bug_buddy.issue import LinearIssuesClient
+
+
+def _node(title: str, number: int) -> dict:
+    return {
+        "id": f"uuid-{number}",
+        "number": number,
+        "title": title,
+        "description": "",
+        "state": {"name": "Todo"},
+        "labels": {"nodes": [{"name": "Bug"}]},
+    }
+
+
+class _Linear:
+    """Answers issueCreate documents, batched or not, failing the titles in `rejected`."""
+
+    def __init__(self, rejected=(), retry_fails: bool = True):
+        self.rejected = set(rejected)
+        self.retry_fails = retry_fails
+        self.batches: list[int] = []
+        self.retried: list[str] = []
+        self.created = 0
+
+    def _create(self, title: str) -> dict:
+        self.created += 1
+        return _node(title, self.created)
+
+    def __call__(self, query: str, variables: dict) -> dict:
+        if "mutation CreateIssues" in query:
+            size = len([key for key in variables if re.fullmatch(r"title\d+", key)])
+            self.batches.append(size)
+            data = {}
+            for i in range(size):
+                title = variables[f"title{i}"]
+                data[f"i{i}"] = (
+                    None
+                    if title in self.rejected
+                    else {"success": True, "issue": self._create(title)}
+                )
+            return {"data": data, "errors": [{"message": "issueCreate failed"}]}
+
+        if "issueCreate(input" in query:
+            self.retried.append(variables["title"])
+            if self.retry_fails:
+                return {"errors": [{"message": "rejected"}]}
+            return {"data": {"issueCreate": {"issue": self._create(variables["title"])}}}
+
+        if "GetIssue" in query:
+            return {"data": {"issue": None}}
+        raise AssertionError(f"unexpected query: {query}")
+
+
+@pytest.fixture
+def linear(monkeypatch):
+    def install(**kwargs) -> tuple[LinearIssuesClient, _Linear]:
+        stub = _Linear(**kwargs)
+        monkeypatch.setattr(LinearIssuesClient, "_graphql", stub)
+        client = LinearIssuesClient(token="test", label_cache=LabelCache())
+        client.label_cache.put_team("team", {"Bug": "label-bug"})
+        return client, stub
+
+    return install
+
+
+def _items(n: int) -> list[dict]:
+    return [{"description": f"d{i}", "title": f"BugBuddy-f{i}"} for i in range(n)]
+
+
+def test_issues_are_created_in_batches_of_20(linear):
+    client, stub = linear()
+    results = client.create_issues("team", _items(45))
+
+    assert stub.batches == [20, 20, 5]
+    assert [issue.title for issue in results] == [f"BugBuddy-f{i}" for i in range(45)]
+    assert stub.retried == []
+
+
+def test_rejected_issue_fails_alone(linear):
+    client, stub = linear(rejected={"BugBuddy-f2"})
+    results = client.create_issues("team", _items(5))
+
+    assert stub.batches == [5]
+    assert stub.retried == ["BugBuddy-f2"]
+    assert isinstance(results[2], ValueError)
+    assert [r.title for i, r in enumerate(results) if i != 2] == [
+        f"BugBuddy-f{i}" for i in (0, 1, 3, 4)
+    ]
+
+
+def test_rejected_issue_is_retried_alone(linear):
+    client, stub = linear(rejected={"BugBuddy-f2"}, retry_fails=False)
+    results = client.create_issues("team", _items(5))
+
+    assert stub.retried == ["BugBuddy-f2"]
+    assert [issue.title for issue in results] == [f"BugBuddy-f{i}" for i in range(5)]
+
+
+def test_integration_batch_results_keep_input_order(linear):
+    client, _ = linear(rejected={"BugBuddy-f0"})
+    batch = [
+        IssueDraft(description="", labels=["ValueError"], func_name="f", title=f"BugBuddy-f{i}")
+        for i in range(3)
+    ]
+    results = LinearIntegration(team_id="team").create_issues(client, batch)
+
+    assert [result.draft for result in results] == batch
+    assert [result.ok for result in results] == [False, True, True]
+    assert isinstance(results[0].error, ValueError)
+    assert [result.issue.title for result in results[1:]] == ["BugBuddy-f1", "BugBuddy-f2"]
@@ -0,0 +1,26 @@
+"""Traceback filtering of the listener."""
+
+import importlib
+import sys
+import traceback
+
+from bug_buddy import bug_buddy
+from bug_buddy.listener import Listener
+
+
+def test_filter_tb_keeps_user_modules_named_like_bug_buddy_ones(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (tmp_path / "hooks.py").write_text("def fail():\n    raise ValueError('failure')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "hooks", raising=False)
+    hooks = importlib.import_module("hooks")
+
+    try:
+        bug_buddy(policy=False, outbox=False)(hooks.fail)()
+    except ValueError as e:
+        tb = traceback.extract_tb(e.__traceback__)
+
+    filtered = Listener().filter_tb(tb)
+
+    assert len(filtered) < len(tb)
+    assert [t.filename for t in filtered] == [__file__, str(tmp_path / "hooks.py")]
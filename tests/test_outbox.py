@@ -0,0 +1,99 @@
+"""Durable outbox of undelivered reports."""
+
+import os
+import threading
+import time
+import traceback
+
+from bug_buddy import GithubIntegration
+from bug_buddy.listener import Listener
+from bug_buddy.outbox import Outbox
+
+
+def _spool(outbox: Outbox, n: int) -> list[str]:
+    keys = [f"report-{i}" for i in range(n)]
+    for key in keys:
+        outbox.put(key, {"key": key})
+    return keys
+
+
+def test_claim_renames_the_report(tmp_path):
+    outbox = Outbox(path=str(tmp_path))
+    _spool(outbox, 2)
+
+    claims = outbox._claim()
+    key, entry = next(claims)
+
+    assert entry == {"key": key}
+    assert sorted(os.listdir(tmp_path)) == [f"{key}.inflight", "report-1.json"]
+    assert outbox.pending() == ["report-1"]
+
+
+def test_concurrent_replays_send_each_report_once(tmp_path):
+    keys = _spool(Outbox(path=str(tmp_path)), 50)
+    sent, lock = [], threading.Lock()
+
+    def deliver(entries):
+        time.sleep(0.001)
+        with lock:
+            sent.extend(entry["key"] for entry in entries)
+        return [None] * len(entries)
+
+    # separate instances, as in separate processes, so only the claims keep them apart
+    outboxes = [Outbox(path=str(tmp_path), batch_size=5) for _ in range(4)]
+    threads = [threading.Thread(target=o.replay, args=(deliver,)) for o in outboxes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(sent) == sorted(keys)
+    assert os.listdir(tmp_path) == []
+
+
+def test_failed_delivery_is_spooled_back(tmp_path):
+    outbox = Outbox(path=str(tmp_path))
+    _spool(outbox, 3)
+
+    def deliver(entries):
+        return [None if entry["key"] != "report-1" else ConnectionError() for entry in entries]
+
+    assert outbox.replay(deliver) == (2, 1)
+    assert outbox.pending() == ["report-1"]
+    assert outbox.replay(lambda entries: [None] * len(entries)) == (1, 0)
+
+
+def test_abandoned_claims_are_recovered(tmp_path):
+    outbox = Outbox(path=str(tmp_path), stale_after=60)
+    _spool(outbox, 2)
+    for key, age in (("report-0", 3600), ("report-1", 0)):
+        inflight = os.path.join(tmp_path, f"{key}.inflight")
+        os.rename(os.path.join(tmp_path, f"{key}.json"), inflight)
+        os.utime(inflight, (time.time() - age, time.time() - age))
+    sent = []
+
+    assert outbox.replay(lambda entries: [sent.append(e["key"]) for e in entries]) == (1, 0)
+
+    # the fresh claim belongs to a replay still running elsewhere
+    assert sent == ["report-0"]
+    assert os.listdir(tmp_path) == ["report-1.inflight"]
+
+
+def test_replayed_report_updates_its_spooled_record(github, monkeypatch):
+    listener = Listener(integration=GithubIntegration(repo="o/r", url=github.url), outbox=Outbox())
+    try:
+        raise ValueError("failure")
+    except ValueError as e:
+        tb = traceback.extract_tb(e.__traceback__)
+
+    monkeypatch.delenv("GITHUB_TOKEN")
+    spooled = listener.record(tb, ValueError, "fail")
+    monkeypatch.setenv("GITHUB_TOKEN", "test")
+    assert listener.outbox.replay(listener.deliver_batch) == (1, 0)
+
+    records = list(listener.cache.iter_records())
+    assert spooled.state == "spooled" and len(github.issues) == 1
+    assert [(r["title"], r["state"], r["remote_id"]) for r in records] == [
+        (spooled.title, "open", "1")
+    ]
+    assert records[0]["fingerprint"]
@@ -0,0 +1,69 @@
+"""Guards on the per-call cost of @bug_buddy."""
+
+import timeit
+
+import pytest
+from bug_buddy import bug_buddy
+from bug_buddy._di_container import BugBuddyInjector
+
+# generous enough for slow CI runners, far below what per-call setup used to cost
+MAX_OVERHEAD = 2e-6
+CALLS = 100_000
+
+
+def _add(a, b=1):
+    return a + b
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def test_success_path_overhead():
+    decorated = bug_buddy(_add)
+
+    bare = min(timeit.repeat(lambda: _add(1, b=2), number=CALLS, repeat=5))
+    wrapped = min(timeit.repeat(lambda: decorated(1, b=2), number=CALLS, repeat=5))
+
+    assert (wrapped - bare) / CALLS < MAX_OVERHEAD
+
+
+def test_setup_once_per_decoration(home, monkeypatch):
+    built = []
+    listener = BugBuddyInjector.listener
+
+    def counting(self, *args, **kwargs):
+        built.append(1)
+        return listener(self, *args, **kwargs)
+
+    monkeypatch.setattr(BugBuddyInjector, "listener", counting)
+
+    @bug_buddy
+    def ok():
+        return 1
+
+    @bug_buddy(outbox=False)
+    def fail():
+        raise KeyError("boom")
+
+    for _ in range(100):
+        ok()
+    assert built == []
+
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            fail()
+    assert built == [1]
+
+
+def test_logger_handlers_do_not_grow(home):
+    injector = BugBuddyInjector()
+    logger = injector.logger("INFO")
+    handlers = list(logger.handlers)
+
+    for _ in range(10):
+        injector.logger("INFO")
+
+    assert logger.handlers == handlers
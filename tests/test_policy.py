@@ -0,0 +1,79 @@
+"""Rate limiting of failure reports."""
+
+import logging
+import random
+import time
+
+from bug_buddy._frames import walk
+from bug_buddy.fingerprint import fingerprint
+from bug_buddy.listener import Listener
+from bug_buddy.policy import ReportPolicy
+
+
+def test_global_limit_does_not_spend_fingerprint_tokens(monkeypatch):
+    reports = ReportPolicy(rate=0.001, burst=1, global_rate=1, global_burst=1)
+    now = [time.monotonic() + 1]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    assert reports.admit("storm")
+    # refused by the process wide bucket, emptied by the storm
+    assert not any(reports.admit("rare") for _ in range(5))
+
+    now[0] += 1
+    assert reports.admit("rare")
+    reports.flush()
+
+
+def test_sampling_starts_after_sample_after(monkeypatch):
+    reports = ReportPolicy(burst=100, global_burst=100, sample_after=3, sample_rate=0.5)
+    draws = iter([0.4, 0.6, 0.49, 0.9])
+    monkeypatch.setattr(random, "random", lambda: next(draws))
+
+    assert [reports.admit("fp") for _ in range(7)] == [True] * 3 + [True, False, True, False]
+    assert reports.flush() == 2
+
+
+def test_fingerprint_bucket_refills(monkeypatch):
+    reports = ReportPolicy(rate=2, burst=2, global_burst=100)
+    now = [time.monotonic() + 1]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    assert [reports.admit("fp") for _ in range(3)] == [True, True, False]
+    now[0] += 0.5
+    assert [reports.admit("fp") for _ in range(2)] == [True, False]
+    # never more than a burst, however long it was idle
+    now[0] += 60
+    assert [reports.admit("fp") for _ in range(3)] == [True, True, False]
+    assert reports.admit("other")
+
+
+def test_summary_covers_the_time_since_the_last_one(monkeypatch, caplog):
+    reports = ReportPolicy(rate=0.001, burst=1, summary_interval=3600)
+    now = [time.monotonic() + 1]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    reports.flush()
+
+    reports.admit("fp")
+    reports.admit("fp")
+    now[0] += 7.5
+    with caplog.at_level(logging.WARNING, logger="bug_buddy.policy"):
+        assert reports.flush() == 1
+
+    assert caplog.messages == ["Suppressed 1 occurrences of 1 failures in the last 7.5s"]
+
+
+def test_suppressed_repeats_are_counted_in_the_index(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    listener = Listener(policy=ReportPolicy(rate=0.001, burst=1, summary_interval=3600))
+    try:
+        raise ValueError("storm")
+    except ValueError as e:
+        tb = walk(e.__traceback__)
+
+    assert listener.admit(tb, ValueError, "f")
+    listener.record(tb, ValueError, "f")
+    assert not any(listener.admit(tb, ValueError, "f") for _ in range(4))
+
+    fp = fingerprint(ValueError, listener.filter_tb(tb))
+    assert listener.index.get(fp, "local").count == 5
+    listener.policy.flush()
@@ -0,0 +1,121 @@
+"""pytest plugin reporting the failures of a test session."""
+
+import importlib.metadata
+import json
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+CONFTEST = """
+from bug_buddy import GithubIntegration
+from bug_buddy.listener import Listener
+
+BATCHES = []
+
+
+class Recording(GithubIntegration):
+    def get_client(self, logger):
+        return None
+
+    def create_issue(self, client, description, labels, func_name, title=None, **kwargs):
+        return Listener._local_issue(title, description, labels, state="open")
+
+    def create_issues(self, client, batch, max_workers=None):
+        BATCHES.append([draft.func_name for draft in batch])
+        return super().create_issues(client, batch, max_workers)
+
+
+def pytest_bug_buddy_integration(config):
+    return Recording(repo="o/r")
+
+
+def pytest_unconfigure(config):
+    with open("batches.json", "w") as f:
+        f.write(__import__("json").dumps(BATCHES))
+"""
+
+TESTS = """
+import pytest
+
+def check(value):
+    assert value == 1, "not one"
+
+@pytest.mark.parametrize("value", [2, 3])
+def test_first(value):
+    check(value)
+
+def test_other():
+    raise KeyError("other")
+
+def test_passes():
+    check(1)
+"""
+
+
+@pytest.fixture
+def suite(pytester, monkeypatch):
+    """Test directory with three failures of two kinds, reported to a recording integration."""
+
+    monkeypatch.setenv("HOME", str(pytester.path))
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_suite=TESTS)
+    return pytester
+
+
+def _plugin() -> tuple[str, ...]:
+    # the entry point loads the plugin when the package is installed with its metadata
+    installed = any(
+        ep.value == "bug_buddy.pytest_plugin"
+        for ep in importlib.metadata.entry_points(group="pytest11")
+    )
+    return () if installed else ("-p", "bug_buddy.pytest_plugin")
+
+
+def _run(pytester, *args):
+    return pytester.runpytest_subprocess(*_plugin(), *args)
+
+
+def _batches(pytester):
+    return json.loads((pytester.path / "batches.json").read_text())
+
+
+def test_disabled_by_default(suite):
+    result = _run(suite)
+
+    result.assert_outcomes(passed=1, failed=3)
+    result.stdout.no_fnmatch_line("*bug-buddy*")
+    assert _batches(suite) == []
+
+
+@pytest.mark.parametrize("opt_in", ["option", "ini"])
+def test_unique_failures_are_reported_in_one_batch(suite, opt_in):
+    if opt_in == "ini":
+        suite.makeini("[pytest]\nbug_buddy = true\n")
+    result = _run(suite, *(["--bug-buddy"] if opt_in == "option" else []))
+
+    result.assert_outcomes(passed=1, failed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "*bug-buddy*",
+            "3 failures, 2 unique, 2 reported",
+            "  *-test_first?2?-*: open 0",
+            "  *-test_other-*: open 0",
+        ]
+    )
+    assert _batches(suite) == [["test_first[2]", "test_other"]]
+
+
+def test_rendered_failure_survives_report_serialization(suite):
+    recorder = suite.inline_run(*_plugin(), "--bug-buddy")
+    report = next(r for r in recorder.getreports("pytest_runtest_logreport") if r.failed)
+    config = suite.parseconfigure()
+
+    data = config.hook.pytest_report_to_serializable(config=config, report=report)
+    restored = config.hook.pytest_report_from_serializable(
+        config=config, data=json.loads(json.dumps(data))
+    )
+
+    assert restored.bug_buddy == report.bug_buddy
+    assert restored.bug_buddy["labels"] == ["AssertionError"]
+    assert "not one" in restored.bug_buddy["description"]
@@ -0,0 +1,93 @@
+"""Bounded issue description rendering."""
+
+import sys
+
+import pytest
+from bug_buddy._frames import Frame, walk
+from bug_buddy._render import DescriptionRenderer
+
+
+def _recurse(depth: int) -> None:
+    if depth:
+        _recurse(depth - 1)
+    raise RecursionError("x" * 5000)
+
+
+def _deep_failure(depth: int = 1000) -> BaseException:
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, depth + 200))
+    try:
+        _recurse(depth)
+    except RecursionError as e:
+        return e
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+@pytest.mark.parametrize("max_bytes", [65536, 4096, 512])
+def test_deep_recursion_fits_the_budget(max_bytes):
+    exc = _deep_failure()
+    out = DescriptionRenderer(max_bytes=max_bytes).render(
+        walk(exc.__traceback__), "_recurse", "def _recurse(depth):\n    ...", exc=exc
+    )
+
+    assert len(out.encode()) <= max_bytes
+    if max_bytes < 8192:
+        assert out.endswith(f"_Description truncated to {max_bytes} bytes._")
+        assert out.count("```") % 2 == 0
+
+
+def test_repeated_frames_are_collapsed():
+    exc = _deep_failure()
+    out = DescriptionRenderer().render(walk(exc.__traceback__), "_recurse", exc=exc)
+
+    assert "_[Previous line repeated 999 more times]_" in out
+    assert "  [Previous line repeated 997 more times]\n" in out
+    assert out.count("in _recurse\n    _recurse(depth - 1)") == 3
+
+
+def test_long_tracebacks_keep_head_and_tail():
+    frames = [Frame("app.py", lineno, f"f{lineno}", {}) for lineno in range(1, 101)]
+    out = DescriptionRenderer(head_frames=2, tail_frames=3).render(frames, "f1")
+
+    assert "| ... | | | _95 frames omitted_ |" in out
+    assert "  [... 95 frames omitted ...]\n" in out
+    assert [f"f{n}" for n in (1, 2, 98, 99, 100)] == [
+        name for name in (f"f{n}" for n in range(1, 101)) if f"in {name}\n" in out
+    ]
+
+
+def test_long_source_is_cut():
+    source = "\n".join(f"x{n} = {n}" for n in range(100))
+    out = DescriptionRenderer(max_source_lines=10).render([], "f", source)
+
+    assert "x9 = 9\n# ... 90 more lines\n```" in out
+    assert "x10 = 10" not in out
+
+
+def _chained(suppress: bool) -> BaseException:
+    try:
+        try:
+            {}["missing"]
+        except KeyError as e:
+            if suppress:
+                raise ValueError("explicit") from e
+            raise ValueError("implicit")
+    except ValueError as e:
+        return e
+
+
+@pytest.mark.parametrize(
+    "suppress, message",
+    [
+        (True, "The above exception was the direct cause of the following exception:"),
+        (False, "During handling of the above exception, another exception occurred:"),
+    ],
+)
+def test_chained_exceptions_are_rendered_oldest_first(suppress, message):
+    exc = _chained(suppress)
+    out = DescriptionRenderer().render(walk(exc.__traceback__), "_chained", exc=exc)
+    raw = out.split("### Raw traceback", 1)[1]
+
+    assert raw.index("KeyError: 'missing'") < raw.index(message) < raw.index("ValueError: ")
+    assert raw.count("Traceback (most recent call last):") == 2
@@ -0,0 +1,103 @@
+"""Background reporting queue."""
+
+import subprocess
+import sys
+import threading
+
+import pytest
+from bug_buddy.reporter import BackgroundReporter
+
+
+def _blocked(reporter: BackgroundReporter) -> threading.Event:
+    """Keep the worker busy until the returned event is set, so reports stay queued."""
+
+    started, gate = threading.Event(), threading.Event()
+    reporter.submit(lambda: started.set() or gate.wait())
+    started.wait()
+    return gate
+
+
+def _submit(reporter: BackgroundReporter, names, done: list, dropped: list) -> list[bool]:
+    return [
+        reporter.submit(
+            lambda name=name: done.append(name), on_drop=lambda name=name: dropped.append(name)
+        )
+        for name in names
+    ]
+
+
+@pytest.mark.parametrize(
+    "overflow, queued, survivors, lost",
+    [
+        ("drop-oldest", [True, True, True], ["b", "c"], ["a"]),
+        ("drop-new", [True, True, False], ["a", "b"], ["c"]),
+    ],
+)
+def test_overflow(overflow, queued, survivors, lost):
+    reporter = BackgroundReporter(maxsize=2, overflow=overflow)
+    done, dropped = [], []
+    gate = _blocked(reporter)
+
+    assert _submit(reporter, "abc", done, dropped) == queued
+    assert reporter.metrics()["depth"] == 2
+    gate.set()
+    assert reporter.flush(timeout=5)
+
+    assert done == survivors and dropped == lost
+    # the report keeping the worker busy counts too
+    assert reporter.metrics() == {
+        "depth": 0,
+        "submitted": 1 + sum(queued),
+        "reported": 1 + len(survivors),
+        "failed": 0,
+        "dropped": 1,
+    }
+
+
+def test_block_waits_for_room():
+    reporter = BackgroundReporter(maxsize=1, overflow="block", block_timeout=0.05)
+    done, dropped = [], []
+    gate = _blocked(reporter)
+
+    assert _submit(reporter, "ab", done, dropped) == [True, False]
+    threading.Timer(0.05, gate.set).start()
+    reporter.block_timeout = None
+    assert _submit(reporter, "c", done, dropped) == [True]
+    assert reporter.flush(timeout=5)
+
+    assert done == ["a", "c"] and dropped == ["b"]
+    assert reporter.metrics()["dropped"] == 1 and reporter.metrics()["submitted"] == 3
+
+
+def test_failed_report_runs_its_drop_callback():
+    reporter = BackgroundReporter()
+    dropped = []
+
+    reporter.submit(lambda: 1 / 0, on_drop=lambda: dropped.append(True))
+    assert reporter.flush(timeout=5)
+
+    assert dropped == [True]
+    assert reporter.metrics()["failed"] == 1 and reporter.metrics()["reported"] == 0
+
+
+def test_flush_gives_up_after_timeout():
+    reporter = BackgroundReporter()
+    gate = _blocked(reporter)
+
+    assert not reporter.flush(timeout=0.05)
+    gate.set()
+    assert reporter.flush(timeout=5)
+
+
+def test_queued_reports_are_flushed_at_exit(tmp_path):
+    done = tmp_path / "done"
+    code = f"""
+import time
+from bug_buddy.reporter import BackgroundReporter
+
+reporter = BackgroundReporter()
+reporter.submit(lambda: time.sleep(0.2) or open({str(done)!r}, "w").close())
+"""
+    subprocess.run([sys.executable, "-c", code], check=True, timeout=30)
+
+    assert done.exists()
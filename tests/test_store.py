@@ -0,0 +1,93 @@
+"""SQLite issue store and `bug-buddy query`."""
+
+import json
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from bug_buddy.cli import main
+from bug_buddy.store import SqliteIssueStore
+
+THREADS = 8
+RECORDS = 50
+
+
+def _record(n: int, func_name: str = "fail", labels=("ValueError",), **fields) -> dict:
+    return {
+        "id": n,
+        "title": f"BugBuddy-{func_name}-{n}",
+        "state": "local",
+        "project_id": 0,
+        "created_at": datetime.now().isoformat(),
+        "func_name": func_name,
+        "labels": labels if isinstance(labels, str) else list(labels),
+        **fields,
+    }
+
+
+@pytest.fixture
+def store(tmp_path) -> SqliteIssueStore:
+    return SqliteIssueStore(path=str(tmp_path / "store.db"))
+
+
+def test_concurrent_appends_through_two_instances(store):
+    stores = [store, SqliteIssueStore(path=store.path)]
+
+    def append(t):
+        for n in range(RECORDS):
+            stores[t % 2].append(_record(t * RECORDS + n, labels=["ValueError", f"thread-{t}"]))
+
+    threads = [threading.Thread(target=append, args=(t,)) for t in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    ids = sorted(r["id"] for r in store.iter_records())
+    assert ids == list(range(THREADS * RECORDS))
+    assert store.count_by_label()["ValueError"] == THREADS * RECORDS
+
+
+def test_query_by_function_since(store):
+    old = (datetime.now() - timedelta(days=3)).isoformat()
+    store.append(_record(1, created_at=old))
+    store.append(_record(2))
+    store.append(_record(3, func_name="other"))
+
+    assert [r["id"] for r in store.query(func_name="fail", since="24h")] == [2]
+    assert [r["id"] for r in store.query(func_name="fail", since="7d")] == [1, 2]
+    assert [r["id"] for r in store.query(since=old, limit=1)] == [1]
+
+
+def test_count_by_label(store):
+    store.append(_record(1, labels=["ValueError", "BugBuddy"]))
+    store.append(_record(2, labels=["KeyError", "BugBuddy"]))
+    # legacy records hold one label string
+    store.append(_record(3, labels="ValueError"))
+
+    assert store.count_by_label() == {"ValueError": 2, "BugBuddy": 2, "KeyError": 1}
+    assert list(store.count_by_label())[0] in ("ValueError", "BugBuddy")
+    assert store.count_by_label(since="1h") == store.count_by_label()
+
+
+def test_query_by_commit_sha_is_indexed(store):
+    for n in range(10):
+        store.append(_record(n, commit_sha=f"sha{n % 3}"))
+
+    assert [r["id"] for r in store.query(commit_sha="sha1")] == [1, 4, 7]
+    plan = " ".join(
+        row[-1]
+        for row in store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT record FROM issues WHERE commit_sha = ?", ("sha1",)
+        )
+    )
+    assert "idx_issues_commit_sha" in plan
+
+
+def test_cli_count_by_label(store, capsys):
+    store.append(_record(1, labels=["ValueError"]))
+    store.append(_record(2, labels=["ValueError", "KeyError"]))
+
+    assert main(["query", "--db", store.path, "--count-by-label"]) == 0
+
+    assert json.loads(capsys.readouterr().out) == {"ValueError": 2, "KeyError": 1}
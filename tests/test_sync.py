@@ -0,0 +1,169 @@
+"""Incremental sync of the local cache with the issue tracker."""
+
+import dataclasses
+import glob
+import os
+
+import pytest
+from bug_buddy import GithubIntegration
+from bug_buddy.cache import CacheBackend, JsonlCacheBackend
+from bug_buddy.issue import Issue
+from bug_buddy.listener import Listener
+from bug_buddy.sync import IssueSync
+
+
+@dataclasses.dataclass
+class _Tracker(GithubIntegration):
+    """Integration keeping its issues in memory, recording the calls sync makes."""
+
+    issues: dict = dataclasses.field(default_factory=dict)
+    since: list = dataclasses.field(default_factory=list)
+    creates: list = dataclasses.field(default_factory=list)
+
+    def put(self, remote_id: str, title: str, state: str, updated_at: str) -> None:
+        self.issues[remote_id] = Issue._unchecked(
+            id=int(remote_id),
+            title=title,
+            state=state,
+            project_id="o/r",
+            author=("bug-buddy", "", "active"),
+            created_at="2026-01-01T00:00:00Z",
+            updated_at=updated_at,
+            description="",
+            labels=["ValueError"],
+            remote_id=remote_id,
+        )
+
+    def get_client(self, logger):
+        return None
+
+    def create_issue(self, client, description, labels, func_name, title=None, **kwargs):
+        self.creates.append(title)
+        self.put(str(len(self.issues) + 1), title, "open", "2026-01-03T00:00:00Z")
+        return self.issues[str(len(self.issues))]
+
+    def find_issue(self, client, title):
+        return next((issue for issue in self.issues.values() if issue.title == title), None)
+
+    def updated_issues(self, client, since=None):
+        self.since.append(since)
+        return iter(
+            sorted(
+                (
+                    issue
+                    for issue in self.issues.values()
+                    if since is None or issue.updated_at > since
+                ),
+                key=lambda issue: issue.updated_at,
+            )
+        )
+
+
+@pytest.fixture
+def synced(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    tracker = _Tracker(repo="o/r")
+    listener = Listener(integration=tracker, index=None)
+    return tracker, listener, IssueSync(listener)
+
+
+def _states(listener: Listener) -> list[tuple]:
+    return [(r["remote_id"], r["state"]) for r in listener.cache.iter_records()]
+
+
+def test_pull_asks_only_for_updates_since_the_last_sync(synced):
+    tracker, listener, sync = synced
+    tracker.put("1", "BugBuddy-f-1", "open", "2026-01-01T00:00:00Z")
+    tracker.put("2", "BugBuddy-g-2", "open", "2026-01-02T00:00:00Z")
+    for issue in tracker.issues.values():
+        listener.cache.append(issue._clean())
+
+    assert sync.pull() == (2, 2)
+    tracker.put("1", "BugBuddy-f-1", "closed", "2026-01-05T00:00:00Z")
+    assert sync.pull() == (1, 1)
+    assert sync.pull() == (0, 0)
+
+    assert tracker.since == [None, "2026-01-02T00:00:00Z", "2026-01-05T00:00:00Z"]
+    assert sync.cursor() == "2026-01-05T00:00:00Z"
+    # updated in place, not appended
+    assert _states(listener) == [("1", "closed"), ("2", "open")]
+
+
+def test_push_finds_issues_created_by_an_interrupted_push(synced):
+    tracker, listener, sync = synced
+    found = listener._local_issue("BugBuddy-f-1", "", ["ValueError"])
+    missing = listener._local_issue("BugBuddy-g-2", "", ["ValueError"])
+    listener.cache.append(found._clean())
+    listener.cache.append(missing._clean())
+    tracker.put("1", found.title, "open", "2026-01-01T00:00:00Z")
+
+    assert sync.push() == (2, 0)
+
+    assert tracker.creates == ["BugBuddy-g-2"]
+    assert [(r["title"], r["remote_id"]) for r in listener.cache.iter_records()] == [
+        ("BugBuddy-f-1", "1"),
+        ("BugBuddy-g-2", "2"),
+    ]
+    assert sync.push() == (0, 0)
+
+
+def test_update_merges_records_in_the_cache_and_its_segments(tmp_path):
+    backend = JsonlCacheBackend(path=str(tmp_path / "cache"), max_bytes=None)
+    for n in range(3):
+        backend.append({"project_id": "p", "remote_id": str(n), "state": "open", "n": n})
+    backend.rotate()
+    backend.append({"project_id": "p", "remote_id": "3", "state": "open", "n": 3})
+
+    updated = backend.update(
+        [
+            {"project_id": "p", "remote_id": "1", "state": "closed"},
+            {"project_id": "p", "remote_id": "3", "state": "closed"},
+            {"project_id": "p", "remote_id": "9", "state": "closed"},
+            {"remote_id": "0", "state": "closed"},
+        ]
+    )
+
+    assert updated == 2
+    assert [(r["remote_id"], r["state"], r["n"]) for r in backend.iter_records()] == [
+        ("0", "open", 0),
+        ("1", "closed", 1),
+        ("2", "open", 2),
+        ("3", "closed", 3),
+    ]
+
+
+def test_update_leaves_files_without_the_issues_alone(tmp_path):
+    backend = JsonlCacheBackend(path=str(tmp_path / "cache"), max_bytes=None)
+    for n in range(4):
+        backend.append({"project_id": "p", "remote_id": str(n), "state": "open"})
+        backend.rotate()
+    backend.append({"project_id": "p", "remote_id": "4", "state": "open"})
+    files = [backend.path, *glob.glob(backend.path + ".*.seg*")]
+    inodes = {name: os.stat(name).st_ino for name in files}
+
+    assert backend.update([]) == 0
+    assert backend.update([{"project_id": "p", "remote_id": "2", "state": "closed"}]) == 1
+
+    rewritten = [name for name in files if os.stat(name).st_ino != inodes[name]]
+    assert len(rewritten) == 1 and rewritten[0] != backend.path
+    assert [r["state"] for r in backend.iter_records()] == ["open"] * 2 + ["closed"] + ["open"] * 2
+
+
+class _AppendOnly(CacheBackend):
+    def __init__(self):
+        self.records = []
+
+    def append(self, record):
+        self.records.append(dict(record))
+
+    def iter_records(self):
+        return iter(self.records)
+
+
+def test_pull_appends_to_caches_without_updates(synced):
+    tracker, listener, sync = synced
+    listener.cache = _AppendOnly()
+    tracker.put("1", "BugBuddy-f-1", "closed", "2026-01-01T00:00:00Z")
+
+    assert sync.pull() == (1, 0)
+    assert _states(listener) == [("1", "closed")]